@@ -0,0 +1,182 @@
+import json
+import os
+import sys
+import threading
+import timeit
+from pathlib import Path
+from typing import Callable, List
+
+from ps.di import DI, Lifetime
+
+TOLERANCE_ENV_VAR = "PS_DI_BENCHMARK_TOLERANCE"
+BASELINE_PATH = Path(__file__).with_name("di_benchmarks_baseline.json")
+
+SPAWN_PARAM_COUNTS = (1, 4, 8)
+SCOPE_CHAIN_DEPTH = 16
+RESOLVE_MANY_COUNT = 100
+CONTENDED_THREADS = 8
+REGISTER_BATCH = 100
+DEFAULT_NUMBER = 1000
+
+
+class Service:
+    pass
+
+
+class Transient:
+    pass
+
+
+def _dependency_types(count: int) -> List[type]:
+    return [type(f"Dependency{index}", (), {}) for index in range(count)]
+
+
+def _consumer_type(dependencies: List[type]) -> type:
+    params = ", ".join(f"d{index}: {dependency.__name__}" for index, dependency in enumerate(dependencies))
+    namespace = {dependency.__name__: dependency for dependency in dependencies}
+    exec(f"class Consumer:\n    def __init__(self, {params}) -> None:\n        pass\n", namespace)  # noqa: S102
+    return namespace["Consumer"]
+
+
+def _populated_di() -> DI:
+    di = DI()
+    di.register(Service).factory(Service)
+    di.register(Transient, Lifetime.TRANSIENT).factory(Transient)
+    di.resolve(Service)
+    return di
+
+
+def bench_register(number: int) -> Callable[[], object]:
+    types = _dependency_types(REGISTER_BATCH)
+
+    def run() -> None:
+        for start in range(0, number, REGISTER_BATCH):
+            di = DI()
+            for cls in types[:number - start]:
+                di.register(cls).factory(cls)
+
+    return run
+
+
+def bench_resolve_type(number: int) -> Callable[[], object]:
+    di = _populated_di()
+    return lambda: [di.resolve(Service) for _ in range(number)]
+
+
+def bench_resolve_name(number: int) -> Callable[[], object]:
+    di = _populated_di()
+    return lambda: [di.resolve("Service") for _ in range(number)]
+
+
+def bench_resolve_transient(number: int) -> Callable[[], object]:
+    di = _populated_di()
+    return lambda: [di.resolve(Transient) for _ in range(number)]
+
+
+def _bench_spawn(param_count: int) -> Callable[[int], Callable[[], object]]:
+    def bench(number: int) -> Callable[[], object]:
+        di = DI()
+        dependencies = _dependency_types(param_count)
+        for dependency in dependencies:
+            di.register(dependency).factory(dependency)
+        consumer = _consumer_type(dependencies)
+        return lambda: [di.spawn(consumer) for _ in range(number)]
+
+    return bench
+
+
+def bench_satisfy(number: int) -> Callable[[], object]:
+    di = _populated_di()
+
+    def handler(service: Service, transient: Transient, label: str = "x") -> tuple:
+        return service, transient, label
+
+    return lambda: [di.satisfy(handler)() for _ in range(number)]
+
+
+def bench_scope_chain(number: int) -> Callable[[], object]:
+    scope = _populated_di()
+    for _ in range(SCOPE_CHAIN_DEPTH):
+        scope = scope.scope()
+    return lambda: [scope.resolve(Service) for _ in range(number)]
+
+
+def bench_resolve_many(number: int) -> Callable[[], object]:
+    di = DI()
+    for _ in range(RESOLVE_MANY_COUNT):
+        di.register(Service).factory(Service)
+    return lambda: [di.resolve_many(Service) for _ in range(number)]
+
+
+def bench_contended_resolve(number: int) -> Callable[[], object]:
+    di = _populated_di()
+    per_thread = max(1, number // CONTENDED_THREADS)
+
+    def worker() -> None:
+        for _ in range(per_thread):
+            di.resolve(Service)
+            di.resolve(Transient)
+
+    def run() -> None:
+        threads = [threading.Thread(target=worker) for _ in range(CONTENDED_THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    return run
+
+
+BENCHMARKS: dict[str, Callable[[int], Callable[[], object]]] = {
+    "register": bench_register,
+    "resolve_type": bench_resolve_type,
+    "resolve_name": bench_resolve_name,
+    "resolve_transient": bench_resolve_transient,
+    **{f"spawn_{count}_params": _bench_spawn(count) for count in SPAWN_PARAM_COUNTS},
+    "satisfy": bench_satisfy,
+    f"scope_chain_{SCOPE_CHAIN_DEPTH}": bench_scope_chain,
+    f"resolve_many_{RESOLVE_MANY_COUNT}": bench_resolve_many,
+    "contended_resolve": bench_contended_resolve,
+}
+
+
+def measure(name: str, number: int = DEFAULT_NUMBER, repeat: int = 5) -> float:
+    # Returns the best per-operation time in microseconds.
+    run = BENCHMARKS[name](number)
+    return min(timeit.repeat(run, number=1, repeat=repeat)) / number * 1_000_000
+
+
+def load_baseline() -> tuple[int, dict[str, float]]:
+    if not BASELINE_PATH.exists():
+        return DEFAULT_NUMBER, {}
+    data = json.loads(BASELINE_PATH.read_text())
+    return data["number"], data["results"]
+
+
+def save_baseline(number: int, results: dict[str, float]) -> None:
+    data = {"number": number, "results": {name: round(value, 3) for name, value in results.items()}}
+    BASELINE_PATH.write_text(json.dumps(data, indent=2) + "\n")
+
+
+def tolerance() -> float:
+    return float(os.environ.get(TOLERANCE_ENV_VAR, "3"))
+
+
+if __name__ == "__main__":
+    number, baseline = load_baseline()
+    if "--save" in sys.argv[1:]:
+        number = DEFAULT_NUMBER
+    factor = tolerance()
+    results: dict[str, float] = {}
+    for name in BENCHMARKS:
+        results[name] = cost = measure(name, number=number)
+        reference = baseline.get(name)
+        if reference is None:
+            print(f"{cost:>10.2f} us  {'-':>10}        new   {name}")
+            continue
+        status = "ok" if cost <= reference * factor else "SLOWER"
+        print(f"{cost:>10.2f} us  {reference:>10.2f} us  {cost / reference:>5.2f}x {status:<6} {name}")
+
+    if "--save" in sys.argv[1:]:
+        save_baseline(number, results)
+        print(f"Baseline saved to {BASELINE_PATH}")
@@ -1,4 +1,29 @@
 # ruff: noqa F401
+import os
+import subprocess
+import sys
+
+BUDGET_FACTOR_ENV_VAR = "PS_IMPORT_BUDGET_FACTOR"
+
+# Cold import budgets in milliseconds, roughly 2-3x the cost measured on a developer machine.
+IMPORT_BUDGETS_MS: dict[str, float] = {
+    "ps.di": 150,
+    "ps.version": 150,
+    "ps.token_expressions": 150,
+    "ps.plugin.sdk": 50,
+    "ps.plugin.sdk.events": 450,
+    "ps.plugin.sdk.logging": 200,
+    "ps.plugin.sdk.mixins": 150,
+    "ps.plugin.sdk.project": 900,
+    "ps.plugin.sdk.settings": 650,
+    "ps.plugin.sdk.setup_extension_template": 150,
+    "ps.plugin.sdk.toml": 650,
+    "ps.plugin.module.check": 2000,
+    "ps.plugin.module.delivery": 2000,
+    "ps.plugin.core": 1500,
+}
+
+
 def import1():
     import ps
     print(ps)
@@ -12,5 +37,45 @@ def import2():
     print(ps.plugin.core)
 
 
-import1()
-import2()
+def parse_importtime(stderr: str) -> float:
+    # Top-level entries (no indentation in the name column) are the imports triggered
+    # directly by the probe; their cumulative times add up to the cost of the statement.
+    total_us = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2]
+        if name.startswith(" ") and not name.startswith("  "):
+            total_us += int(parts[1])
+    return total_us / 1000
+
+
+def measure_import(module: str, runs: int = 3) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        best = min(best, parse_importtime(result.stderr))
+    return best
+
+
+def budget_factor() -> float:
+    return float(os.environ.get(BUDGET_FACTOR_ENV_VAR, "1"))
+
+
+if __name__ == "__main__":
+    import1()
+    import2()
+
+    factor = budget_factor()
+    for module, budget in IMPORT_BUDGETS_MS.items():
+        cost = measure_import(module)
+        status = "ok" if cost <= budget * factor else "OVER"
+        print(f"{cost:>9.1f} ms / {budget * factor:>7.1f} ms  {status:<4}  {module}")
@@ -0,0 +1,16 @@
+import pytest
+
+from experiments.exp_di_benchmarks import BENCHMARKS, load_baseline, measure, tolerance
+
+
+def test_baseline_covers_all_benchmarks():
+    _, baseline = load_baseline()
+    assert set(baseline) == set(BENCHMARKS)
+
+
+@pytest.mark.parametrize("name", list(BENCHMARKS))
+def test_benchmark_within_baseline(name):
+    number, baseline = load_baseline()
+    reference = baseline[name] * tolerance()
+    cost = measure(name, number=number)
+    assert cost <= reference, f"{name} took {cost:.2f} us per operation, baseline allows {reference:.2f} us"
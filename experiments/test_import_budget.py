@@ -0,0 +1,25 @@
+import pytest
+
+from experiments.exp_imports import IMPORT_BUDGETS_MS, budget_factor, measure_import, parse_importtime
+
+
+def test_parse_importtime_sums_top_level_entries():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       100 |        100 |   typing\n"
+        "import time:       200 |       1300 | ps\n"
+        "import time:       400 |        400 |   ps.di._lifetime\n"
+        "import time:       500 |       2500 | ps.di\n"
+    )
+    assert parse_importtime(stderr) == pytest.approx(3.8)
+
+
+def test_parse_importtime_ignores_unrelated_output():
+    assert parse_importtime("warning: something\n") == 0
+
+
+@pytest.mark.parametrize("module", list(IMPORT_BUDGETS_MS))
+def test_import_within_budget(module):
+    budget = IMPORT_BUDGETS_MS[module] * budget_factor()
+    cost = measure_import(module)
+    assert cost <= budget, f"import {module} took {cost:.1f} ms, budget is {budget:.1f} ms"
@@ -1,10 +1,21 @@
 from ._enums import Lifetime, Priority
+from ._bound import BoundCallable
+from ._context import ContextExecutor, current_scope, use_scope
 from ._di import Binding, DI, REQUIRED
+from ._lazy import Lazy, Provider
+from ._metrics import ResolutionMetrics
 
 __all__ = [
     "DI",
     "Binding",
+    "BoundCallable",
+    "ContextExecutor",
+    "Lazy",
     "Lifetime",
     "Priority",
+    "Provider",
     "REQUIRED",
+    "ResolutionMetrics",
+    "current_scope",
+    "use_scope",
 ]
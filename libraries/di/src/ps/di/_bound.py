@@ -0,0 +1,65 @@
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from ._plan import _ParameterPlan
+
+if TYPE_CHECKING:
+    from ._di import DI
+
+
+class BoundCallable[R]:
+    __slots__ = ("_bound_names", "_di", "_explicit", "_fn", "_plan")
+
+    def __init__(self, di: "DI", fn: Callable[..., R], explicit: dict[str, Any], bound_names: frozenset[str]) -> None:
+        self._di = di
+        self._fn = fn
+        self._explicit = explicit
+        self._bound_names = bound_names
+        self._plan: Optional[tuple[_ParameterPlan, ...]] = None
+        self._get_plan()
+
+    @property
+    def fn(self) -> Callable[..., R]:
+        return self._fn
+
+    @property
+    def dependencies(self) -> dict[str, Any]:
+        dependencies: dict[str, Any] = {}
+        for param in self._get_plan():
+            if param.name in self._bound_names:
+                continue
+            target = param.target
+            while isinstance(target, _ParameterPlan):
+                target = target.target
+            dependencies[param.name] = target
+        return dependencies
+
+    def __call__(self, *args: Any, **kwargs: Any) -> R:
+        return self.call_in(self._di, *args, **kwargs)
+
+    def call_in(self, scope: "DI", *args: Any, **kwargs: Any) -> R:
+        call_kwargs: dict[str, Any] = {}
+        for param in self._get_plan()[len(args):]:
+            name = param.name
+            if name in kwargs:
+                continue
+            if name in self._bound_names:
+                if name in self._explicit:
+                    call_kwargs[name] = self._explicit[name]
+                continue
+            found, value = scope._resolve_parameter(param)
+            if found:
+                call_kwargs[name] = value
+        if kwargs:
+            call_kwargs.update(kwargs)
+        return self._fn(*args, **call_kwargs)
+
+    def _get_plan(self) -> tuple[_ParameterPlan, ...]:
+        plan = self._plan
+        if plan is None:
+            plan = self._di._get_plan(self._fn, skip_self=False)
+            if (self._fn, False) in self._di._plan_cache:
+                self._plan = plan
+        return plan
+
+    def __repr__(self) -> str:
+        return f"BoundCallable({getattr(self._fn, '__qualname__', self._fn)!r})"
@@ -0,0 +1,49 @@
+import inspect
+from typing import Any, Callable, NoReturn, Optional
+
+from ._plan import _ParameterPlan, _Strategy
+
+_UNSUPPORTED_KINDS = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+
+
+def _missing(param: _ParameterPlan) -> NoReturn:
+    raise ValueError(f"Cannot resolve required dependency {param.target} for parameter {param.name}")
+
+
+def _generate_factory(cls: type, signature: inspect.Signature, plan: tuple[_ParameterPlan, ...]) -> Optional[Callable[[Any], Any]]:
+    params = list(signature.parameters.values())[1:]
+    if len(params) != len(plan):
+        return None
+
+    namespace: dict[str, Any] = {"cls": cls, "missing": _missing}
+    lines = ["def factory(scope):", "    resolve = scope.resolve"]
+    positional: list[str] = []
+    keyword: list[str] = []
+    for index, (param, step) in enumerate(zip(params, plan, strict=True)):
+        if param.kind in _UNSUPPORTED_KINDS or (step.strategy is _Strategy.NAME and not step.has_default):
+            return None
+        var = f"a{index}"
+        namespace[f"p{index}"] = step
+        namespace[f"t{index}"] = step.target
+        strategy = step.strategy
+        if strategy is _Strategy.TYPE or strategy is _Strategy.OPTIONAL:
+            lines.append(f"    {var} = resolve(t{index})")
+            if step.has_default:
+                lines.append(f"    if {var} is None:\n        {var} = p{index}.default")
+            elif strategy is _Strategy.TYPE:
+                lines.append(f"    if {var} is None:\n        missing(p{index})")
+        elif strategy is _Strategy.CONTAINER:
+            var = "scope"
+        elif strategy is _Strategy.MANY and step.target is not None:
+            lines.append(f"    {var} = scope.resolve_many(t{index})")
+        else:
+            lines.append(f"    {var} = scope._resolve_parameter(p{index})[1]")
+        if param.kind is inspect.Parameter.KEYWORD_ONLY:
+            keyword.append(f"{param.name}={var}")
+        else:
+            positional.append(var)
+    lines.append(f"    return cls({', '.join(positional + keyword)})")
+
+    code = compile("\n".join(lines), f"<ps.di factory for {cls.__qualname__}>", "exec")
+    exec(code, namespace)  # noqa: S102
+    return namespace["factory"]
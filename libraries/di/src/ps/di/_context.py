@@ -0,0 +1,35 @@
+import contextvars
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, TypeVar
+
+if TYPE_CHECKING:
+    from ._di import DI
+
+R = TypeVar("R")
+
+_current_scope: contextvars.ContextVar[Optional["DI"]] = contextvars.ContextVar("ps_di_current_scope", default=None)
+
+
+def current_scope() -> Optional["DI"]:
+    return _current_scope.get()
+
+
+@contextmanager
+def use_scope(scope: "DI") -> Iterator["DI"]:
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+
+
+class ContextExecutor(Executor):
+    def __init__(self, executor: Executor) -> None:
+        self._executor = executor
+
+    def submit(self, fn: Callable[..., R], /, *args: Any, **kwargs: Any) -> Future[R]:
+        return self._executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
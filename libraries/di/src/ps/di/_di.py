@@ -1,9 +1,19 @@
+import asyncio
 import inspect
 import threading
-from typing import Any, Callable, List, Optional, Self, Type, TypeVar, Union, cast, get_args, get_origin, get_type_hints
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, Self, Type, TypeVar, cast
 
+from ._bound import BoundCallable
+from ._codegen import _generate_factory
+from ._disposal import _dispose, _dispose_async
 from ._enums import Lifetime, Priority
+from ._lazy import Lazy, Provider
+from ._metrics import ResolutionMetrics, Tracer
+from ._plan import _compile_plan, _normalize_name, _ParameterPlan, _Strategy
 from ._registration import _Registration, _Registrations
+from ._validation import _validate
 
 T = TypeVar("T")
 R = TypeVar("R")
@@ -17,6 +27,10 @@ class _Sentinel:
 REQUIRED: _Sentinel = _Sentinel()
 
 
+_EMPTY: dict = {}
+_MISSING = object()
+
+
 class Binding[T]:
     def __init__(self, di: "DI", cls: Type[T], lifetime: Lifetime, priority: Priority) -> None:
         self._di = di
@@ -25,54 +39,103 @@ class Binding[T]:
         self._priority = priority
 
     def implementation(self, impl: Type[T]) -> None:
-        self._di._register(self._cls, _Registration(self._lifetime, self._priority, lambda: self._di.spawn(impl)))
+        self._register(impl, (), lambda scope: self._container(scope).spawn(impl), lambda scope: self._container(scope).spawn_async(impl))
 
-    def factory(self, factory: Callable[..., T], *args: Any, **kwargs: Any) -> None:
+    def factory(self, factory: Callable[..., T] | Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> None:
         explicit: dict[str, Any] = dict(kwargs)
         if args:
             sig = inspect.signature(factory)
             params = list(sig.parameters.values())
             explicit = {p.name: v for p, v in zip(params, args, strict=False)} | explicit
-        self._di._register(self._cls, _Registration(self._lifetime, self._priority, self._di.satisfy(factory, **explicit)))
+        if inspect.iscoroutinefunction(factory):
+            async def create(scope: "DI") -> T:
+                satisfied = await self._container(scope).satisfy_async(factory, **explicit)
+                return await satisfied()
+
+            self._register(factory, explicit, None, create)
+            return
+        bound = self._di.bind(cast(Callable[..., T], factory), **explicit)
+        if self._lifetime == Lifetime.SCOPED:
+            self._register(factory, explicit, bound.call_in)
+            return
+        self._register(factory, explicit, lambda _: bound())
+
+    def value(self, instance: T) -> None:
+        self._di._register_value(self._cls, instance, self._priority)
+
+    def _container(self, scope: "DI") -> "DI":
+        return scope if self._lifetime == Lifetime.SCOPED else self._di
+
+    def _register(
+        self,
+        source: Callable[..., Any],
+        bound: Iterable[str],
+        factory: Optional[Callable[["DI"], T]],
+        async_factory: Optional[Callable[["DI"], Awaitable[T]]] = None,
+    ) -> None:
+        registration = _Registration(self._lifetime, self._priority, factory, async_factory, source, frozenset(bound), self._cls)
+        self._di._register(self._cls, registration)
 
 
 class DI:
-    def __init__(self) -> None:
+    def __init__(self, instrument: bool = False, tracer: Optional[Tracer] = None, compile_factories: bool = False) -> None:
         self._registry: dict[Type, _Registrations] = {}
         self._lock_registry_access = threading.Lock()
         self._signature_cache: dict[Any, inspect.Signature] = {}
-        self._type_name_cache: dict[str, Type] = {}
+        self._name_index: dict[str, Type] = {}
+        self._normalized_name_index: dict[str, Type] = {}
+        self._plan_cache: dict[tuple[Any, bool], tuple[_ParameterPlan, ...]] = {}
+        self._scoped_instances: dict[_Registration, Any] = {}
+        self._scoped_pending: dict[_Registration, asyncio.Future] = {}
+        self._scoped_locks: dict[_Registration, threading.Lock] = {}
+        self._frozen = False
+        self._metrics = ResolutionMetrics(tracer) if instrument or tracer is not None else None
+        self._factories: Optional[dict[Type, Optional[Callable[[DI], Any]]]] = {} if compile_factories else None
 
     def __enter__(self) -> Self:
         return self
 
     def __exit__(self, *args: object) -> None:
-        with self._lock_registry_access:
-            self._registry.clear()
-        self._signature_cache.clear()
-        self._type_name_cache.clear()
+        _dispose(self._release())
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await _dispose_async(self._release())
 
     def register(self, cls: Type[T] | str, lifetime: Lifetime = Lifetime.SINGLETON, priority: Priority = Priority.LOW) -> Binding[T]:
+        self._check_not_frozen(cls)
         resolved_cls = cast(Type[T], self._resolve_type(cls)) if isinstance(cls, str) else cls
         return Binding(self, resolved_cls, lifetime=lifetime, priority=priority)
 
     def resolve(self, key: Type[T] | str) -> Optional[T]:
         resolved_key = self._resolve_type(key) if isinstance(key, str) else key
-        with self._lock_registry_access:
-            registrations = self._registry.get(resolved_key)
-        if registrations is None:
-            return None
-        return cast(T, registrations.resolve_first())
+        metrics = self._metrics
+        if metrics is None:
+            return self._resolve(resolved_key, self)
+        start = time.perf_counter()
+        try:
+            return self._resolve(resolved_key, self)
+        finally:
+            metrics.record_resolve("resolve", resolved_key, time.perf_counter() - start)
 
     def resolve_many(self, key: Type[T] | str) -> List[T]:
-        resolved_key = self._resolve_type(key) if isinstance(key, str) else key
-        with self._lock_registry_access:
-            registrations = self._registry.get(resolved_key)
-        if registrations is None:
-            return []
-        return registrations.resolve_all()
+        resolved_key = cast(Type[T], self._resolve_type(key)) if isinstance(key, str) else key
+        metrics = self._metrics
+        if metrics is None:
+            return self._resolve_many(resolved_key, self)
+        start = time.perf_counter()
+        try:
+            return self._resolve_many(resolved_key, self)
+        finally:
+            metrics.record_resolve("resolve_many", resolved_key, time.perf_counter() - start)
 
     def spawn(self, cls: Type[T], *args: Any, **kwargs: Any) -> T:
+        if self._factories is not None and not args and not kwargs:
+            factory = self._get_factory(cls)
+            if factory is not None:
+                return cast(T, factory(self))
         fn = cls.__init__
         if args:
             if fn not in self._signature_cache:
@@ -89,36 +152,262 @@ class DI:
 
         return wrapper
 
+    def bind(self, fn: Callable[..., R], **kwargs: Any) -> BoundCallable[R]:
+        explicit = {k: v for k, v in kwargs.items() if v is not REQUIRED}
+        return BoundCallable(self, fn, explicit, frozenset(kwargs))
+
+    async def resolve_async(self, key: Type[T] | str) -> Optional[T]:
+        resolved_key = self._resolve_type(key) if isinstance(key, str) else key
+        metrics = self._metrics
+        if metrics is None:
+            return await self._resolve_async(resolved_key, self)
+        start = time.perf_counter()
+        try:
+            return await self._resolve_async(resolved_key, self)
+        finally:
+            metrics.record_resolve("resolve", resolved_key, time.perf_counter() - start)
+
+    async def resolve_many_async(self, key: Type[T] | str) -> List[T]:
+        resolved_key = cast(Type[T], self._resolve_type(key)) if isinstance(key, str) else key
+        metrics = self._metrics
+        if metrics is None:
+            return await self._resolve_many_async(resolved_key, self)
+        start = time.perf_counter()
+        try:
+            return await self._resolve_many_async(resolved_key, self)
+        finally:
+            metrics.record_resolve("resolve_many", resolved_key, time.perf_counter() - start)
+
+    async def spawn_async(self, cls: Type[T], *args: Any, **kwargs: Any) -> T:
+        fn = cls.__init__
+        if args:
+            if fn not in self._signature_cache:
+                self._signature_cache[fn] = inspect.signature(fn)
+            params = list(self._signature_cache[fn].parameters.values())[1:]
+            kwargs = {p.name: v for p, v in zip(params, args, strict=False)} | kwargs
+        return cls(**await self._resolve_kwargs_async(fn, skip_self=True, explicit_kwargs=kwargs))
+
+    async def satisfy_async(self, fn: Callable[..., R] | Callable[..., Awaitable[R]], **kwargs: Any) -> Callable[..., Awaitable[R]]:
+        resolved_kwargs = await self._resolve_kwargs_async(fn, skip_self=False, explicit_kwargs=kwargs)
+
+        async def wrapper(**override: Any) -> R:
+            result = fn(**resolved_kwargs | override)
+            if inspect.isawaitable(result):
+                return await result
+            return cast(R, result)
+
+        return wrapper
+
     def scope(self) -> "DI":
         return _ScopedDI(self)
 
+    def build(self) -> Self:
+        registrations = [(cls, registration) for cls, registrations in self._registry.items() for registration in registrations]
+        problems = _validate(self, registrations)
+        if problems:
+            raise ValueError("Dependency graph validation failed:\n" + "\n".join(f"  - {problem}" for problem in problems))
+        return self
+
+    def freeze(self) -> Self:
+        self.build()
+        self._frozen = True
+        return self
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+    @property
+    def metrics(self) -> Optional[ResolutionMetrics]:
+        return self._metrics
+
+    def warm_up(self, types: Iterable[Type], executor: Optional[Executor] = None) -> dict[Type, Future]:
+        order = self._warm_up_order(types)
+        pool = executor or ThreadPoolExecutor(thread_name_prefix="ps-di-warm-up")
+        try:
+            return {cls: pool.submit(self._warm_up_registration, registration) for cls, registration in order}
+        finally:
+            if executor is None:
+                pool.shutdown(wait=False)
+
+    def _resolve(self, key: Type[T], scope: "DI") -> Optional[T]:
+        registrations = self._registry.get(key)
+        if registrations is None:
+            return None
+        return cast(T, registrations.resolve_first(scope))
+
+    def _resolve_many(self, key: Type[T], scope: "DI") -> List[T]:
+        registrations = self._registry.get(key)
+        if registrations is None:
+            return []
+        return list(registrations.resolve_all(scope))
+
+    async def _resolve_async(self, key: Type[T], scope: "DI") -> Optional[T]:
+        registrations = self._registry.get(key)
+        if registrations is None:
+            return None
+        return cast(T, await registrations.resolve_first_async(scope))
+
+    async def _resolve_many_async(self, key: Type[T], scope: "DI") -> List[T]:
+        registrations = self._registry.get(key)
+        if registrations is None:
+            return []
+        return list(await registrations.resolve_all_async(scope))
+
+    def _find_registration(self, key: Type) -> Optional[_Registration]:
+        registrations = self._registry.get(key)
+        return registrations.first if registrations is not None else None
+
+    def _is_registered(self, key: Type) -> bool:
+        return key in self._registry
+
+    def _dependency_types(self, registration: _Registration) -> list[Type]:
+        if registration.source is None:
+            return []
+        types: list[Type] = []
+        for param in self._get_plan(registration.source, skip_self=False):
+            if param.name in registration.bound:
+                continue
+            target = param.target
+            if param.strategy is _Strategy.NAME:
+                target = self._find_type_by_name(target)
+            elif param.strategy not in (_Strategy.TYPE, _Strategy.OPTIONAL, _Strategy.MANY):
+                continue
+            if isinstance(target, str):
+                try:
+                    target = self._resolve_type(target)
+                except ValueError:
+                    continue
+            if target is not None:
+                types.append(target)
+        return types
+
+    def _warm_up_order(self, types: Iterable[Type]) -> list[tuple[Type, _Registration]]:
+        order: list[tuple[Type, _Registration]] = []
+        visited: set[Type] = set()
+
+        def visit(cls: Type) -> None:
+            if cls in visited:
+                return
+            visited.add(cls)
+            registration = self._find_registration(cls)
+            if registration is None or registration.lifetime != Lifetime.SINGLETON:
+                return
+            for dependency in self._dependency_types(registration):
+                visit(dependency)
+            if registration.instance is None:
+                order.append((cls, registration))
+
+        for cls in types:
+            visit(cls)
+        return order
+
+    def _warm_up_registration(self, registration: _Registration[T]) -> T:
+        if registration.factory is None:
+            return asyncio.run(registration.resolve_async(self))
+        return registration.resolve(self)
+
+    def _resolve_scoped(self, registration: _Registration[T]) -> T:
+        instance = self._scoped_instances.get(registration, _MISSING)
+        if instance is _MISSING:
+            with self._scoped_lock(registration):
+                instance = self._scoped_instances.get(registration, _MISSING)
+                if instance is _MISSING:
+                    instance = registration.create(self)
+                    with self._lock_registry_access:
+                        self._scoped_instances = self._scoped_instances | {registration: instance}
+        return cast(T, instance)
+
+    def _scoped_lock(self, registration: _Registration) -> threading.Lock:
+        lock = self._scoped_locks.get(registration)
+        if lock is None:
+            with self._lock_registry_access:
+                lock = self._scoped_locks.get(registration)
+                if lock is None:
+                    lock = threading.Lock()
+                    self._scoped_locks = self._scoped_locks | {registration: lock}
+        return lock
+
+    async def _resolve_scoped_async(self, registration: _Registration[T]) -> T:
+        instance = self._scoped_instances.get(registration, _MISSING)
+        if instance is not _MISSING:
+            return cast(T, instance)
+        with self._lock_registry_access:
+            instance = self._scoped_instances.get(registration, _MISSING)
+            if instance is not _MISSING:
+                return cast(T, instance)
+            pending = self._scoped_pending.get(registration)
+            if pending is None:
+                pending = asyncio.ensure_future(self._create_scoped_async(registration))
+                self._scoped_pending = self._scoped_pending | {registration: pending}
+        return await asyncio.shield(pending)
+
+    async def _create_scoped_async(self, registration: _Registration[T]) -> T:
+        try:
+            instance = await registration.create_async(self)
+            with self._lock_registry_access:
+                self._scoped_instances = self._scoped_instances | {registration: instance}
+            return instance
+        finally:
+            with self._lock_registry_access:
+                self._scoped_pending = {k: v for k, v in self._scoped_pending.items() if k is not registration}
+
+    def _release(self) -> list[Any]:
+        with self._lock_registry_access:
+            self._registry = {}
+            self._name_index = {}
+            self._normalized_name_index = {}
+            instances = list(self._scoped_instances.values())
+            self._scoped_instances = {}
+            self._scoped_locks = {}
+            self._frozen = False
+        self._signature_cache.clear()
+        self._plan_cache.clear()
+        if self._factories is not None:
+            self._factories.clear()
+        return instances
+
+    def _check_not_frozen(self, cls: Type | str) -> None:
+        if self._frozen:
+            raise ValueError(f"Cannot register {cls}: the container is frozen")
+
     def _register(self, cls: Type[T], registration: _Registration[T]) -> None:
         with self._lock_registry_access:
-            registrations = self._registry.setdefault(cls, _Registrations())
+            self._check_not_frozen(cls)
+            registrations = self._registry.get(cls)
+            if registrations is None:
+                registrations = _Registrations()
+                registrations.add_registration(registration)
+                self._registry = self._registry | {cls: registrations}
+                self._index_name(cls)
+                return
         registrations.add_registration(registration)
 
+    def _register_value(self, cls: Type[T], instance: T, priority: Priority) -> None:
+        registration = _Registration(Lifetime.SINGLETON, priority, lambda _: instance, key=cls)
+        registration.instance = instance
+        self._register(cls, registration)
+
+    def _index_name(self, cls: Type) -> None:
+        name = getattr(cls, "__name__", "")
+        if name not in self._name_index:
+            self._name_index = self._name_index | {name: cls}
+        normalized = _normalize_name(name)
+        if normalized not in self._normalized_name_index:
+            self._normalized_name_index = self._normalized_name_index | {normalized: cls}
+
     def _resolve_type(self, key: Type[T] | str) -> Type[T]:
         if isinstance(key, str):
-            if key not in self._type_name_cache:
-                found = next((t for t in self._registry if t.__name__ == key), None)
-                if found is None:
-                    raise ValueError(f"Cannot resolve type from string '{key}' - no matching type registered")
-                self._type_name_cache[key] = found
-            return self._type_name_cache[key]
+            found = self._name_index.get(key)
+            if found is None:
+                raise ValueError(f"Cannot resolve type from string '{key}' - no matching type registered")
+            return found
         return key
 
-    def _normalize_name(self, name: str) -> str:
-        return name.casefold().replace("_", "")
-
     def _find_type_by_name(self, normalized: str) -> Optional[Type]:
-        with self._lock_registry_access:
-            return next(
-                (t for t in self._registry if self._normalize_name(getattr(t, "__name__", "")) == normalized),
-                None
-            )
+        return self._normalized_name_index.get(normalized)
 
-    def _try_resolve_by_name(self, param_name: str, has_default: bool, default: Any) -> tuple[bool, Any]:
-        normalized = self._normalize_name(param_name)
+    def _try_resolve_by_name(self, normalized: str, has_default: bool, default: Any) -> tuple[bool, Any]:
         matched_type = self._find_type_by_name(normalized)
         if matched_type is not None:
             resolved = self.resolve(matched_type)
@@ -128,101 +417,190 @@ class DI:
             return True, default
         return False, None
 
-    def _try_resolve_annotation(self, annotation: Any, has_default: bool, default: Any) -> tuple[bool, Any]:
-        if annotation is DI or (isinstance(annotation, type) and issubclass(annotation, DI)):
-            return True, self
-
-        origin = get_origin(annotation)
-
-        if origin is list:
-            type_args = get_args(annotation)
-            return True, self.resolve_many(type_args[0]) if type_args else []
-
-        if origin is Union:
-            type_args = get_args(annotation)
-            if type(None) in type_args:
-                non_none_type = next(t for t in type_args if t is not type(None))
-                resolved = self.resolve(non_none_type)
-                if resolved is not None:
-                    return True, resolved
-                return True, default if has_default else None
-
-        resolved = self.resolve(annotation)
-        if resolved is not None:
-            return True, resolved
-        if has_default:
-            return True, default
-        return False, None
+    def _get_plan(self, fn: Callable, skip_self: bool) -> tuple[_ParameterPlan, ...]:
+        key = (fn, skip_self)
+        plan = self._plan_cache.get(key)
+        if self._metrics is not None:
+            self._metrics.record_plan(plan is not None)
+        if plan is None:
+            if fn not in self._signature_cache:
+                self._signature_cache[fn] = inspect.signature(fn)
+            plan, complete = _compile_plan(fn, self._signature_cache[fn], skip_self, DI)
+            if complete:
+                self._plan_cache[key] = plan
+        return plan
+
+    def _get_factory(self, cls: Type) -> Optional[Callable[["DI"], Any]]:
+        factories = cast(dict[Type, Optional[Callable[["DI"], Any]]], self._factories)
+        if cls in factories:
+            return factories[cls]
+        fn = cls.__init__
+        plan = self._get_plan(fn, skip_self=True)
+        factory = _generate_factory(cls, self._signature_cache[fn], plan)
+        if (fn, True) in self._plan_cache:
+            factories[cls] = factory
+        return factory
 
     def _resolve_kwargs(self, fn: Callable, skip_self: bool, explicit_kwargs: dict[str, Any]) -> dict[str, Any]:
-        if fn not in self._signature_cache:
-            self._signature_cache[fn] = inspect.signature(fn)
-        sig = self._signature_cache[fn]
-
-        hints_target = fn.__init__ if isinstance(fn, type) else fn
-        try:
-            type_hints = get_type_hints(hints_target)
-        except Exception:
-            type_hints = {}
-
-        required_params = {k for k, v in explicit_kwargs.items() if v is REQUIRED}
-        final_kwargs = {k: explicit_kwargs[k] for k in explicit_kwargs.keys() - required_params}
-        params = list(sig.parameters.values())[1 if skip_self else 0:]
-
-        for param in params:
-            if param.name in final_kwargs or param.name in required_params:
-                continue
-
-            annotation = type_hints.get(param.name, param.annotation)
-            has_default = param.default != inspect.Parameter.empty
+        plan = self._get_plan(fn, skip_self)
+        final_kwargs = {k: v for k, v in explicit_kwargs.items() if v is not REQUIRED}
 
-            if annotation == inspect.Parameter.empty:
-                found, value = self._try_resolve_by_name(param.name, has_default, param.default)
-                if found:
-                    final_kwargs[param.name] = value
+        for param in plan:
+            if param.name in explicit_kwargs:
                 continue
+            found, value = self._resolve_parameter(param)
+            if found:
+                final_kwargs[param.name] = value
 
-            found, value = self._try_resolve_annotation(annotation, has_default, param.default)
-            if not found:
-                raise ValueError(f"Cannot resolve required dependency {annotation} for parameter {param.name}")
-            final_kwargs[param.name] = value
+        return final_kwargs
 
+    def _resolve_parameter(self, param: _ParameterPlan) -> tuple[bool, Any]:
+        strategy = param.strategy
+        if strategy is _Strategy.TYPE:
+            value = self.resolve(param.target)
+            if value is not None:
+                return True, value
+            if not param.has_default:
+                raise ValueError(f"Cannot resolve required dependency {param.target} for parameter {param.name}")
+            return True, param.default
+        if strategy is _Strategy.NAME:
+            return self._try_resolve_by_name(param.target, param.has_default, param.default)
+        if strategy is _Strategy.CONTAINER:
+            return True, self
+        if strategy is _Strategy.MANY:
+            return True, self.resolve_many(param.target) if param.target is not None else []
+        if strategy is _Strategy.LAZY:
+            return True, Lazy(lambda: self._resolve_parameter(param.target)[1])
+        if strategy is _Strategy.PROVIDER:
+            return True, Provider(lambda: self._resolve_parameter(param.target)[1])
+        value = self.resolve(param.target)
+        if value is None:
+            value = param.default if param.has_default else None
+        return True, value
+
+    async def _resolve_kwargs_async(self, fn: Callable, skip_self: bool, explicit_kwargs: dict[str, Any]) -> dict[str, Any]:
+        plan = self._get_plan(fn, skip_self)
+        final_kwargs = {k: v for k, v in explicit_kwargs.items() if v is not REQUIRED}
+        params = [param for param in plan if param.name not in explicit_kwargs]
+        results = await asyncio.gather(*(self._resolve_parameter_async(param) for param in params))
+        for param, (found, value) in zip(params, results, strict=True):
+            if found:
+                final_kwargs[param.name] = value
         return final_kwargs
 
+    async def _resolve_parameter_async(self, param: _ParameterPlan) -> tuple[bool, Any]:
+        strategy = param.strategy
+        if strategy is _Strategy.CONTAINER:
+            return True, self
+        if strategy is _Strategy.MANY:
+            return True, await self.resolve_many_async(param.target) if param.target is not None else []
+        if strategy is _Strategy.LAZY or strategy is _Strategy.PROVIDER:
+            return self._resolve_parameter(param)
+        if strategy is _Strategy.NAME:
+            matched_type = self._find_type_by_name(param.target)
+            value = await self.resolve_async(matched_type) if matched_type is not None else None
+            if value is not None:
+                return True, value
+            return param.has_default, param.default if param.has_default else None
+
+        value = await self.resolve_async(param.target)
+        if value is not None:
+            return True, value
+        if strategy is _Strategy.TYPE and not param.has_default:
+            raise ValueError(f"Cannot resolve required dependency {param.target} for parameter {param.name}")
+        return True, param.default if param.has_default else None
+
 
 class _ScopedDI(DI):
     def __init__(self, parent: DI) -> None:
-        super().__init__()
         self._parent = parent
+        self._lock_registry_access = parent._lock_registry_access
+        self._signature_cache = parent._signature_cache
+        self._plan_cache = parent._plan_cache
+        self._registry = _EMPTY
+        self._values: dict[Type, Any] = _EMPTY
+        self._name_index = _EMPTY
+        self._normalized_name_index = _EMPTY
+        self._scoped_instances = _EMPTY
+        self._scoped_pending = _EMPTY
+        self._scoped_locks = _EMPTY
+        self._frozen = False
+        self._metrics = parent._metrics
+        self._factories = parent._factories
+
+    def _resolve(self, key: Type[T], scope: DI) -> Optional[T]:
+        value = self._values.get(key, _MISSING)
+        if value is not _MISSING:
+            return cast(T, value)
+        registrations = self._registry.get(key)
+        if registrations is not None:
+            return cast(T, registrations.resolve_first(scope))
+        return self._parent._resolve(key, scope)
 
-    def resolve(self, key: Type[T] | str) -> Optional[T]:
-        resolved_key = self._resolve_type(key) if isinstance(key, str) else key
-        with self._lock_registry_access:
-            registrations = self._registry.get(resolved_key)
+    def _resolve_many(self, key: Type[T], scope: DI) -> List[T]:
+        value = self._values.get(key, _MISSING)
+        registrations = self._registry.get(key)
+        scoped_results: List[T] = [] if value is _MISSING else [cast(T, value)]
+        if registrations is not None:
+            scoped_results += registrations.resolve_all(scope)
+        return scoped_results + self._parent._resolve_many(key, scope)
+
+    async def _resolve_async(self, key: Type[T], scope: DI) -> Optional[T]:
+        value = self._values.get(key, _MISSING)
+        if value is not _MISSING:
+            return cast(T, value)
+        registrations = self._registry.get(key)
         if registrations is not None:
-            return cast(T, registrations.resolve_first())
-        return self._parent.resolve(key)
+            return cast(T, await registrations.resolve_first_async(scope))
+        return await self._parent._resolve_async(key, scope)
 
-    def resolve_many(self, key: Type[T] | str) -> List[T]:
-        resolved_key = self._resolve_type(key) if isinstance(key, str) else key
+    async def _resolve_many_async(self, key: Type[T], scope: DI) -> List[T]:
+        value = self._values.get(key, _MISSING)
+        registrations = self._registry.get(key)
+        scoped_results: List[T] = [] if value is _MISSING else [cast(T, value)]
+        if registrations is not None:
+            scoped_results += await registrations.resolve_all_async(scope)
+        return scoped_results + await self._parent._resolve_many_async(key, scope)
+
+    def _is_registered(self, key: Type) -> bool:
+        return key in self._values or key in self._registry or self._parent._is_registered(key)
+
+    def _find_registration(self, key: Type) -> Optional[_Registration]:
+        if key in self._values:
+            return None
+        registrations = self._registry.get(key)
+        if registrations is not None:
+            return registrations.first
+        return self._parent._find_registration(key)
+
+    def _release(self) -> list[Any]:
+        with self._lock_registry_access:
+            self._registry = _EMPTY
+            self._values = _EMPTY
+            self._name_index = _EMPTY
+            self._normalized_name_index = _EMPTY
+            instances = list(self._scoped_instances.values())
+            self._scoped_instances = _EMPTY
+            self._scoped_locks = _EMPTY
+            self._frozen = False
+        return instances
+
+    def _register_value(self, cls: Type[T], instance: T, priority: Priority) -> None:
         with self._lock_registry_access:
-            registrations = self._registry.get(resolved_key)
-        scoped_results: List[T] = registrations.resolve_all() if registrations is not None else []
-        parent_results: List[T] = self._parent.resolve_many(key)
-        return scoped_results + parent_results
+            self._check_not_frozen(cls)
+            self._values = self._values | {cls: instance}
+            self._index_name(cls)
 
     def _resolve_type(self, key: Type[T] | str) -> Type[T]:
         if isinstance(key, str):
-            if key not in self._type_name_cache:
-                found = next((t for t in self._registry if t.__name__ == key), None)
-                if found is None:
-                    return self._parent._resolve_type(key)
-                self._type_name_cache[key] = found
-            return self._type_name_cache[key]
+            found = self._name_index.get(key)
+            if found is None:
+                return self._parent._resolve_type(key)
+            return found
         return key
 
     def _find_type_by_name(self, normalized: str) -> Optional[Type]:
-        matched = super()._find_type_by_name(normalized)
+        matched = self._normalized_name_index.get(normalized)
         if matched is not None:
             return matched
         return self._parent._find_type_by_name(normalized)
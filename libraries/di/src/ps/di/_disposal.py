@@ -0,0 +1,43 @@
+import inspect
+from typing import Any, Iterable, Optional
+
+
+def _dispose(instances: Iterable[object]) -> None:
+    error: Optional[Exception] = None
+    for instance in reversed(list(instances)):
+        try:
+            _dispose_instance(instance)
+        except Exception as e:
+            error = error or e
+    if error is not None:
+        raise error
+
+
+async def _dispose_async(instances: Iterable[object]) -> None:
+    error: Optional[Exception] = None
+    for instance in reversed(list(instances)):
+        try:
+            aexit = getattr(instance, "__aexit__", None)
+            aclose = getattr(instance, "aclose", None)
+            if aexit is not None:
+                await aexit(None, None, None)
+            elif aclose is not None:
+                await aclose()
+            else:
+                result = _dispose_instance(instance)
+                if inspect.isawaitable(result):
+                    await result
+        except Exception as e:
+            error = error or e
+    if error is not None:
+        raise error
+
+
+def _dispose_instance(instance: object) -> Any:
+    exit_fn = getattr(instance, "__exit__", None)
+    if exit_fn is not None:
+        return exit_fn(None, None, None)
+    close = getattr(instance, "close", None)
+    if close is not None:
+        return close()
+    return None
@@ -5,6 +5,7 @@ class Lifetime(IntEnum):
     UNKNOWN = 0
     SINGLETON = 1
     TRANSIENT = 2
+    SCOPED = 3
 
 
 class Priority(IntEnum):
@@ -0,0 +1,43 @@
+import threading
+from typing import Callable, Optional, cast
+
+_UNRESOLVED = object()
+
+
+class Lazy[T]:
+    __slots__ = ("_factory", "_lock", "_value")
+
+    def __init__(self, factory: Callable[[], T]) -> None:
+        self._factory: Optional[Callable[[], T]] = factory
+        self._lock = threading.Lock()
+        self._value: object = _UNRESOLVED
+
+    @property
+    def value(self) -> T:
+        if self._value is _UNRESOLVED:
+            with self._lock:
+                if self._value is _UNRESOLVED:
+                    factory = cast(Callable[[], T], self._factory)
+                    self._value = factory()
+                    self._factory = None
+        return cast(T, self._value)
+
+    @property
+    def is_resolved(self) -> bool:
+        return self._value is not _UNRESOLVED
+
+    def __repr__(self) -> str:
+        return f"Lazy({self._value!r})" if self.is_resolved else "Lazy(<unresolved>)"
+
+
+class Provider[T]:
+    __slots__ = ("_factory",)
+
+    def __init__(self, factory: Callable[[], T]) -> None:
+        self._factory = factory
+
+    def __call__(self) -> T:
+        return self._factory()
+
+    def __repr__(self) -> str:
+        return "Provider()"
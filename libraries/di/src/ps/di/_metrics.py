@@ -0,0 +1,72 @@
+import threading
+from collections import Counter, defaultdict
+from typing import Any, Callable, Optional
+
+from ._enums import Lifetime
+
+Tracer = Callable[[str, Any, float], None]
+
+
+def _key_name(key: Any) -> str:
+    return getattr(key, "__qualname__", None) or repr(key)
+
+
+class ResolutionMetrics:
+    def __init__(self, tracer: Optional[Tracer] = None) -> None:
+        self._tracer = tracer
+        self._lock = threading.Lock()
+        self.resolve_counts: Counter[Any] = Counter()
+        self.resolve_time: defaultdict[Any, float] = defaultdict(float)
+        self.factory_calls: Counter[Any] = Counter()
+        self.factory_time: defaultdict[Any, float] = defaultdict(float)
+        self.singletons_created: Counter[Any] = Counter()
+        self.plan_cache_hits = 0
+        self.plan_cache_misses = 0
+
+    def record_resolve(self, kind: str, key: Any, duration: float) -> None:
+        with self._lock:
+            self.resolve_counts[key] += 1
+            self.resolve_time[key] += duration
+        if self._tracer is not None:
+            self._tracer(kind, key, duration)
+
+    def record_factory(self, key: Any, lifetime: Lifetime, duration: float) -> None:
+        with self._lock:
+            self.factory_calls[key] += 1
+            self.factory_time[key] += duration
+            if lifetime == Lifetime.SINGLETON:
+                self.singletons_created[key] += 1
+        if self._tracer is not None:
+            self._tracer("create", key, duration)
+
+    def record_plan(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.plan_cache_hits += 1
+            else:
+                self.plan_cache_misses += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.resolve_counts.clear()
+            self.resolve_time.clear()
+            self.factory_calls.clear()
+            self.factory_time.clear()
+            self.singletons_created.clear()
+            self.plan_cache_hits = 0
+            self.plan_cache_misses = 0
+
+    def format_report(self, limit: Optional[int] = None) -> str:
+        with self._lock:
+            keys = sorted(
+                self.resolve_counts.keys() | self.factory_calls.keys(),
+                key=lambda k: (-self.resolve_counts[k], -self.factory_time[k], _key_name(k)),
+            )
+            rows = [
+                f"{_key_name(key):<40} {self.resolve_counts[key]:>9} {self.factory_calls[key]:>9} "
+                f"{self.factory_time[key] * 1000:>11.2f}"
+                for key in keys[:limit]
+            ]
+            footer = f"plan cache: {self.plan_cache_hits} hits, {self.plan_cache_misses} misses"
+        header = f"{'type':<40} {'resolves':>9} {'creates':>9} {'factory ms':>11}"
+        return "\n".join([header, *rows, footer])
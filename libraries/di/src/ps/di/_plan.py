@@ -0,0 +1,71 @@
+import inspect
+from enum import IntEnum
+from typing import Any, Callable, NamedTuple, Union, get_args, get_origin, get_type_hints
+
+from ._lazy import Lazy, Provider
+
+
+class _Strategy(IntEnum):
+    CONTAINER = 0
+    MANY = 1
+    OPTIONAL = 2
+    TYPE = 3
+    NAME = 4
+    LAZY = 5
+    PROVIDER = 6
+
+
+class _ParameterPlan(NamedTuple):
+    name: str
+    strategy: _Strategy
+    target: Any
+    has_default: bool
+    default: Any
+
+
+def _normalize_name(name: str) -> str:
+    return name.casefold().replace("_", "")
+
+
+def _classify(name: str, annotation: Any, container_type: type) -> tuple[_Strategy, Any]:
+    if annotation is inspect.Parameter.empty:
+        return _Strategy.NAME, _normalize_name(name)
+    if annotation is container_type or (isinstance(annotation, type) and issubclass(annotation, container_type)):
+        return _Strategy.CONTAINER, container_type
+
+    origin = get_origin(annotation)
+    if origin is Lazy or origin is Provider or annotation is Lazy or annotation is Provider:
+        type_args = get_args(annotation)
+        inner_strategy, inner_target = _classify(name, type_args[0] if type_args else inspect.Parameter.empty, container_type)
+        inner = _ParameterPlan(name, inner_strategy, inner_target, False, None)
+        return (_Strategy.LAZY if (origin or annotation) is Lazy else _Strategy.PROVIDER), inner
+    if origin is list:
+        type_args = get_args(annotation)
+        return _Strategy.MANY, type_args[0] if type_args else None
+    if origin is Union:
+        type_args = get_args(annotation)
+        if type(None) in type_args:
+            return _Strategy.OPTIONAL, next(t for t in type_args if t is not type(None))
+    return _Strategy.TYPE, annotation
+
+
+def _compile_plan(
+    fn: Callable,
+    signature: inspect.Signature,
+    skip_self: bool,
+    container_type: type,
+) -> tuple[tuple[_ParameterPlan, ...], bool]:
+    hints_target = fn.__init__ if isinstance(fn, type) else fn
+    try:
+        type_hints = get_type_hints(hints_target)
+        complete = True
+    except Exception:
+        type_hints = {}
+        complete = False
+
+    plan = []
+    for param in list(signature.parameters.values())[1 if skip_self else 0:]:
+        strategy, target = _classify(param.name, type_hints.get(param.name, param.annotation), container_type)
+        has_default = param.default is not inspect.Parameter.empty
+        plan.append(_ParameterPlan(param.name, strategy, target, has_default, param.default))
+    return tuple(plan), complete
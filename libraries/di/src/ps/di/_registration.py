@@ -1,52 +1,166 @@
+import asyncio
+import bisect
 import threading
-from typing import Callable, List, Optional
+import time
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterator, Optional
 
 from ._enums import Lifetime, Priority
 
+if TYPE_CHECKING:
+    from ._di import DI
+
+_creation_tasks: set[asyncio.Task] = set()
+
 
 class _Registration[T]:
-    def __init__(self, lifetime: Lifetime, priority: Priority, factory: Callable[[], T]) -> None:
+    def __init__(
+        self,
+        lifetime: Lifetime,
+        priority: Priority,
+        factory: Optional[Callable[["DI"], T]],
+        async_factory: Optional[Callable[["DI"], Awaitable[T]]] = None,
+        source: Optional[Callable[..., Any]] = None,
+        bound: frozenset[str] = frozenset(),
+        key: Any = None,
+    ) -> None:
         self.lifetime = lifetime
         self.priority = priority
         self.factory = factory
+        self.async_factory = async_factory
         self.instance: Optional[T] = None
-        self._lock_singleton_creation = threading.Lock()
+        self.lock_instance_creation = threading.Lock()
+        self._pending: Optional[Future[T]] = None
+        self.source = source
+        self.bound = bound
+        self.key = key
+
+    def create(self, scope: "DI") -> T:
+        if self.factory is None:
+            raise ValueError("Registration has an async factory and must be resolved with resolve_async.")
+        metrics = scope._metrics
+        if metrics is None:
+            return self.factory(scope)
+        start = time.perf_counter()
+        try:
+            return self.factory(scope)
+        finally:
+            metrics.record_factory(self.key, self.lifetime, time.perf_counter() - start)
 
-    def resolve(self) -> T:
+    async def create_async(self, scope: "DI") -> T:
+        if self.async_factory is None:
+            return self.create(scope)
+        metrics = scope._metrics
+        if metrics is None:
+            return await self.async_factory(scope)
+        start = time.perf_counter()
+        try:
+            return await self.async_factory(scope)
+        finally:
+            metrics.record_factory(self.key, self.lifetime, time.perf_counter() - start)
+
+    def resolve(self, scope: "DI") -> T:
         match self.lifetime:
             case Lifetime.SINGLETON:
                 if self.instance is None:
-                    with self._lock_singleton_creation:
+                    with self.lock_instance_creation:
                         if self.instance is None:
-                            self.instance = self.factory()
+                            self.instance = self.create(scope)
                 return self.instance
             case Lifetime.TRANSIENT:
-                return self.factory()
+                return self.create(scope)
+            case Lifetime.SCOPED:
+                return scope._resolve_scoped(self)
             case _:
                 raise ValueError("Unknown lifetime for registration.")
 
+    async def resolve_async(self, scope: "DI") -> T:
+        match self.lifetime:
+            case Lifetime.SINGLETON:
+                if self.instance is not None:
+                    return self.instance
+                with self.lock_instance_creation:
+                    if self.instance is not None:
+                        return self.instance
+                    pending = self._pending
+                    if pending is None:
+                        pending = self._pending = Future()
+                        task = asyncio.ensure_future(self._create_singleton_async(scope, pending))
+                        _creation_tasks.add(task)
+                        task.add_done_callback(_creation_tasks.discard)
+                return await asyncio.shield(asyncio.wrap_future(pending))
+            case Lifetime.TRANSIENT:
+                return await self.create_async(scope)
+            case Lifetime.SCOPED:
+                return await scope._resolve_scoped_async(self)
+            case _:
+                raise ValueError("Unknown lifetime for registration.")
+
+    async def _create_singleton_async(self, scope: "DI", pending: Future[T]) -> None:
+        try:
+            instance = await self.create_async(scope)
+        except BaseException as e:
+            with self.lock_instance_creation:
+                self._pending = None
+            if isinstance(e, asyncio.CancelledError):
+                pending.cancel()
+            else:
+                pending.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        with self.lock_instance_creation:
+            if self.instance is None:
+                self.instance = instance
+            self._pending = None
+        pending.set_result(self.instance)
+
 
 class _Registrations:
     def __init__(self) -> None:
-        self._registrations: List[_Registration] = []
+        self._registrations: tuple[_Registration, ...] = ()
+        self._resolved: Optional[tuple[tuple[_Registration, ...], tuple]] = None
         self._lock_registrations_access = threading.Lock()
 
     def add_registration(self, registration: _Registration) -> None:
         with self._lock_registrations_access:
-            insert_pos = 0
-            for i, existing in enumerate(self._registrations):
-                if registration.priority >= existing.priority:
-                    insert_pos = i
-                    break
-                insert_pos = i + 1
-            self._registrations.insert(insert_pos, registration)
-
-    def resolve_first(self) -> object:
-        with self._lock_registrations_access:
-            registration = self._registrations[0]
-        return registration.resolve()
+            registrations = self._registrations
+            insert_pos = bisect.bisect_left(registrations, -registration.priority, key=_descending_priority)
+            self._registrations = (*registrations[:insert_pos], registration, *registrations[insert_pos:])
 
-    def resolve_all(self) -> List:
-        with self._lock_registrations_access:
-            registrations = list(self._registrations)
-        return [registration.resolve() for registration in registrations]
+    @property
+    def first(self) -> _Registration:
+        return self._registrations[0]
+
+    def __iter__(self) -> Iterator[_Registration]:
+        return iter(self._registrations)
+
+    def resolve_first(self, scope: "DI") -> object:
+        return self._registrations[0].resolve(scope)
+
+    def resolve_all(self, scope: "DI") -> tuple:
+        registrations = self._registrations
+        resolved = self._resolved
+        if resolved is not None and resolved[0] is registrations:
+            return resolved[1]
+        return self._cache_resolved(registrations, tuple(registration.resolve(scope) for registration in registrations))
+
+    async def resolve_first_async(self, scope: "DI") -> object:
+        return await self._registrations[0].resolve_async(scope)
+
+    async def resolve_all_async(self, scope: "DI") -> tuple:
+        registrations = self._registrations
+        resolved = self._resolved
+        if resolved is not None and resolved[0] is registrations:
+            return resolved[1]
+        values = await asyncio.gather(*(registration.resolve_async(scope) for registration in registrations))
+        return self._cache_resolved(registrations, tuple(values))
+
+    def _cache_resolved(self, registrations: tuple[_Registration, ...], values: tuple) -> tuple:
+        if all(registration.lifetime == Lifetime.SINGLETON for registration in registrations):
+            self._resolved = (registrations, values)
+        return values
+
+
+def _descending_priority(registration: _Registration) -> int:
+    return -registration.priority
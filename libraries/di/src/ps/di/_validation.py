@@ -0,0 +1,69 @@
+from typing import TYPE_CHECKING, Any, Type
+
+from ._plan import _Strategy
+from ._registration import _Registration
+
+if TYPE_CHECKING:
+    from ._di import DI
+
+def _type_name(cls: object) -> str:
+    return getattr(cls, "__qualname__", None) or repr(cls)
+
+
+def _is_registered(container: "DI", target: Any) -> bool:
+    if isinstance(target, str):
+        try:
+            target = container._resolve_type(target)
+        except ValueError:
+            return False
+    return target is not None and container._is_registered(target)
+
+
+def _missing_dependencies(container: "DI", cls: Type, registration: _Registration) -> list[str]:
+    if registration.source is None:
+        return []
+    problems: list[str] = []
+    for param in container._get_plan(registration.source, skip_self=False):
+        if param.name in registration.bound or param.has_default:
+            continue
+        if param.strategy is _Strategy.TYPE:
+            if not _is_registered(container, param.target):
+                problems.append(
+                    f"Cannot resolve required dependency {param.target} for parameter {param.name} of {_type_name(cls)}"
+                )
+        elif param.strategy is _Strategy.NAME and not _is_registered(container, container._find_type_by_name(param.target)):
+            problems.append(f"Cannot resolve untyped parameter {param.name} of {_type_name(cls)} by name")
+    return problems
+
+
+def _find_cycles(graph: dict[Type, list[Type]]) -> list[list[Type]]:
+    cycles: list[list[Type]] = []
+    state: dict[Type, int] = {}
+    path: list[Type] = []
+
+    def visit(node: Type) -> None:
+        state[node] = 1
+        path.append(node)
+        for dependency in graph.get(node, ()):
+            if state.get(dependency) == 1:
+                cycles.append([*path[path.index(dependency):], dependency])
+            elif dependency not in state:
+                visit(dependency)
+        path.pop()
+        state[node] = 2
+
+    for node in graph:
+        if node not in state:
+            visit(node)
+    return cycles
+
+
+def _validate(container: "DI", registrations: list[tuple[Type, _Registration]]) -> list[str]:
+    problems: list[str] = []
+    graph: dict[Type, list[Type]] = {}
+    for cls, registration in registrations:
+        problems.extend(_missing_dependencies(container, cls, registration))
+        graph.setdefault(cls, []).extend(container._dependency_types(registration))
+    for cycle in _find_cycles(graph):
+        problems.append("Dependency cycle: " + " -> ".join(_type_name(cls) for cls in cycle))
+    return problems
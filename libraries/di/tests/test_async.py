@@ -0,0 +1,272 @@
+import asyncio
+import threading
+from typing import List, Optional
+
+import pytest
+
+from ps.di import DI, Lifetime
+
+from .conftest import Counter, DependentService, Service
+
+
+class GitInfo:
+    def __init__(self, branch: str) -> None:
+        self.branch = branch
+
+
+class Metadata:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class Report:
+    def __init__(self, git: GitInfo, metadata: Metadata) -> None:
+        self.git = git
+        self.metadata = metadata
+
+
+@pytest.mark.asyncio
+async def test_resolve_async_awaits_async_factory():
+    di = DI()
+
+    async def create() -> Service:
+        await asyncio.sleep(0)
+        return Service("async")
+
+    di.register(Service).factory(create)
+
+    service = await di.resolve_async(Service)
+
+    assert service is not None
+    assert service.name == "async"
+
+
+@pytest.mark.asyncio
+async def test_resolve_async_returns_sync_registrations():
+    di = DI()
+    di.register(Service).factory(lambda: Service("sync"))
+
+    service = await di.resolve_async("Service")
+
+    assert service is not None
+    assert service.name == "sync"
+    assert await di.resolve_async(Counter) is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_singleton_creation_is_shared():
+    di = DI()
+    created = Counter()
+
+    async def create() -> Service:
+        created.increment()
+        await asyncio.sleep(0.01)
+        return Service("shared")
+
+    di.register(Service).factory(create)
+
+    first, second = await asyncio.gather(di.resolve_async(Service), di.resolve_async(Service))
+
+    assert first is second
+    assert created.value == 1
+    assert di.resolve(Service) is first
+
+
+@pytest.mark.asyncio
+async def test_sync_resolve_of_pending_async_registration_raises():
+    di = DI()
+
+    async def create() -> Service:
+        return Service("async")
+
+    di.register(Service).factory(create)
+
+    with pytest.raises(ValueError, match="resolve_async"):
+        di.resolve(Service)
+
+
+@pytest.mark.asyncio
+async def test_spawn_async_resolves_dependencies_concurrently():
+    di = DI()
+    started: List[str] = []
+    both_started = asyncio.Event()
+
+    async def wait_for_other(name: str) -> None:
+        started.append(name)
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+
+    async def create_git() -> GitInfo:
+        await wait_for_other("git")
+        return GitInfo("main")
+
+    async def create_metadata() -> Metadata:
+        await wait_for_other("metadata")
+        return Metadata("pkg")
+
+    di.register(GitInfo).factory(create_git)
+    di.register(Metadata).factory(create_metadata)
+
+    report = await di.spawn_async(Report)
+
+    assert report.git.branch == "main"
+    assert report.metadata.name == "pkg"
+
+
+@pytest.mark.asyncio
+async def test_async_factory_receives_injected_dependencies():
+    di = DI()
+    di.register(Service).factory(lambda: Service("injected"))
+
+    async def create(service: Service) -> DependentService:
+        return DependentService(service)
+
+    di.register(DependentService).factory(create)
+
+    dependent = await di.resolve_async(DependentService)
+
+    assert dependent is not None
+    assert dependent.service.name == "injected"
+
+
+@pytest.mark.asyncio
+async def test_implementation_resolves_async_dependencies():
+    di = DI()
+
+    async def create() -> Service:
+        return Service("async")
+
+    di.register(Service).factory(create)
+    di.register(DependentService, Lifetime.TRANSIENT).implementation(DependentService)
+
+    dependent = await di.resolve_async(DependentService)
+
+    assert dependent is not None
+    assert dependent.service.name == "async"
+
+
+@pytest.mark.asyncio
+async def test_resolve_many_async_preserves_priority_order():
+    di = DI()
+
+    async def create_first() -> Service:
+        await asyncio.sleep(0.01)
+        return Service("first")
+
+    di.register(Service).factory(create_first)
+    di.register(Service).factory(lambda: Service("second"))
+
+    services = await di.resolve_many_async(Service)
+
+    assert [service.name for service in services] == ["second", "first"]
+
+
+@pytest.mark.asyncio
+async def test_satisfy_async_supports_sync_and_async_functions():
+    di = DI()
+    di.register(Service).factory(lambda: Service("svc"))
+
+    def sync_fn(service: Service, suffix: str) -> str:
+        return service.name + suffix
+
+    async def async_fn(service: Service, suffix: str) -> str:
+        await asyncio.sleep(0)
+        return service.name + suffix
+
+    sync_wrapper = await di.satisfy_async(sync_fn, suffix="-sync")
+    async_wrapper = await di.satisfy_async(async_fn, suffix="-async")
+
+    assert await sync_wrapper() == "svc-sync"
+    assert await async_wrapper(suffix="-override") == "svc-override"
+
+
+@pytest.mark.asyncio
+async def test_scoped_async_creation_is_shared_per_scope():
+    di = DI()
+    created = Counter()
+
+    async def create() -> Service:
+        created.increment()
+        await asyncio.sleep(0.01)
+        return Service("scoped")
+
+    di.register(Service, Lifetime.SCOPED).factory(create)
+
+    async with di.scope() as first, di.scope() as second:
+        a, b = await asyncio.gather(first.resolve_async(Service), first.resolve_async(Service))
+        c = await second.resolve_async(Service)
+
+    assert a is b
+    assert a is not c
+    assert created.value == 2
+
+
+@pytest.mark.asyncio
+async def test_spawn_async_raises_for_missing_required_dependency():
+    di = DI()
+
+    with pytest.raises(ValueError, match="Cannot resolve required dependency"):
+        await di.spawn_async(DependentService)
+
+
+def test_in_flight_singleton_is_shared_across_event_loops():
+    di = DI()
+    created = Counter()
+    started = threading.Event()
+
+    async def create() -> Service:
+        created.increment()
+        started.set()
+        await asyncio.sleep(0.05)
+        return Service("shared")
+
+    di.register(Service).factory(create)
+    results: List[Optional[Service]] = []
+    creator = threading.Thread(target=lambda: results.append(asyncio.run(di.resolve_async(Service))))
+    creator.start()
+    assert started.wait(timeout=5)
+
+    waiter = asyncio.run(di.resolve_async(Service))
+    creator.join(timeout=5)
+
+    assert waiter is results[0]
+    assert created.value == 1
+
+
+def test_resolve_async_waits_for_warm_up_on_another_loop():
+    di = DI()
+    started = threading.Event()
+
+    async def create() -> Service:
+        started.set()
+        await asyncio.sleep(0.05)
+        return Service("warm")
+
+    di.register(Service).factory(create)
+    futures = di.warm_up([Service])
+    assert started.wait(timeout=5)
+
+    resolved = asyncio.run(di.resolve_async(Service))
+
+    assert resolved is futures[Service].result(timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_failed_async_singleton_can_be_retried():
+    di = DI()
+    attempts = Counter()
+
+    async def create() -> Service:
+        attempts.increment()
+        if attempts.value == 1:
+            raise RuntimeError("unavailable")
+        return Service("retried")
+
+    di.register(Service).factory(create)
+
+    with pytest.raises(RuntimeError, match="unavailable"):
+        await di.resolve_async(Service)
+    service = await di.resolve_async(Service)
+    assert service is not None
+    assert service.name == "retried"
@@ -0,0 +1,74 @@
+from typing import List, Optional
+
+import pytest
+
+from ps.di import DI, REQUIRED, BoundCallable, Lifetime
+
+from .conftest import Counter, Service
+
+
+def describe(service: Service, counter: Optional[Counter], services: List[Service], container: DI, suffix: str = "!") -> str:
+    return f"{service.name}:{counter is not None}:{len(services)}:{container is not None}{suffix}"
+
+
+def test_bind_resolves_dependencies_on_each_call():
+    di = DI()
+    di.register(Service, Lifetime.TRANSIENT).factory(lambda: Service("first"))
+    bound = di.bind(lambda service: service)
+
+    first = bound()
+    di.register(Service, Lifetime.TRANSIENT).factory(lambda: Service("second"))
+    second = bound()
+
+    assert isinstance(bound, BoundCallable)
+    assert first.name == "first"
+    assert second.name == "second"
+
+
+def test_bind_supports_positional_and_keyword_overrides():
+    di = DI()
+    di.register(Service).factory(lambda: Service("registered"))
+    bound = di.bind(describe, suffix="?")
+
+    assert bound() == "registered:False:1:True?"
+    assert bound(Service("positional")) == "positional:False:1:True?"
+    assert bound(Service("positional"), Counter()) == "positional:True:1:True?"
+    assert bound(suffix=".", counter=Counter()) == "registered:True:1:True."
+
+
+def test_bind_required_parameter_must_be_supplied():
+    di = DI()
+    di.register(Service).factory(lambda: Service("svc"))
+
+    def greet(service: Service, message: str) -> str:
+        return f"{service.name}:{message}"
+
+    bound = di.bind(greet, message=REQUIRED)
+
+    assert bound(message="hi") == "svc:hi"
+    with pytest.raises(TypeError):
+        bound()
+
+
+def test_bind_call_in_resolves_from_scope():
+    di = DI()
+    di.register(Service).factory(lambda: Service("root"))
+    bound = di.bind(describe)
+
+    with di.scope() as scope:
+        scope.register(Service).value(Service("scoped"))
+
+        assert bound.call_in(scope).startswith("scoped:")
+    assert bound().startswith("root:")
+
+
+def test_bind_exposes_dependencies():
+    di = DI()
+
+    def handler(service: Service, counter: Optional[Counter], container: DI, event_dispatcher, label: str) -> None:  # noqa: ANN001
+        pass
+
+    bound = di.bind(handler, label="x")
+
+    assert bound.dependencies == {"service": Service, "counter": Counter, "container": DI, "event_dispatcher": "eventdispatcher"}
+    assert (handler, False) in di._plan_cache
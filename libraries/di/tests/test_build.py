@@ -0,0 +1,168 @@
+from typing import List, Optional
+
+import pytest
+
+from ps.di import DI, Lazy
+
+from .conftest import ComplexService, Counter, DependentService, Service
+
+
+class Left:
+    def __init__(self, right: "Right") -> None:
+        self.right = right
+
+
+class Right:
+    def __init__(self, left: Left) -> None:
+        self.left = left
+
+
+class LazyLeft:
+    def __init__(self, right: Lazy["LazyRight"]) -> None:
+        self.right = right
+
+
+class LazyRight:
+    def __init__(self, left: LazyLeft) -> None:
+        self.left = left
+
+
+class Untyped:
+    def __init__(self, event_dispatcher) -> None:  # noqa: ANN001
+        self.event_dispatcher = event_dispatcher
+
+
+def test_build_accepts_complete_graph():
+    di = DI()
+    di.register(Service).factory(lambda: Service("svc"))
+    di.register(DependentService).implementation(DependentService)
+    di.register(ComplexService).factory(ComplexService, name="complex")
+
+    assert di.build() is di
+    assert (DependentService, False) in di._plan_cache
+
+
+def test_build_reports_missing_dependency():
+    di = DI()
+    di.register(DependentService).implementation(DependentService)
+
+    with pytest.raises(ValueError, match=r"Cannot resolve required dependency .*Service.* for parameter service of DependentService"):
+        di.build()
+
+
+def test_build_ignores_optional_defaulted_and_bound_parameters():
+    di = DI()
+
+    class Consumer:
+        def __init__(self, name: str, counter: Optional[Counter], services: List[Service], label: str = "x") -> None:
+            self.name = name
+
+    di.register(Consumer).factory(Consumer, name="bound")
+
+    di.build()
+
+
+def test_build_reports_untyped_parameter_without_match():
+    di = DI()
+    di.register(Untyped).implementation(Untyped)
+
+    with pytest.raises(ValueError, match="untyped parameter event_dispatcher of Untyped"):
+        di.build()
+
+
+def test_build_reports_cycle():
+    di = DI()
+    di.register(Left).implementation(Left)
+    di.register(Right).implementation(Right)
+
+    with pytest.raises(ValueError, match="Dependency cycle: Left -> Right -> Left"):
+        di.build()
+
+
+def test_build_allows_cycle_broken_by_lazy():
+    di = DI()
+    di.register(LazyLeft).implementation(LazyLeft)
+    di.register(LazyRight).implementation(LazyRight)
+
+    di.build()
+    right = di.resolve(LazyRight)
+
+    assert right is not None
+    assert right.left.right.value is right
+
+
+def test_build_reports_all_problems():
+    di = DI()
+    di.register(DependentService).implementation(DependentService)
+    di.register(Left).implementation(Left)
+    di.register(Right).implementation(Right)
+
+    with pytest.raises(ValueError) as exc_info:
+        di.build()
+
+    message = str(exc_info.value)
+    assert "Cannot resolve required dependency" in message
+    assert "Dependency cycle" in message
+
+
+def test_scope_build_sees_parent_and_scoped_values():
+    di = DI()
+    di.register(Counter).factory(Counter)
+    scope = di.scope()
+    scope.register(Service).value(Service("scoped"))
+    scope.register(DependentService).implementation(DependentService)
+
+    scope.build()
+
+
+def test_freeze_rejects_registration_but_allows_scopes():
+    di = DI()
+    di.register(Service).factory(lambda: Service("svc"))
+
+    di.freeze()
+
+    assert di.frozen
+    with pytest.raises(ValueError, match="frozen"):
+        di.register(Counter)
+    scope = di.scope()
+    scope.register(Counter).factory(Counter)
+    assert scope.resolve(Counter) is not None
+    service = di.resolve(Service)
+    assert service is not None
+    assert service.name == "svc"
+
+
+def test_freeze_validates_before_freezing():
+    di = DI()
+    di.register(DependentService).implementation(DependentService)
+
+    with pytest.raises(ValueError):
+        di.freeze()
+
+    assert not di.frozen
+
+
+def test_freeze_rejects_bindings_obtained_before_freezing():
+    di = DI()
+    di.register(Service).factory(lambda: Service("svc"))
+    implementation = di.register(DependentService)
+    value = di.register(Counter)
+
+    di.freeze()
+
+    with pytest.raises(ValueError, match="frozen"):
+        implementation.implementation(DependentService)
+    with pytest.raises(ValueError, match="frozen"):
+        value.value(Counter())
+    assert di.resolve(DependentService) is None
+    assert di.resolve(Counter) is None
+
+
+def test_frozen_scope_rejects_pending_value_binding():
+    scope = DI().scope()
+    binding = scope.register(Service)
+
+    scope.freeze()
+
+    with pytest.raises(ValueError, match="frozen"):
+        binding.value(Service("late"))
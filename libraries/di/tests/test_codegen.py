@@ -0,0 +1,107 @@
+from typing import List, Optional
+
+import pytest
+
+from ps.di import DI, Lazy, Lifetime
+
+from .conftest import ComplexService, Counter, DependentService, Service
+
+
+class Everything:
+    def __init__(
+        self,
+        service: Service,
+        container: DI,
+        counter: Optional[Counter],
+        services: List[Service],
+        lazy: Lazy[Service],
+        untyped="fallback",  # noqa: ANN001
+        *,
+        label: str = "label",
+    ) -> None:
+        self.service = service
+        self.container = container
+        self.counter = counter
+        self.services = services
+        self.lazy = lazy
+        self.untyped = untyped
+        self.label = label
+
+
+class DependentCounter:
+    def __init__(self, counter: Counter) -> None:
+        self.counter = counter
+
+
+class VariadicService:
+    def __init__(self, service: Service, **options) -> None:  # noqa: ANN003
+        self.service = service
+        self.options = options
+
+
+def test_compiled_factory_matches_generic_spawn():
+    di = DI(compile_factories=True)
+    di.register(Service).factory(lambda: Service("svc"))
+
+    instance = di.spawn(Everything)
+
+    assert instance.service.name == "svc"
+    assert instance.container is di
+    assert instance.counter is None
+    assert [service.name for service in instance.services] == ["svc"]
+    assert instance.lazy.value is instance.service
+    assert instance.untyped == "fallback"
+    assert instance.label == "label"
+    assert di._factories is not None
+    assert callable(di._factories[Everything])
+
+
+def test_compiled_factory_resolves_optional_and_reports_missing_dependency():
+    di = DI(compile_factories=True)
+    di.register(Service).factory(lambda: Service("svc"))
+    di.register(str).value("named")
+
+    complex_service = di.spawn(ComplexService)
+
+    assert complex_service.name == "named"
+    assert complex_service.service.name == "svc"
+    assert complex_service.counter is None
+    with pytest.raises(ValueError, match=r"Cannot resolve required dependency .*Counter.* for parameter counter"):
+        di.spawn(DependentCounter)
+
+
+def test_compiled_factory_resolves_through_calling_scope():
+    di = DI(compile_factories=True)
+    di.register(Service).factory(lambda: Service("root"))
+    di.register(DependentService, Lifetime.SCOPED).implementation(DependentService)
+
+    with di.scope() as scope:
+        scope.register(Service).value(Service("scoped"))
+
+        dependent = scope.resolve(DependentService)
+        assert dependent is not None
+        assert dependent.service.name == "scoped"
+        assert di.spawn(DependentService).service.name == "root"
+    assert di._factories is not None
+    assert DependentService in di._factories
+
+
+def test_compiled_factory_falls_back_for_explicit_arguments_and_variadics():
+    di = DI(compile_factories=True)
+    di.register(Service).factory(lambda: Service("svc"))
+
+    variadic = di.spawn(VariadicService)
+
+    assert di.spawn(DependentService, Service("explicit")).service.name == "explicit"
+    assert variadic.service.name == "svc"
+    assert di._factories is not None
+    assert di._factories[VariadicService] is None
+
+
+def test_factories_are_not_compiled_by_default():
+    di = DI()
+    di.register(Service).factory(lambda: Service("svc"))
+
+    di.spawn(DependentService)
+
+    assert di._factories is None
@@ -0,0 +1,63 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from ps.di import DI, ContextExecutor, Lifetime, current_scope, use_scope
+
+from .conftest import Counter, Service
+
+
+def test_use_scope_sets_and_restores_current_scope():
+    di = DI()
+    scope = di.scope()
+
+    assert current_scope() is None
+    with use_scope(di):
+        with use_scope(scope) as active:
+            assert active is scope
+            assert current_scope() is scope
+        assert current_scope() is di
+    assert current_scope() is None
+
+
+def test_plain_executor_does_not_propagate_current_scope():
+    di = DI()
+
+    with use_scope(di), ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(current_scope).result(timeout=5) is None
+
+
+def test_context_executor_propagates_current_scope():
+    di = DI()
+
+    with use_scope(di), ContextExecutor(ThreadPoolExecutor(max_workers=2)) as executor:
+        results = list(executor.map(lambda _: current_scope(), range(4)))
+
+    assert all(result is di for result in results)
+
+
+def test_worker_scopes_have_their_own_scoped_singletons():
+    di = DI()
+    di.register(Counter, Lifetime.SCOPED).factory(Counter)
+    barrier = threading.Barrier(2)
+
+    def work(name: str) -> tuple[Optional[Service], Optional[Counter]]:
+        parent = current_scope()
+        assert parent is not None
+        with parent.scope() as scope, use_scope(scope):
+            scope.register(Service).value(Service(name))
+            barrier.wait(timeout=5)
+            counter = scope.resolve(Counter)
+            assert counter is scope.resolve(Counter)
+            assert current_scope() is scope
+            return scope.resolve(Service), counter
+
+    with use_scope(di), ContextExecutor(ThreadPoolExecutor(max_workers=2)) as executor:
+        (first_service, first_counter), (second_service, second_counter) = executor.map(work, ["first", "second"])
+
+    assert first_service is not None
+    assert second_service is not None
+    assert first_service.name == "first"
+    assert second_service.name == "second"
+    assert first_counter is not second_counter
+    assert current_scope() is None
@@ -3,6 +3,7 @@ import threading
 from typing import List, Optional
 
 from ps.di import DI, Binding, Lifetime, Priority, REQUIRED
+from ps.di._registration import _Registration, _Registrations
 
 
 class Counter:
@@ -226,6 +227,57 @@ def test_concurrent_registration_and_resolution():
     assert len(results) == 5
 
 
+def test_resolve_does_not_wait_for_registration_lock():
+    di = DI()
+    di.register(Service).factory(lambda: Service("lock-free"))
+    di.resolve(Service)
+    results: List[Optional[Service]] = []
+
+    with di._lock_registry_access:
+        thread = threading.Thread(target=lambda: results.append(di.resolve(Service)))
+        thread.start()
+        thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert results[0] is not None
+
+
+def test_resolve_never_sees_unpopulated_registration(monkeypatch):
+    di = DI()
+    seen: List[Optional[Service]] = []
+    add_registration = _Registrations.add_registration
+
+    def add_and_probe(registrations: _Registrations, registration: _Registration) -> None:
+        probe = threading.Thread(target=lambda: seen.append(di.resolve(Service)))
+        probe.start()
+        probe.join(timeout=5)
+        add_registration(registrations, registration)
+
+    monkeypatch.setattr(_Registrations, "add_registration", add_and_probe)
+    di.register(Service).factory(lambda: Service("svc"))
+
+    service = di.resolve(Service)
+
+    assert seen == [None]
+    assert service is not None
+    assert service.name == "svc"
+
+
+def test_resolve_many_uses_snapshot_taken_before_iteration():
+    di = DI()
+
+    def create_and_register() -> Service:
+        di.register(Service).factory(lambda: Service("late"))
+        return Service("first")
+
+    di.register(Service, Lifetime.TRANSIENT).factory(create_and_register)
+
+    services = di.resolve_many(Service)
+
+    assert [service.name for service in services] == ["first"]
+    assert len(di.resolve_many(Service)) == 2
+
+
 def test_resolve_many_concurrent():
     di = DI()
     for i in range(5):
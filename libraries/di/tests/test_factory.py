@@ -111,14 +111,15 @@ def test_factory_injects_di_itself():
 
 def test_factory_raises_when_required_param_cannot_be_resolved():
     di = DI()
+    di.register(DependentService).factory(DependentService)
 
     with pytest.raises(ValueError) as exc_info:
-        di.register(DependentService).factory(DependentService)
+        di.resolve(DependentService)
 
     assert "Cannot resolve required dependency" in str(exc_info.value)
 
 
-def test_factory_captures_dependencies_at_registration_time():
+def test_factory_resolves_dependencies_when_invoked():
     di = DI()
     di.register(Service).factory(lambda: Service("original"))
 
@@ -129,7 +130,7 @@ def test_factory_captures_dependencies_at_registration_time():
     result = di.resolve(DependentService)
 
     assert result is not None
-    assert result.service.name == "original"
+    assert result.service.name == "updated"
 
 
 def test_factory_mixed_explicit_and_di_resolved():
@@ -0,0 +1,120 @@
+import threading
+from typing import List, Optional
+
+import pytest
+
+from ps.di import DI, Lazy, Lifetime, Provider
+
+from .conftest import Counter, Service
+
+
+class LazyConsumer:
+    def __init__(self, service: Lazy[Service]) -> None:
+        self.service = service
+
+
+class ProviderConsumer:
+    def __init__(self, service: Provider[Service]) -> None:
+        self.service = service
+
+
+def _counting_di(lifetime: Lifetime = Lifetime.SINGLETON) -> tuple[DI, Counter]:
+    di = DI()
+    created = Counter()
+
+    def create() -> Service:
+        created.increment()
+        return Service(f"service-{created.value}")
+
+    di.register(Service, lifetime).factory(create)
+    return di, created
+
+
+def test_lazy_defers_resolution_until_first_access():
+    di, created = _counting_di()
+
+    consumer = di.spawn(LazyConsumer)
+
+    assert created.value == 0
+    assert not consumer.service.is_resolved
+    assert consumer.service.value.name == "service-1"
+    assert consumer.service.is_resolved
+
+
+def test_lazy_caches_transient_value():
+    di, created = _counting_di(Lifetime.TRANSIENT)
+
+    consumer = di.spawn(LazyConsumer)
+
+    assert consumer.service.value is consumer.service.value
+    assert created.value == 1
+
+
+def test_lazy_resolves_once_under_concurrent_access():
+    di, created = _counting_di(Lifetime.TRANSIENT)
+    consumer = di.spawn(LazyConsumer)
+    results: List[Service] = []
+
+    threads = [threading.Thread(target=lambda: results.append(consumer.service.value)) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert created.value == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_lazy_raises_on_access_when_missing():
+    consumer = DI().spawn(LazyConsumer)
+
+    with pytest.raises(ValueError, match="Cannot resolve required dependency"):
+        _ = consumer.service.value
+
+
+def test_lazy_optional_resolves_none_when_missing():
+    def fn(service: Lazy[Optional[Service]]) -> Optional[Service]:
+        return service.value
+
+    assert DI().satisfy(fn)() is None
+
+
+def test_lazy_resolves_from_scope():
+    di = DI()
+
+    with di.scope() as scope:
+        scope.register(Service).value(Service("scoped"))
+        consumer = scope.spawn(LazyConsumer)
+
+        assert consumer.service.value.name == "scoped"
+
+
+def test_provider_resolves_on_every_call():
+    di, created = _counting_di(Lifetime.TRANSIENT)
+
+    consumer = di.spawn(ProviderConsumer)
+
+    assert created.value == 0
+    assert consumer.service() is not consumer.service()
+    assert created.value == 2
+
+
+def test_provider_of_list_resolves_many():
+    di = DI()
+    di.register(Service).factory(lambda: Service("first"))
+    di.register(Service).factory(lambda: Service("second"))
+
+    def fn(services: Provider[List[Service]]) -> List[Service]:
+        return services()
+
+    assert [service.name for service in di.satisfy(fn)()] == ["second", "first"]
+
+
+@pytest.mark.asyncio
+async def test_spawn_async_injects_lazy_handle():
+    di, created = _counting_di()
+
+    consumer = await di.spawn_async(LazyConsumer)
+
+    assert created.value == 0
+    assert consumer.service.value.name == "service-1"
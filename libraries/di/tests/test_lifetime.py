@@ -1,9 +1,33 @@
 import threading
-from typing import List
+from typing import List, Optional, Self
+
+import pytest
 
 from ps.di import DI, Lifetime
 
-from .conftest import Counter, Service
+from .conftest import Counter, DependentService, Service
+
+
+class Resource:
+    def __init__(self, log: List[str], name: str = "resource") -> None:
+        self.log = log
+        self.name = name
+
+    def close(self) -> None:
+        self.log.append(f"close {self.name}")
+
+
+class ContextResource(Resource):
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.log.append(f"exit {self.name}")
+
+
+class AsyncResource(Resource):
+    async def aclose(self) -> None:
+        self.log.append(f"aclose {self.name}")
 
 
 def test_singleton_returns_same_instance():
@@ -128,3 +152,128 @@ def test_resolve_many_concurrent():
 
     assert len(results) == 10
     assert all(len(services) == 5 for services in results)
+
+
+def test_scoped_returns_same_instance_within_scope():
+    di = DI()
+    di.register(Service, Lifetime.SCOPED).factory(lambda: Service("scoped"))
+
+    with di.scope() as first, di.scope() as second:
+        assert first.resolve(Service) is first.resolve(Service)
+        assert first.resolve(Service) is not second.resolve(Service)
+
+
+def test_scoped_instance_not_shared_with_parent():
+    di = DI()
+    di.register(Service, Lifetime.SCOPED).factory(lambda: Service("scoped"))
+    scope = di.scope()
+
+    assert scope.resolve(Service) is not di.resolve(Service)
+    assert di.resolve(Service) is di.resolve(Service)
+
+
+def test_scoped_implementation_resolves_from_scope():
+    di = DI()
+    di.register(DependentService, Lifetime.SCOPED).implementation(DependentService)
+
+    with di.scope() as scope:
+        scope.register(Service).value(Service("event"))
+        dependent = scope.resolve(DependentService)
+        assert dependent is not None
+        assert dependent.service.name == "event"
+
+
+def test_scoped_factory_resolves_from_scope():
+    di = DI()
+    di.register(DependentService, Lifetime.SCOPED).factory(DependentService)
+
+    with di.scope() as scope:
+        scope.register(Service).value(Service("event"))
+        dependent = scope.resolve(DependentService)
+        assert dependent is not None
+        assert dependent.service.name == "event"
+
+
+def test_scopes_create_same_scoped_service_concurrently():
+    di = DI()
+    both_creating = threading.Barrier(2)
+
+    def create() -> Service:
+        both_creating.wait(timeout=5)
+        return Service("scoped")
+
+    di.register(Service, Lifetime.SCOPED).factory(create)
+    first, second = di.scope(), di.scope()
+    results: dict[str, Optional[Service]] = {}
+
+    def resolve_into(key: str, scope: DI) -> None:
+        results[key] = scope.resolve(Service)
+
+    threads = [threading.Thread(target=resolve_into, args=("first", first)), threading.Thread(target=resolve_into, args=("second", second))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results["first"] is not results["second"]
+    assert first.resolve(Service) is results["first"]
+    assert second.resolve(Service) is results["second"]
+
+
+def test_scope_exit_disposes_scoped_instances_in_reverse_order():
+    log: List[str] = []
+    di = DI()
+    di.register(Resource, Lifetime.SCOPED).factory(lambda: Resource(log, "first"))
+    di.register(ContextResource, Lifetime.SCOPED).factory(lambda: ContextResource(log, "second"))
+
+    with di.scope() as scope:
+        scope.resolve(Resource)
+        scope.resolve(ContextResource)
+        assert log == []
+
+    assert log == ["exit second", "close first"]
+
+
+def test_scope_exit_does_not_dispose_singletons():
+    log: List[str] = []
+    di = DI()
+    di.register(Resource).factory(lambda: Resource(log))
+
+    with di.scope() as scope:
+        scope.resolve(Resource)
+
+    assert log == []
+
+
+def test_scope_exit_disposes_all_and_raises_first_error():
+    log: List[str] = []
+
+    class Failing:
+        def close(self) -> None:
+            raise RuntimeError("close failed")
+
+    di = DI()
+    di.register(Resource, Lifetime.SCOPED).factory(lambda: Resource(log))
+    di.register(Failing, Lifetime.SCOPED).factory(Failing)
+    scope = di.scope()
+    scope.resolve(Resource)
+    scope.resolve(Failing)
+
+    with pytest.raises(RuntimeError, match="close failed"):
+        scope.__exit__(None, None, None)
+
+    assert log == ["close resource"]
+
+
+@pytest.mark.asyncio
+async def test_async_scope_exit_awaits_async_disposal():
+    log: List[str] = []
+    di = DI()
+    di.register(Resource, Lifetime.SCOPED).factory(lambda: Resource(log, "sync"))
+    di.register(AsyncResource, Lifetime.SCOPED).factory(lambda: AsyncResource(log, "async"))
+
+    async with di.scope() as scope:
+        scope.resolve(Resource)
+        scope.resolve(AsyncResource)
+
+    assert log == ["aclose async", "close sync"]
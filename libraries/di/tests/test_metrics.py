@@ -0,0 +1,117 @@
+from typing import Any, List
+
+import pytest
+
+from ps.di import DI, Lifetime
+
+from .conftest import Counter, DependentService, Service
+
+
+def test_metrics_disabled_by_default():
+    assert DI().metrics is None
+
+
+def test_metrics_count_resolves_and_factory_calls():
+    di = DI(instrument=True)
+    di.register(Service).factory(lambda: Service("singleton"))
+    di.register(Counter, Lifetime.TRANSIENT).factory(Counter)
+
+    for _ in range(3):
+        di.resolve(Service)
+        di.resolve(Counter)
+
+    metrics = di.metrics
+    assert metrics is not None
+    assert metrics.resolve_counts[Service] == 3
+    assert metrics.resolve_counts[Counter] == 3
+    assert metrics.factory_calls[Service] == 1
+    assert metrics.factory_calls[Counter] == 3
+    assert metrics.singletons_created[Service] == 1
+    assert Counter not in metrics.singletons_created
+
+
+def test_metrics_count_injected_dependencies_and_plan_cache():
+    di = DI(instrument=True)
+    di.register(Service).factory(lambda: Service("svc"))
+
+    di.spawn(DependentService)
+    di.spawn(DependentService)
+
+    metrics = di.metrics
+    assert metrics is not None
+    assert metrics.resolve_counts[Service] == 2
+    assert metrics.plan_cache_misses >= 1
+    assert metrics.plan_cache_hits >= 1
+
+
+def test_scopes_share_parent_metrics():
+    di = DI(instrument=True)
+    di.register(Service).factory(lambda: Service("svc"))
+
+    with di.scope() as scope:
+        scope.resolve(Service)
+
+    assert di.metrics is not None
+    assert di.metrics.resolve_counts[Service] == 1
+
+
+def test_tracer_receives_resolve_and_create_events():
+    events: List[tuple[str, Any, float]] = []
+    di = DI(tracer=lambda kind, key, duration: events.append((kind, key, duration)))
+    di.register(Service).factory(lambda: Service("svc"))
+
+    di.resolve(Service)
+    di.resolve_many(Service)
+
+    assert [(kind, key) for kind, key, _ in events] == [
+        ("create", Service),
+        ("resolve", Service),
+        ("resolve_many", Service),
+    ]
+    assert all(duration >= 0 for _, _, duration in events)
+
+
+@pytest.mark.asyncio
+async def test_metrics_record_async_factories():
+    di = DI(instrument=True)
+
+    async def create() -> Service:
+        return Service("async")
+
+    di.register(Service).factory(create)
+
+    await di.resolve_async(Service)
+
+    assert di.metrics is not None
+    assert di.metrics.factory_calls[Service] == 1
+    assert di.metrics.resolve_counts[Service] == 1
+
+
+def test_format_report_lists_hot_types_first():
+    di = DI(instrument=True)
+    di.register(Service).factory(lambda: Service("svc"))
+    di.register(Counter, Lifetime.TRANSIENT).factory(Counter)
+    di.resolve(Service)
+    for _ in range(5):
+        di.resolve(Counter)
+
+    assert di.metrics is not None
+    lines = di.metrics.format_report().splitlines()
+
+    assert lines[0].split() == ["type", "resolves", "creates", "factory", "ms"]
+    assert lines[1].startswith("Counter")
+    assert lines[1].split()[1:3] == ["5", "5"]
+    assert lines[-1].startswith("plan cache:")
+
+
+def test_reset_clears_metrics():
+    di = DI(instrument=True)
+    di.register(Service).factory(lambda: Service("svc"))
+    di.resolve(Service)
+    metrics = di.metrics
+    assert metrics is not None
+
+    metrics.reset()
+
+    assert not metrics.resolve_counts
+    assert metrics.plan_cache_hits == 0
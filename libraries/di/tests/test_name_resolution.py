@@ -0,0 +1,86 @@
+import pytest
+
+from ps.di import DI
+
+from .conftest import Counter, Service
+
+
+class EventDispatcher:
+    pass
+
+
+def _shadowing_service() -> type:
+    class Service:
+        pass
+
+    return Service
+
+
+def test_untyped_parameter_resolved_by_normalized_name():
+    di = DI()
+    dispatcher = EventDispatcher()
+    di.register(EventDispatcher).factory(lambda: dispatcher)
+
+    def fn(event_dispatcher):  # type: ignore
+        return event_dispatcher
+
+    assert di.satisfy(fn)() is dispatcher
+
+
+def test_untyped_parameter_without_match_uses_default():
+    di = DI()
+    di.register(Counter).factory(Counter)
+
+    def fn(event_dispatcher=None):  # type: ignore
+        return event_dispatcher
+
+    assert di.satisfy(fn)() is None
+
+
+def test_string_resolution_prefers_first_registered_type():
+    di = DI()
+    di.register(Service).factory(lambda: Service("first"))
+    di.register(_shadowing_service()).factory(lambda: "second")
+
+    resolved = di.resolve("Service")
+
+    assert isinstance(resolved, Service)
+
+
+def test_string_resolution_sees_later_registrations():
+    di = DI()
+    with pytest.raises(ValueError, match="Cannot resolve type from string"):
+        di.resolve("Counter")
+
+    di.register(Counter).factory(Counter)
+
+    assert isinstance(di.resolve("Counter"), Counter)
+
+
+def test_scoped_name_resolution_falls_through_to_parent():
+    di = DI()
+    dispatcher = EventDispatcher()
+    di.register(EventDispatcher).factory(lambda: dispatcher)
+    scope = di.scope()
+    scope.register(Counter).factory(Counter)
+
+    def fn(event_dispatcher, counter):  # type: ignore
+        return event_dispatcher, counter
+
+    resolved_dispatcher, counter = scope.satisfy(fn)()
+
+    assert resolved_dispatcher is dispatcher
+    assert isinstance(counter, Counter)
+
+
+def test_scoped_name_resolution_prefers_scope():
+    di = DI()
+    di.register(EventDispatcher).factory(EventDispatcher)
+    scope = di.scope()
+    scoped = EventDispatcher()
+    scope.register(EventDispatcher).factory(lambda: scoped)
+
+    def fn(event_dispatcher):  # type: ignore
+        return event_dispatcher
+
+    assert scope.satisfy(fn)() is scoped
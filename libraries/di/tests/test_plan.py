@@ -0,0 +1,69 @@
+import inspect
+from typing import Callable, List, Optional
+from unittest.mock import patch
+
+from ps.di import DI, Lifetime
+from ps.di._plan import _compile_plan, _Strategy
+
+from .conftest import Counter, DependentService, Service
+
+
+def _strategies(fn: Callable, skip_self: bool = False) -> dict[str, _Strategy]:
+    plan, _ = _compile_plan(fn, inspect.signature(fn), skip_self, DI)
+    return {param.name: param.strategy for param in plan}
+
+
+def test_compile_plan_classifies_parameters():
+    def fn(di: DI, services: List[Service], counter: Optional[Counter], service: Service, application) -> None:  # noqa: ANN001
+        pass
+
+    assert _strategies(fn) == {
+        "di": _Strategy.CONTAINER,
+        "services": _Strategy.MANY,
+        "counter": _Strategy.OPTIONAL,
+        "service": _Strategy.TYPE,
+        "application": _Strategy.NAME,
+    }
+
+
+def test_compile_plan_skips_self_for_constructors():
+    assert list(_strategies(DependentService.__init__, skip_self=True)) == ["service"]
+
+
+def test_spawn_compiles_plan_once():
+    di = DI()
+    di.register(Service, Lifetime.TRANSIENT).factory(lambda: Service("s"))
+
+    with patch("ps.di._plan.get_type_hints", wraps=inspect.get_annotations) as hints:
+        first = di.spawn(DependentService)
+        second = di.spawn(DependentService)
+
+    assert hints.call_count == 1
+    assert first.service is not second.service
+
+
+def test_plan_with_unresolvable_hints_is_not_cached():
+    di = DI()
+
+    def fn(service=None) -> None:  # noqa: ANN001
+        pass
+
+    fn.__annotations__["service"] = "Undefined"
+
+    di._get_plan(fn, skip_self=False)
+
+    assert (fn, False) not in di._plan_cache
+
+
+def test_plan_resolves_registrations_added_after_compilation():
+    di = DI()
+
+    def fn(service: Optional[Service] = None) -> Optional[Service]:
+        return service
+
+    assert di.satisfy(fn)() is None
+    di.register(Service).factory(lambda: Service("late"))
+
+    result = di.satisfy(fn)()
+    assert result is not None
+    assert result.name == "late"
@@ -133,3 +133,32 @@ def test_priority_mixed_with_default():
     assert len(services) == 4
     assert services[0].name == "high"
     assert services[1].name == "medium"
+
+
+def test_resolve_many_reuses_singleton_results_until_registration_changes():
+    di = DI()
+    di.register(Service, priority=Priority.LOW).factory(lambda: Service("low"))
+    di.register(Service, priority=Priority.HIGH).factory(lambda: Service("high"))
+
+    first = di.resolve_many(Service)
+    second = di.resolve_many(Service)
+    first.clear()
+
+    assert [service.name for service in second] == ["high", "low"]
+    assert di._registry[Service].resolve_all(di) is di._registry[Service].resolve_all(di)
+
+    di.register(Service, priority=Priority.MEDIUM).factory(lambda: Service("medium"))
+
+    assert [service.name for service in di.resolve_many(Service)] == ["high", "medium", "low"]
+
+
+def test_resolve_many_does_not_cache_transient_results():
+    di = DI()
+    di.register(Service).factory(lambda: Service("singleton"))
+    di.register(Service, lifetime=Lifetime.TRANSIENT).factory(lambda: Service("transient"))
+
+    first = di.resolve_many(Service)
+    second = di.resolve_many(Service)
+
+    assert first[0] is not second[0]
+    assert first[1] is second[1]
@@ -316,3 +316,60 @@ def test_scope_context_manager_returns_di_instance():
 
     with di.scope() as scoped:
         assert isinstance(scoped, DI)
+
+
+def test_scope_shares_parent_caches():
+    di = DI()
+    di.spawn(Counter)
+
+    with di.scope() as scoped:
+        nested = scoped.scope()
+        assert nested._plan_cache is di._plan_cache
+        assert nested._signature_cache is di._signature_cache
+
+    assert di._plan_cache
+
+
+def test_scope_value_overrides_parent():
+    di = DI()
+    di.register(Service).factory(lambda: Service("parent"))
+    scoped = di.scope()
+    override = Service("value")
+
+    scoped.register(Service).value(override)
+
+    assert scoped.resolve(Service) is override
+    assert scoped.resolve("Service") is override
+    assert [s.name for s in scoped.resolve_many(Service)] == ["value", "parent"]
+    parent = di.resolve(Service)
+    assert parent is not None
+    assert parent.name == "parent"
+
+
+def test_scope_value_injected_into_spawn():
+    di = DI()
+    scoped = di.scope()
+    scoped.register(Service).value(Service("value"))
+
+    instance = scoped.spawn(DependentService)
+
+    assert instance.service.name == "value"
+
+
+def test_scope_value_released_on_exit():
+    di = DI()
+
+    with di.scope() as scoped:
+        scoped.register(Service).value(Service("value"))
+
+    assert scoped.resolve(Service) is None
+
+
+def test_value_on_root_registers_singleton_instance():
+    di = DI()
+    instance = Service("value")
+
+    di.register(Service).value(instance)
+
+    assert di.resolve(Service) is instance
+    assert di.resolve_many(Service) == [instance]
@@ -0,0 +1,116 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+
+from ps.di import DI, Lifetime
+
+from .conftest import Counter, DependentService, Service
+
+
+def test_warm_up_creates_singleton_in_background():
+    di = DI()
+    created = Counter()
+
+    def create() -> Service:
+        created.increment()
+        return Service("warm")
+
+    di.register(Service).factory(create)
+
+    futures = di.warm_up([Service])
+    warmed = futures[Service].result(timeout=5)
+
+    assert di.resolve(Service) is warmed
+    assert created.value == 1
+
+
+def test_resolve_waits_for_in_flight_warm_up():
+    di = DI()
+    created = Counter()
+    started = threading.Event()
+    release = threading.Event()
+
+    def create() -> Service:
+        created.increment()
+        started.set()
+        release.wait(timeout=5)
+        return Service("warm")
+
+    di.register(Service).factory(create)
+    futures = di.warm_up([Service])
+    assert started.wait(timeout=5)
+
+    threading.Timer(0.05, release.set).start()
+    resolved = di.resolve(Service)
+
+    assert resolved is futures[Service].result(timeout=5)
+    assert created.value == 1
+
+
+def test_warm_up_orders_dependencies_first():
+    di = DI()
+    order: List[str] = []
+
+    def create_service() -> Service:
+        order.append("service")
+        return Service("dependency")
+
+    class Dependent(DependentService):
+        def __init__(self, service: Service) -> None:
+            order.append("dependent")
+            super().__init__(service)
+
+    di.register(Service).factory(create_service)
+    di.register(DependentService).implementation(Dependent)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        futures = di.warm_up([DependentService], executor=executor)
+        dependent = futures[DependentService].result(timeout=5)
+
+    assert order == ["service", "dependent"]
+    assert list(futures) == [Service, DependentService]
+    assert dependent.service is di.resolve(Service)
+
+
+def test_warm_up_skips_non_singletons_and_created_instances():
+    di = DI()
+    di.register(Service, Lifetime.TRANSIENT).factory(lambda: Service("transient"))
+    di.register(Counter).factory(Counter)
+    di.resolve(Counter)
+
+    assert di.warm_up([Service, Counter, DependentService]) == {}
+
+
+def test_warm_up_runs_async_factories():
+    di = DI()
+
+    async def create() -> Service:
+        return Service("async")
+
+    di.register(Service).factory(create)
+
+    futures = di.warm_up([Service])
+
+    assert futures[Service].result(timeout=5).name == "async"
+    assert di.resolve(Service) is futures[Service].result()
+
+
+def test_warm_up_failure_is_reported_and_retried_on_resolve():
+    di = DI()
+    attempts = Counter()
+
+    def create() -> Service:
+        attempts.increment()
+        raise RuntimeError("unavailable")
+
+    di.register(Service).factory(create)
+
+    futures = di.warm_up([Service])
+
+    with pytest.raises(RuntimeError, match="unavailable"):
+        futures[Service].result(timeout=5)
+    with pytest.raises(RuntimeError, match="unavailable"):
+        di.resolve(Service)
+    assert attempts.value == 2
@@ -110,7 +110,7 @@ class CheckModule:
         self._di = di
         self._exit_code: Optional[int] = None
 
-    def poetry_activate(self, application: Application) -> bool:
+    def poetry_register(self, application: Application) -> list[str]:
         ensure_argument(CheckCommand, Argument(
             name="inputs",
             description="Optional inputs pointers to check. It could be project names or paths. If not provided, all discovered projects will be checked.",
@@ -129,7 +129,8 @@ class CheckModule:
             shortcut="c",
             flag=True)
         )
-        return True
+        assert CheckCommand.name is not None
+        return [CheckCommand.name]
 
     def poetry_command(self, event: ConsoleCommandEvent) -> None:
         if not isinstance(event.command, CheckCommand):
@@ -12,7 +12,7 @@ from poetry.console.application import Application
 from poetry.console.commands.build import BuildCommand
 from poetry.console.commands.publish import PublishCommand
 
-from ps.di import DI
+from ps.di import DI, use_scope
 from ps.plugin.sdk.events import ensure_argument, ensure_option
 from ps.plugin.sdk.project import Environment, filter_projects
 from ps.version import Version
@@ -50,13 +50,7 @@ class DeliveryModule:
     def __init__(self) -> None:
         self._exit_code: Optional[int] = None
 
-    def poetry_activate(
-        self,
-        application: Application,
-        environment: Environment,
-        di: DI,
-        io: IO
-    ) -> bool:
+    def poetry_register(self, application: Application, di: DI) -> list[str]:
         # Extend the BuildCommand with an optional "inputs" argument
         ensure_argument(BuildCommand, Argument(
             name=INPUTS_ARGUMENT,
@@ -84,7 +78,12 @@ class DeliveryModule:
         )
 
         application.add(di.spawn(DeliveryCommand))
+        assert BuildCommand.name is not None
+        assert PublishCommand.name is not None
+        assert DeliveryCommand.name is not None
+        return [BuildCommand.name, PublishCommand.name, DeliveryCommand.name]
 
+    def poetry_activate(self, environment: Environment, di: DI, io: IO) -> bool:
         di.register(TokenResolverEntry).factory(lambda: ("env", EnvResolver()))
         di.register(TokenResolverEntry).factory(lambda: ("rand", RandResolver()))
         di.register(TokenResolverEntry).factory(lambda: ("v", VersionResolver()))
@@ -126,57 +125,58 @@ class DeliveryModule:
             event.io.write_line("<comment>No projects found to process.</comment>")
             return
 
-        try:
-            environment.backup_projects(filtered_projects)
-
-            # Patch all projects
-            patch_exit_code = patch_projects(event.io, filtered_projects, environment_metadata)
-            if patch_exit_code != 0:
-                self._exit_code = patch_exit_code
-                return
-
-            # Execute build or publish command
-            is_publish = isinstance(event.command, PublishCommand)
-            opts = event.io.input.options
-
-            needs_build = not is_publish or opts.get("build")
-            if needs_build:
-                build_exit_code = build_projects(
-                    event.io,
-                    filtered_projects,
-                    formats=BuildCommand._prepare_formats(opts.get("format")) if not is_publish else None,
-                    clean=bool(opts.get("clean")) if not is_publish else False,
-                    output=(opts.get("output") if not is_publish else opts.get("dist-dir")) or "dist",
-                    config_settings=BuildCommand._prepare_config_settings(
-                        local_version=opts.get("local-version"),
-                        config_settings=opts.get("config-settings"),
-                        io=event.io,
-                    ) if not is_publish else None,
-                )
-                if build_exit_code != 0:
-                    self._exit_code = build_exit_code
+        with use_scope(di):
+            try:
+                environment.backup_projects(filtered_projects)
+
+                # Patch all projects
+                patch_exit_code = patch_projects(event.io, filtered_projects, environment_metadata)
+                if patch_exit_code != 0:
+                    self._exit_code = patch_exit_code
                     return
 
-            if is_publish:
-                cert = opts.get("cert")
-                client_cert = opts.get("client-cert")
-                dist_dir = opts.get("dist-dir")
-                self._exit_code = publish_projects(
-                    event.io,
-                    filtered_projects,
-                    environment,
-                    environment_metadata,
-                    repository=opts.get("repository"),
-                    username=opts.get("username"),
-                    password=opts.get("password"),
-                    cert=Path(cert) if cert else None,
-                    client_cert=Path(client_cert) if client_cert else None,
-                    dist_dir=Path(dist_dir) if dist_dir else None,
-                    dry_run=bool(opts.get("dry-run")),
-                    skip_existing=bool(opts.get("skip-existing")),
-                )
-        finally:
-            environment.restore_projects(environment.projects)
+                # Execute build or publish command
+                is_publish = isinstance(event.command, PublishCommand)
+                opts = event.io.input.options
+
+                needs_build = not is_publish or opts.get("build")
+                if needs_build:
+                    build_exit_code = build_projects(
+                        event.io,
+                        filtered_projects,
+                        formats=BuildCommand._prepare_formats(opts.get("format")) if not is_publish else None,
+                        clean=bool(opts.get("clean")) if not is_publish else False,
+                        output=(opts.get("output") if not is_publish else opts.get("dist-dir")) or "dist",
+                        config_settings=BuildCommand._prepare_config_settings(
+                            local_version=opts.get("local-version"),
+                            config_settings=opts.get("config-settings"),
+                            io=event.io,
+                        ) if not is_publish else None,
+                    )
+                    if build_exit_code != 0:
+                        self._exit_code = build_exit_code
+                        return
+
+                if is_publish:
+                    cert = opts.get("cert")
+                    client_cert = opts.get("client-cert")
+                    dist_dir = opts.get("dist-dir")
+                    self._exit_code = publish_projects(
+                        event.io,
+                        filtered_projects,
+                        environment,
+                        environment_metadata,
+                        repository=opts.get("repository"),
+                        username=opts.get("username"),
+                        password=opts.get("password"),
+                        cert=Path(cert) if cert else None,
+                        client_cert=Path(client_cert) if client_cert else None,
+                        dist_dir=Path(dist_dir) if dist_dir else None,
+                        dry_run=bool(opts.get("dry-run")),
+                        skip_existing=bool(opts.get("skip-existing")),
+                    )
+            finally:
+                environment.restore_projects(environment.projects)
 
     def poetry_terminate(self, event: ConsoleTerminateEvent) -> None:
         if self._exit_code is None:
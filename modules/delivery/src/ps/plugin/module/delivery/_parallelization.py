@@ -7,14 +7,19 @@ from cleo.formatters.formatter import Formatter
 from cleo.io.buffered_io import BufferedIO
 from cleo.io.io import IO
 
+from ps.di import DI, ContextExecutor, current_scope, use_scope
+
 T = TypeVar("T")
 
-_thread_io: threading.local = threading.local()
+
+def _current_io() -> Optional[BufferedIO]:
+    scope = current_scope()
+    return scope.resolve(BufferedIO) if scope is not None else None
 
 
 class ThreadLocalIOHandler(logging.Handler):
     def emit(self, record: logging.LogRecord) -> None:
-        bio: Optional[BufferedIO] = getattr(_thread_io, "io", None)
+        bio = _current_io()
         if bio is None:
             return
         try:
@@ -30,14 +35,14 @@ class ThreadLocalIOHandler(logging.Handler):
 def _run_buffered(io: IO, item: T, fn: Callable[[BufferedIO, T], int]) -> tuple[int, str, str]:
     buffered_io = BufferedIO(decorated=io.output.is_decorated())
     buffered_io.set_verbosity(io.output.verbosity)
-    _thread_io.io = buffered_io
-    try:
-        exit_code = fn(buffered_io, item)
-    except Exception as e:
-        buffered_io.write_error_line(f"\n<error>{Formatter.escape(str(e))}</error>")
-        exit_code = 1
-    finally:
-        _thread_io.io = None
+    parent = current_scope() or DI()
+    with parent.scope() as scope, use_scope(scope):
+        scope.register(BufferedIO).value(buffered_io)
+        try:
+            exit_code = fn(buffered_io, item)
+        except Exception as e:
+            buffered_io.write_error_line(f"\n<error>{Formatter.escape(str(e))}</error>")
+            exit_code = 1
     return exit_code, buffered_io.fetch_output(), buffered_io.fetch_error()
 
 
@@ -66,7 +71,7 @@ def run_parallel(io: IO, items: list[T], fn: Callable[[BufferedIO, T], int]) ->
             _flush(io, out, err)
         return result
 
-    with ThreadPoolExecutor() as executor:
+    with ContextExecutor(ThreadPoolExecutor()) as executor:
         results = list(executor.map(_run_and_flush, items))
 
     for result in results:
@@ -94,7 +99,7 @@ def run_topological(
         done_events[id(item)].set()
         return result
 
-    with ThreadPoolExecutor() as executor:
+    with ContextExecutor(ThreadPoolExecutor()) as executor:
         futures = [executor.submit(_run_and_flush, item) for item in items]
 
     exit_code = 0
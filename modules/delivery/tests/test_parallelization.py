@@ -0,0 +1,55 @@
+import logging
+
+from cleo.io.buffered_io import BufferedIO
+
+from ps.di import DI, current_scope, use_scope
+
+from ps.plugin.module.delivery._parallelization import ThreadLocalIOHandler, run_parallel, run_topological
+
+
+class Workspace:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+def _logger() -> logging.Logger:
+    logger = logging.getLogger("ps.tests.delivery.parallelization")
+    logger.handlers = [ThreadLocalIOHandler()]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return logger
+
+
+def test_run_parallel_gives_each_item_its_own_scope():
+    di = DI()
+    di.register(Workspace).value(Workspace("root"))
+    io = BufferedIO()
+    logger = _logger()
+
+    def work(buffered_io: BufferedIO, item: str) -> int:
+        scope = current_scope()
+        assert scope is not None
+        assert scope is not di
+        assert scope.resolve(BufferedIO) is buffered_io
+        workspace = scope.resolve(Workspace)
+        assert workspace is not None
+        logger.info("%s in %s", item, workspace.name)
+        return 0
+
+    with use_scope(di):
+        assert run_parallel(io, ["a", "b", "c"], work) == 0
+
+    assert sorted(io.fetch_output().splitlines()) == ["a in root", "b in root", "c in root"]
+    assert current_scope() is None
+
+
+def test_run_topological_works_without_current_scope():
+    io = BufferedIO()
+    logger = _logger()
+
+    def work(_: BufferedIO, item: str) -> int:
+        logger.warning(item)
+        return 1 if item == "b" else 0
+
+    assert run_topological(io, ["a", "b"], work, lambda item: ["a"] if item == "b" else []) == 1
+    assert io.fetch_error().splitlines() == ["a", "b"]
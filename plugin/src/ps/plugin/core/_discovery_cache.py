@@ -0,0 +1,105 @@
+import contextlib
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+from poetry.locations import DEFAULT_CACHE_DIR
+
+_CACHE_VERSION = 1
+_FINGERPRINT_SUFFIXES = (".dist-info", ".egg-info", ".pth")
+
+
+def _default_cache_dir(kind: str = "discovery") -> Path:
+    cache_root = os.environ.get("POETRY_CACHE_DIR")
+    return (Path(cache_root) if cache_root else DEFAULT_CACHE_DIR) / "ps-plugin" / kind
+
+
+def _compute_fingerprint(search_paths: list[str]) -> str:
+    digest = hashlib.sha256()
+    for entry in search_paths:
+        digest.update(f"{entry}\0".encode())
+        try:
+            with os.scandir(entry or ".") as it:
+                items = sorted(
+                    (item.name, item.stat().st_mtime_ns)
+                    for item in it
+                    if item.name.endswith(_FINGERPRINT_SUFFIXES)
+                )
+        except OSError:
+            continue
+        for name, mtime in items:
+            digest.update(f"{name}\0{mtime}\0".encode())
+    return digest.hexdigest()
+
+
+def _source_mtime(path: str) -> Optional[int]:
+    try:
+        return Path(path).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+class _DiscoveryCache:
+    def __init__(self, directory: Optional[Path] = None, search_paths: Optional[list[str]] = None) -> None:
+        self._directory = directory or _default_cache_dir()
+        self._search_paths = list(sys.path) if search_paths is None else search_paths
+        self._fingerprint: Optional[str] = None
+
+    @property
+    def path(self) -> Path:
+        key = hashlib.sha256("\0".join(self._search_paths).encode()).hexdigest()[:16]
+        return self._directory / f"{key}.json"
+
+    def path_for(self, selection: Optional[list[str]]) -> Path:
+        if selection is None:
+            return self.path
+        names = sorted({name.lower() for name in selection})
+        key = hashlib.sha256("\0".join(names).encode()).hexdigest()[:16]
+        return self.path.with_name(f"{self.path.stem}-{key}.json")
+
+    @property
+    def fingerprint(self) -> str:
+        if self._fingerprint is None:
+            self._fingerprint = _compute_fingerprint(self._search_paths)
+        return self._fingerprint
+
+    def load(self, selection: Optional[list[str]] = None) -> Optional[list[dict[str, Any]]]:
+        try:
+            with self.path_for(selection).open(encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION or data.get("fingerprint") != self.fingerprint:
+            return None
+        sources: dict[str, Any] = data.get("sources", {})
+        if any(_source_mtime(path) != mtime for path, mtime in sources.items()):
+            return None
+        modules = data.get("modules")
+        return modules if isinstance(modules, list) else None
+
+    def store(self, modules: list[dict[str, Any]], selection: Optional[list[str]] = None) -> bool:
+        sources = {m["path"]: _source_mtime(m["path"]) for m in modules if m.get("path")}
+        data = {
+            "version": _CACHE_VERSION,
+            "fingerprint": self.fingerprint,
+            "sources": sources,
+            "modules": modules,
+        }
+        target = self.path_for(selection)
+        temp = target.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with temp.open("w", encoding="utf-8") as f:
+                json.dump(data, f)
+            temp.replace(target)
+        except OSError:
+            with contextlib.suppress(OSError):
+                temp.unlink()
+            return False
+        return True
+
+    def clear(self, selection: Optional[list[str]] = None) -> None:
+        self.path_for(selection).unlink(missing_ok=True)
@@ -0,0 +1,146 @@
+import inspect
+from types import TracebackType
+from typing import Any, Callable, Optional, Self, Union, get_args, get_origin, get_type_hints
+
+from cleo.events.console_command_event import ConsoleCommandEvent
+from cleo.events.console_error_event import ConsoleErrorEvent
+from cleo.events.console_signal_event import ConsoleSignalEvent
+from cleo.events.console_terminate_event import ConsoleTerminateEvent
+from cleo.events.event import Event
+
+from ps.di import DI, BoundCallable
+
+_EVENT_CLASSES: dict[str, type[Event]] = {
+    "command": ConsoleCommandEvent,
+    "terminate": ConsoleTerminateEvent,
+    "error": ConsoleErrorEvent,
+    "signal": ConsoleSignalEvent,
+}
+
+_Resolver = Callable[["_EventContext"], Any]
+
+
+class _EventContext:
+    def __init__(self, di: DI, event: Event) -> None:
+        self._di = di
+        self._scope: Optional[DI] = None
+        self.event = event
+
+    @property
+    def di(self) -> DI:
+        return self._di
+
+    @property
+    def scope(self) -> DI:
+        if self._scope is None:
+            scope = self._di.scope()
+            scope.register(type(self.event)).value(self.event)
+            self._scope = scope
+        return self._scope
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        if self._scope is not None:
+            self._scope.__exit__(exc_type, exc, tb)
+            self._scope = None
+
+
+class _CompiledHandler:
+    def __init__(self, fn: Callable[..., Any], resolvers: Optional[dict[str, _Resolver]]) -> None:
+        self.fn = fn
+        self._resolvers = resolvers
+        self._bound: Optional[BoundCallable[Any]] = None
+
+    @property
+    def name(self) -> str:
+        return getattr(self.fn, "__qualname__", repr(self.fn))
+
+    @property
+    def compiled(self) -> bool:
+        return self._resolvers is not None
+
+    def __call__(self, context: _EventContext) -> Any:
+        if self._resolvers is None:
+            if self._bound is None:
+                self._bound = context.di.bind(self.fn)
+            return self._bound.call_in(context.scope)
+        return self.fn(**{name: resolve(context) for name, resolve in self._resolvers.items()})
+
+
+def _is_event_type(annotation: Any, event_cls: type[Event]) -> bool:
+    return isinstance(annotation, type) and issubclass(event_cls, annotation)
+
+
+def _compile_parameter(name: str, annotation: Any, default: Any, event_cls: type[Event]) -> Optional[_Resolver]:
+    has_default = default is not inspect.Parameter.empty
+
+    if annotation is inspect.Parameter.empty or isinstance(annotation, str):
+        return None
+
+    if annotation is DI or (isinstance(annotation, type) and issubclass(annotation, DI)):
+        return lambda context: context.scope
+
+    if _is_event_type(annotation, event_cls):
+        return lambda context: context.event
+
+    origin = get_origin(annotation)
+
+    if origin is list:
+        type_args = get_args(annotation)
+        if not type_args:
+            return lambda _: []
+        item = type_args[0]
+        return lambda context: context.scope.resolve_many(item)
+
+    if origin is Union and type(None) in get_args(annotation):
+        target = next(t for t in get_args(annotation) if t is not type(None))
+        if _is_event_type(target, event_cls):
+            return lambda context: context.event
+        fallback = default if has_default else None
+
+        def _resolve_optional(context: _EventContext) -> Any:
+            value = context.scope.resolve(target)
+            return fallback if value is None else value
+
+        return _resolve_optional
+
+    def _resolve_required(context: _EventContext) -> Any:
+        value = context.scope.resolve(annotation)
+        if value is not None:
+            return value
+        if has_default:
+            return default
+        raise ValueError(f"Cannot resolve required dependency {annotation} for parameter {name}")
+
+    return _resolve_required
+
+
+def _compile_handler(fn: Callable[..., Any], event_cls: type[Event]) -> _CompiledHandler:
+    try:
+        sig = inspect.signature(fn)
+        type_hints = get_type_hints(fn)
+    except Exception:
+        return _CompiledHandler(fn, None)
+
+    resolvers: dict[str, _Resolver] = {}
+    for param in sig.parameters.values():
+        if param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
+            continue
+        annotation = type_hints.get(param.name, param.annotation)
+        resolver = _compile_parameter(param.name, annotation, param.default, event_cls)
+        if resolver is None:
+            return _CompiledHandler(fn, None)
+        resolvers[param.name] = resolver
+    return _CompiledHandler(fn, resolvers)
+
+
+def _compile_dispatch_plan(event_type: str, fns: list[Callable[..., Any]]) -> list[_CompiledHandler]:
+    event_cls = _EVENT_CLASSES.get(event_type, Event)
+    return [_compile_handler(fn, event_cls) for fn in fns]
@@ -0,0 +1,95 @@
+import contextlib
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Optional
+
+from cleo.io.io import IO
+
+from ps.plugin.sdk.logging import log_debug
+from ps.plugin.sdk.project import Environment, Project, parse_project
+from ps.plugin.sdk.settings import PluginSettings
+from ps.plugin.sdk.toml import TomlValue
+
+from ._discovery_cache import _default_cache_dir
+
+_CACHE_VERSION = 2
+_MODEL_SOURCES = tuple(inspect.getfile(obj) for obj in (Environment, Project, parse_project, PluginSettings, TomlValue))
+_MODEL_DISTRIBUTIONS = ("tomlkit", "pydantic", "ps-version", "ps-plugin-sdk")
+
+
+def _stat_key(path: str) -> Optional[tuple[int, int]]:
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _distribution_version(name: str) -> Optional[str]:
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+class _EnvironmentCache:
+    def __init__(self, directory: Optional[Path] = None) -> None:
+        self._directory = directory or _default_cache_dir("environment")
+        self._distributions: Optional[dict[str, Optional[str]]] = None
+
+    def path(self, entry_project_path: Path) -> Path:
+        key_source = f"{entry_project_path.resolve()}\0{sys.version_info[:2]}"
+        return self._directory / f"{hashlib.sha256(key_source.encode()).hexdigest()[:16]}.pickle"
+
+    @property
+    def distributions(self) -> dict[str, Optional[str]]:
+        if self._distributions is None:
+            self._distributions = {name: _distribution_version(name) for name in _MODEL_DISTRIBUTIONS}
+        return self._distributions
+
+    def load(self, entry_project_path: Path, io: Optional[IO] = None) -> Optional[Environment]:
+        path = self.path(entry_project_path)
+        try:
+            with path.open("rb") as f:
+                header = pickle.load(f)  # noqa: S301 - written by this class into the user's cache directory
+                if not isinstance(header, dict) or header.get("version") != _CACHE_VERSION:
+                    return None
+                if header.get("distributions") != self.distributions:
+                    return None
+                sources: dict[str, Any] = header.get("sources", {})
+                if not sources or any(_stat_key(path) != tuple(key) for path, key in sources.items()):
+                    return None
+                environment = pickle.load(f)  # noqa: S301
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            if io is not None:
+                log_debug(io, f"<fg=dark_gray>Ignoring unreadable environment cache {path}: {e}</>")
+            return None
+        return environment if isinstance(environment, Environment) else None
+
+    def store(self, entry_project_path: Path, environment: Environment) -> bool:
+        paths = [str(p.path) for p in environment.projects] + list(_MODEL_SOURCES)
+        sources = {path: key for path in paths if (key := _stat_key(path)) is not None}
+        header = {"version": _CACHE_VERSION, "distributions": self.distributions, "sources": sources}
+        target = self.path(entry_project_path)
+        temp = target.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with temp.open("wb") as f:
+                pickle.dump(header, f)
+                pickle.dump(environment, f)
+            temp.replace(target)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            with contextlib.suppress(OSError):
+                temp.unlink()
+            return False
+        return True
+
+    def clear(self, entry_project_path: Path) -> None:
+        self.path(entry_project_path).unlink(missing_ok=True)
@@ -1,19 +1,27 @@
+import importlib
 import inspect
 import re
+import time
 import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from importlib import metadata
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, get_type_hints
 
+from cleo.io.buffered_io import BufferedIO
 from cleo.io.io import IO
 
-from ps.di import DI
+from ps.di import DI, ContextExecutor
 from ps.plugin.sdk.logging import log_debug, log_verbose
 from ps.plugin.sdk.settings import PluginSettings
 
+from ._discovery_cache import _DiscoveryCache
+from ._profiler import _Profiler
+from ._telemetry import _elapsed_ms, _Telemetry
+
 _ENTRY_POINT_VALUE_PATTERN = re.compile(r"^[\w][\w.]*(?::[\w][\w.]*)?$")
-_HANDLER_PATTERN = re.compile(r"^poetry_(activate|command|error|terminate|signal)(_\w+)?$")
-_EVENT_TYPES = ("activate", "command", "error", "terminate", "signal")
+_HANDLER_PATTERN = re.compile(r"^poetry_(register|activate|command|error|terminate|signal)(_\w+)?$")
+_EVENT_TYPES = ("register", "activate", "command", "error", "terminate", "signal")
 
 
 @dataclass
@@ -23,6 +31,50 @@ class _ModuleInfo:
     distribution: Optional[str] = None
     instance: Optional[object] = None
     path: Optional[str] = None
+    handler_refs: dict[str, str] = field(default_factory=dict)
+
+
+def _get_reference(obj: Any) -> Optional[str]:
+    module = getattr(obj, "__module__", None)
+    qualname = getattr(obj, "__qualname__", None)
+    if not module or not qualname or "<" in qualname:
+        return None
+    return f"{module}:{qualname}"
+
+
+def _resolve_reference(reference: str) -> Any:
+    module_name, _, qualname = reference.partition(":")
+    obj: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def _get_handler_refs(handlers: dict[str, Callable]) -> dict[str, str]:
+    refs = {event_type: _get_reference(fn) for event_type, fn in handlers.items()}
+    return {event_type: ref for event_type, ref in refs.items() if ref is not None}
+
+
+def _is_cacheable(info: _ModuleInfo) -> bool:
+    return info.handler_refs.keys() == info.handlers.keys()
+
+
+def _to_record(info: _ModuleInfo) -> dict[str, Any]:
+    return {
+        "name": info.name,
+        "handlers": info.handler_refs,
+        "distribution": info.distribution,
+        "path": info.path,
+    }
+
+
+def _from_record(record: dict[str, Any]) -> _ModuleInfo:
+    return _ModuleInfo(
+        name=record["name"],
+        distribution=record.get("distribution"),
+        path=record.get("path"),
+        handler_refs=dict(record["handlers"]),
+    )
 
 
 def _get_module_path(obj: Any) -> Optional[str]:
@@ -81,6 +133,7 @@ def _scan_class(cls: type, distribution: Optional[str]) -> list[_ModuleInfo]:
             handlers=instance_handlers,
             distribution=distribution,
             path=cls_path,
+            handler_refs=_get_handler_refs(instance_handlers),
         ))
 
     # Group static methods by suffix
@@ -97,6 +150,7 @@ def _scan_class(cls: type, distribution: Optional[str]) -> list[_ModuleInfo]:
             handlers=handlers,
             distribution=distribution,
             path=cls_path,
+            handler_refs=_get_handler_refs(handlers),
         ))
 
     return modules
@@ -111,52 +165,84 @@ def _scan_function(fn: Callable, distribution: Optional[str]) -> Optional[_Modul
     suffix = (match.group(2) or "")[1:]
     if not suffix:
         return None  # global functions MUST have suffix
-    return _ModuleInfo(name=suffix, handlers={event_type: fn}, distribution=distribution, path=_get_module_path(fn))
+    handlers = {event_type: fn}
+    return _ModuleInfo(name=suffix, handlers=handlers, distribution=distribution, path=_get_module_path(fn), handler_refs=_get_handler_refs(handlers))
+
+
+def _load_entry_point_infos(io: IO, entry_point: metadata.EntryPoint) -> list[_ModuleInfo]:
+    ep_name = f"{entry_point.group}:{entry_point.name}"
+    try:
+        ep_value = getattr(entry_point, "value", None)
+        if isinstance(ep_value, str) and not _ENTRY_POINT_VALUE_PATTERN.match(ep_value):
+            raise ValueError(
+                f"Entry point value '{ep_value}' is not a valid Python module path. "
+                f"Module names may only contain letters, digits, and underscores — hyphens are not allowed "
+                f"(e.g. use '{ep_value.replace('-', '_')}' instead of '{ep_value}')."
+            )
+        loaded = entry_point.load()
+        dist = _get_distribution(entry_point)
+    except Exception as e:
+        log_verbose(io, f"  <fg=yellow>Warning: failed to load entry point '{ep_name}': {e}</>")
+        log_debug(io, f"  <fg=dark_gray>{traceback.format_exc().strip()}</>")
+        return []
+
+    if inspect.isclass(loaded):
+        return _scan_class(loaded, dist)
+    if inspect.ismodule(loaded):
+        modules: list[_ModuleInfo] = []
+        func_groups: dict[str, _ModuleInfo] = {}
+        for _, obj in inspect.getmembers(loaded):
+            if inspect.isclass(obj) and obj.__module__.startswith(loaded.__name__):
+                modules.extend(_scan_class(obj, dist))
+            elif inspect.isfunction(obj) and obj.__module__ == loaded.__name__:
+                info = _scan_function(obj, dist)
+                if info:
+                    if info.name in func_groups:
+                        func_groups[info.name].handlers.update(info.handlers)
+                        func_groups[info.name].handler_refs.update(info.handler_refs)
+                    else:
+                        func_groups[info.name] = info
+        modules.extend(func_groups.values())
+        return modules
+    if inspect.isfunction(loaded):
+        info = _scan_function(loaded, dist)
+        return [info] if info else []
+    log_verbose(io, f"  <fg=yellow>Warning: entry point '{ep_name}' loaded unsupported type {type(loaded).__name__}, skipping.</>")
+    return []
 
 
 def _load_module_infos(io: IO) -> list[_ModuleInfo]:
     all_modules: list[_ModuleInfo] = []
-
     for entry_point in metadata.entry_points(group="ps.module"):
-        ep_name = f"{entry_point.group}:{entry_point.name}"
-        try:
-            ep_value = getattr(entry_point, "value", None)
-            if isinstance(ep_value, str) and not _ENTRY_POINT_VALUE_PATTERN.match(ep_value):
-                raise ValueError(
-                    f"Entry point value '{ep_value}' is not a valid Python module path. "
-                    f"Module names may only contain letters, digits, and underscores — hyphens are not allowed "
-                    f"(e.g. use '{ep_value.replace('-', '_')}' instead of '{ep_value}')."
-                )
-            loaded = entry_point.load()
-            dist = _get_distribution(entry_point)
-        except Exception as e:
-            log_verbose(io, f"  <fg=yellow>Warning: failed to load entry point '{ep_name}': {e}</>")
-            log_debug(io, f"  <fg=dark_gray>{traceback.format_exc().strip()}</>")
-            continue
+        all_modules.extend(_load_entry_point_infos(io, entry_point))
+    return all_modules
 
-        if inspect.isclass(loaded):
-            all_modules.extend(_scan_class(loaded, dist))
-        elif inspect.ismodule(loaded):
-            func_groups: dict[str, _ModuleInfo] = {}
-            for _, obj in inspect.getmembers(loaded):
-                if inspect.isclass(obj) and obj.__module__.startswith(loaded.__name__):
-                    all_modules.extend(_scan_class(obj, dist))
-                elif inspect.isfunction(obj) and obj.__module__ == loaded.__name__:
-                    info = _scan_function(obj, dist)
-                    if info:
-                        if info.name in func_groups:
-                            func_groups[info.name].handlers.update(info.handlers)
-                        else:
-                            func_groups[info.name] = info
-            all_modules.extend(func_groups.values())
-        elif inspect.isfunction(loaded):
-            info = _scan_function(loaded, dist)
-            if info:
-                all_modules.append(info)
-        else:
-            log_verbose(io, f"  <fg=yellow>Warning: entry point '{ep_name}' loaded unsupported type {type(loaded).__name__}, skipping.</>")
 
-    return all_modules
+def _normalize_module_name(name: str) -> str:
+    return re.sub(r"[-_.]", "", name.casefold())
+
+
+def _get_entry_point_hints(entry_point: metadata.EntryPoint) -> set[str]:
+    hints = {_normalize_module_name(entry_point.name)}
+    ep_value = getattr(entry_point, "value", None)
+    if isinstance(ep_value, str):
+        target = ep_value.split("[", 1)[0].strip().replace(":", ".")
+        hints.add(_normalize_module_name(target.rsplit(".", 1)[-1]))
+    return hints
+
+
+def _load_hinted_module_infos(io: IO, specified: Optional[list[str]]) -> Optional[list[_ModuleInfo]]:
+    if not specified:
+        return []
+    wanted = {_normalize_module_name(n) for n in specified}
+    modules: list[_ModuleInfo] = []
+    for entry_point in metadata.entry_points(group="ps.module"):
+        if _get_entry_point_hints(entry_point) & wanted:
+            modules.extend(_load_entry_point_infos(io, entry_point))
+    found = {m.name.lower() for m in modules}
+    if any(n.lower() not in found for n in specified):
+        return None
+    return modules
 
 
 def _detect_collisions(modules: list[_ModuleInfo], io: IO) -> list[_ModuleInfo]:
@@ -176,6 +262,7 @@ def _detect_collisions(modules: list[_ModuleInfo], io: IO) -> list[_ModuleInfo]:
             merged = group[0]
             for other in group[1:]:
                 merged.handlers.update(other.handlers)
+                merged.handler_refs.update(other.handler_refs)
             result.append(merged)
         else:
             dist_list = ", ".join(
@@ -192,27 +279,192 @@ def _detect_collisions(modules: list[_ModuleInfo], io: IO) -> list[_ModuleInfo]:
     return result
 
 
+def _select_modules(modules: list[_ModuleInfo], specified: Optional[list[str]]) -> list[_ModuleInfo]:
+    if specified is None:
+        return []
+    name_map = {m.name.lower(): m for m in modules}
+    return [name_map[n.lower()] for n in specified if n.lower() in name_map]
+
+
+def _get_ordering_names(mod: _ModuleInfo, attr: str) -> list[str]:
+    source = mod.instance
+    if source is None:
+        return []
+    value = getattr(source, attr, None)
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [name for name in value if isinstance(name, str)]
+    return []
+
+
+def _order_modules(modules: list[_ModuleInfo], io: IO) -> tuple[list[_ModuleInfo], Optional[dict[str, set[str]]]]:
+    names = {m.name for m in modules}
+    dependencies: dict[str, set[str]] = {m.name: set() for m in modules}
+    for mod in modules:
+        for name in _get_ordering_names(mod, "after"):
+            if name in names and name != mod.name:
+                dependencies[mod.name].add(name)
+            else:
+                log_debug(io, f"<fg=dark_gray>Module <comment>{mod.name}</comment> ordering ignores unknown module '{name}'</>")
+        for name in _get_ordering_names(mod, "before"):
+            if name in names and name != mod.name:
+                dependencies[name].add(mod.name)
+            else:
+                log_debug(io, f"<fg=dark_gray>Module <comment>{mod.name}</comment> ordering ignores unknown module '{name}'</>")
+
+    ordered: list[_ModuleInfo] = []
+    placed: set[str] = set()
+    remaining = list(modules)
+    while remaining:
+        ready = next((m for m in remaining if dependencies[m.name] <= placed), None)
+        if ready is None:
+            cycle = ", ".join(m.name for m in remaining)
+            log_verbose(io, f"  <fg=yellow>Warning: activation order of modules [{cycle}] is cyclic, using declared order.</>")
+            return modules, None
+        remaining.remove(ready)
+        placed.add(ready.name)
+        ordered.append(ready)
+    return ordered, dependencies
+
+
+def _get_io_parameters(fn: Callable) -> list[str]:
+    try:
+        hints = get_type_hints(fn)
+    except Exception:
+        return []
+    return [name for name, hint in hints.items() if name != "return" and hint is IO]
+
+
+def _create_buffered_io(io: IO) -> BufferedIO:
+    buffered = BufferedIO(input=io.input, decorated=io.is_decorated(), supports_utf8=io.supports_utf8())
+    buffered.set_verbosity(io.output.verbosity)
+    return buffered
+
+
+def _flush_buffered_io(buffered: BufferedIO, io: IO) -> None:
+    output = buffered.fetch_output()
+    if output:
+        io.write(output)
+    error = buffered.fetch_error()
+    if error:
+        io.write_error(error)
+
+
+def _materialize_handlers(modules: list[_ModuleInfo]) -> None:
+    for mod in modules:
+        if not mod.handlers:
+            mod.handlers = {event_type: _resolve_reference(ref) for event_type, ref in mod.handler_refs.items()}
+
+
 class _ModulesHandler:
-    def __init__(self, di: DI, io: IO, plugin_settings: PluginSettings) -> None:
+    def __init__(
+        self,
+        di: DI,
+        io: IO,
+        plugin_settings: PluginSettings,
+        discovery_cache: Optional[_DiscoveryCache] = None,
+        profiler: Optional[_Profiler] = None,
+        telemetry: Optional[_Telemetry] = None,
+    ) -> None:
         self._di = di
         self._io = io
         self._plugin_settings = plugin_settings
+        self._discovery_cache = discovery_cache if plugin_settings.discovery_cache is not False else None
+        self._profiler = profiler or _Profiler()
+        self._telemetry = telemetry or _Telemetry()
+        self._discovery_source = "scan"
         self._modules: list[_ModuleInfo] = []
         self._disabled: set[str] = set()
 
-    def discover_and_instantiate(self) -> None:
-        io = self._io
-        all_modules = _load_module_infos(io)
-        modules = _detect_collisions(all_modules, io)
+    def _load_cached_module_infos(self, selection: Optional[list[str]] = None) -> Optional[list[_ModuleInfo]]:
+        cache = self._discovery_cache
+        if cache is None:
+            return None
+        records = cache.load(selection)
+        if records is None:
+            return None
+        try:
+            modules = [_from_record(record) for record in records]
+        except (KeyError, TypeError, ValueError):
+            return None
+        log_debug(self._io, f"<fg=dark_gray>Loaded {len(modules)} module(s) from discovery cache {cache.path_for(selection)}</>")
+        return modules
+
+    def _store_module_infos(self, modules: list[_ModuleInfo], selection: Optional[list[str]] = None) -> None:
+        cache = self._discovery_cache
+        if cache is None or not all(_is_cacheable(m) for m in modules):
+            return
+        if cache.store([_to_record(m) for m in modules], selection):
+            log_debug(self._io, f"<fg=dark_gray>Stored {len(modules)} module(s) in discovery cache {cache.path_for(selection)}</>")
+
+    def _scan_module_infos(self) -> list[_ModuleInfo]:
+        all_modules = _load_module_infos(self._io)
+        self._store_module_infos(all_modules)
+        return all_modules
+
+    def _select_cached(self, cached: list[_ModuleInfo], selection: Optional[list[str]]) -> Optional[list[_ModuleInfo]]:
+        modules = _select_modules(_detect_collisions(cached, self._io), self._plugin_settings.modules)
+        try:
+            _materialize_handlers(modules)
+        except Exception as e:
+            log_verbose(self._io, f"  <fg=yellow>Warning: discovery cache is stale ({e}), rescanning entry points.</>")
+            assert self._discovery_cache is not None
+            self._discovery_cache.clear(selection)
+            return None
+        return modules
 
+    def _discover(self) -> tuple[list[_ModuleInfo], list[_ModuleInfo]]:
+        io = self._io
         specified = self._plugin_settings.modules
-        if specified is not None:
-            name_map = {m.name.lower(): m for m in modules}
-            modules = [name_map[n.lower()] for n in specified if n.lower() in name_map]
-            selected_names = {m.name for m in modules}
-        else:
-            modules = []
-            selected_names = set()
+
+        with self._profiler.span("discovery cache"):
+            cached = self._load_cached_module_infos()
+        if cached is not None:
+            modules = self._select_cached(cached, None)
+            if modules is not None:
+                self._discovery_source = "cache"
+                return cached, modules
+
+        if not io.is_debug():
+            if specified:
+                with self._profiler.span("discovery cache (hinted)"):
+                    cached = self._load_cached_module_infos(specified)
+                if cached is not None:
+                    modules = self._select_cached(cached, specified)
+                    if modules is not None:
+                        self._discovery_source = "hinted cache"
+                        return cached, modules
+            with self._profiler.span("entry points (hinted)"):
+                hinted = _load_hinted_module_infos(io, specified)
+            if hinted is not None:
+                log_verbose(io, f"Loaded {len(hinted)} module(s) from entry points matching the configured names")
+                if specified:
+                    self._store_module_infos(hinted, specified)
+                self._discovery_source = "hinted"
+                return hinted, _select_modules(_detect_collisions(hinted, io), specified)
+
+        self._discovery_source = "scan"
+        with self._profiler.span("entry points (scan)"):
+            all_modules = self._scan_module_infos()
+        return all_modules, _select_modules(_detect_collisions(all_modules, io), specified)
+
+    def discover_and_instantiate(self) -> None:
+        io = self._io
+        with self._profiler.span("discover"):
+            all_modules, modules = self._discover()
+        selected_names = {m.name for m in modules}
+
+        telemetry = self._telemetry
+        if telemetry.enabled:
+            for mod in all_modules:
+                telemetry.emit(
+                    "module_discovered",
+                    module=mod.name,
+                    distribution=mod.distribution,
+                    source=self._discovery_source,
+                    selected=mod.name in selected_names,
+                )
 
         if io.is_verbose():
             available_not_selected = [m for m in all_modules if m.name not in selected_names]
@@ -224,7 +476,12 @@ class _ModulesHandler:
                 if io.is_debug() and mod.path:
                     io.write_line(f"       <fg=dark_gray>{mod.path}</>")
 
-            if available_not_selected:
+            if self._discovery_source in ("hinted", "hinted cache"):
+                io.write_line(
+                    "<fg=magenta>Discovered but not selected:</> <fg=dark_gray>unavailable, only entry points matching the configured names "
+                    "were imported (use -vvv for a full scan)</>"
+                )
+            elif available_not_selected:
                 io.write_line("<fg=magenta>Discovered but not selected:</>")
                 for mod in available_not_selected:
                     dist_hint = f" <fg=dark_gray>[{mod.distribution}]</>" if mod.distribution else ""
@@ -243,7 +500,10 @@ class _ModulesHandler:
                 # Find the class from first unbound method
                 cls = _get_defining_class(next(iter(handlers.values())))
                 if cls:
-                    instance = self._di.spawn(cls)
+                    start = time.perf_counter()
+                    with self._profiler.span(f"instantiate {mod.name}"):
+                        instance = self._di.spawn(cls)
+                    telemetry.emit("module_loaded", module=mod.name, duration_ms=_elapsed_ms(start))
                     mod.instance = instance
                     # Bind methods to instance
                     mod.handlers = {
@@ -257,22 +517,100 @@ class _ModulesHandler:
 
         self._modules = modules
 
+    def register(self) -> Optional[set[str]]:
+        io = self._io
+        claimed: Optional[set[str]] = set()
+        for mod in self._modules:
+            fn = mod.handlers.get("register")
+            if fn is None:
+                claimed = None
+                continue
+            log_debug(io, f"<fg=dark_gray>Executing register for module <comment>{mod.name}</comment></>")
+            try:
+                with self._profiler.span(f"register {mod.name}"):
+                    result = self._di.satisfy(fn)()
+            except Exception as e:
+                io.write_error_line(f"<error>Error during registration of module {mod.name}: {e}</error>")
+                raise
+            if result is None:
+                claimed = None
+            elif claimed is not None:
+                claimed.update(result)
+        return claimed
+
     def activate(self) -> None:
         io = self._io
-        activate_modules = [m for m in self._modules if "activate" in m.handlers]
+        activate_modules, dependencies = _order_modules([m for m in self._modules if "activate" in m.handlers], io)
         log_verbose(io, f"<info>Activating {len(activate_modules)} module(s)</info>")
 
+        if self._plugin_settings.parallel_activation and dependencies is not None and len(activate_modules) > 1:
+            self._activate_parallel(activate_modules, dependencies)
+            return
+
         for mod in activate_modules:
-            fn = mod.handlers["activate"]
             log_debug(io, f"<fg=dark_gray>Executing activate for module <comment>{mod.name}</comment></>")
             try:
-                result = self._di.satisfy(fn)()
-                if result is False:
-                    self._disabled.add(mod.name)
-                    log_debug(io, f"<fg=dark_gray>Module <comment>{mod.name}</comment> disabled itself during activation</>")
+                result = self._call_activate(mod)
             except Exception as e:
                 io.write_error_line(f"<error>Error during activation of module {mod.name}: {e}</error>")
                 raise
+            self._complete_activation(mod, result)
+
+    def _call_activate(self, mod: _ModuleInfo, io: Optional[IO] = None) -> Any:
+        fn = mod.handlers["activate"]
+        overrides = dict.fromkeys(_get_io_parameters(fn), io) if io is not None else {}
+        start = time.perf_counter()
+        try:
+            with self._profiler.span(f"activate {mod.name}"):
+                result = self._di.satisfy(fn, **overrides)()
+        except Exception as e:
+            self._telemetry.emit("module_activated", module=mod.name, duration_ms=_elapsed_ms(start), error=str(e))
+            raise
+        self._telemetry.emit("module_activated", module=mod.name, duration_ms=_elapsed_ms(start), disabled=result is False)
+        return result
+
+    def _complete_activation(self, mod: _ModuleInfo, result: Any) -> None:
+        if result is False:
+            self._disabled.add(mod.name)
+            log_debug(self._io, f"<fg=dark_gray>Module <comment>{mod.name}</comment> disabled itself during activation</>")
+
+    def _activate_parallel(self, modules: list[_ModuleInfo], dependencies: dict[str, set[str]]) -> None:
+        io = self._io
+        buffers = {m.name: _create_buffered_io(io) for m in modules}
+        futures: dict[str, Future] = {}
+        running: dict[Future, _ModuleInfo] = {}
+        pending = list(modules)
+        completed: set[str] = set()
+        failed = False
+
+        log_debug(io, f"<fg=dark_gray>Activating modules concurrently: {', '.join(m.name for m in modules)}</>")
+        with ContextExecutor(ThreadPoolExecutor(max_workers=min(len(modules), 32), thread_name_prefix="ps-activate")) as executor:
+            while running or (pending and not failed):
+                if not failed:
+                    for mod in [m for m in pending if dependencies[m.name] <= completed]:
+                        pending.remove(mod)
+                        future = executor.submit(self._call_activate, mod, buffers[mod.name])
+                        futures[mod.name] = future
+                        running[future] = mod
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    mod = running.pop(future)
+                    if future.exception() is not None:
+                        failed = True
+                    else:
+                        completed.add(mod.name)
+
+        for mod in modules:
+            future = futures.get(mod.name)
+            if future is None:
+                continue
+            log_debug(io, f"<fg=dark_gray>Executing activate for module <comment>{mod.name}</comment></>")
+            _flush_buffered_io(buffers[mod.name], io)
+            error = future.exception()
+            if error is not None:
+                io.write_error_line(f"<error>Error during activation of module {mod.name}: {error}</error>")
+                raise error
+            self._complete_activation(mod, future.result())
 
     def get_event_handlers(self, event_type: str) -> list[Callable[..., Any]]:
         return [
@@ -1,6 +1,9 @@
 import os
 import site
 import sys
+import time
+from pathlib import Path
+from typing import Callable, Optional
 
 import cleo.events.console_events
 from cleo.events.console_command_event import ConsoleCommandEvent
@@ -17,16 +20,23 @@ from poetry.utils.env import EnvManager
 from ps.di import DI
 from ps.plugin.sdk.setup_extension_template import ExtensionTemplate
 from ps.plugin.sdk.logging import log_debug, log_verbose
-from ps.plugin.sdk.project import Environment
+from ps.plugin.sdk.project import Environment, parse_project
 from ps.plugin.sdk.settings import PluginSettings, parse_plugin_settings_from_document
 
-from .commands import DisableCommand, EnableCommand, SetupExtensionCommand
+from .commands import DisableCommand, EnableCommand, ProfileStartupCommand, SetupExtensionCommand
 from .commands.create_extension import (
     BlankClassTemplate,
     BlankFunctionTemplate,
     CustomCommandTemplate,
 )
+from ._discovery_cache import _DiscoveryCache
+from ._environment_cache import _EnvironmentCache
+from ._dispatch import _compile_dispatch_plan, _EventContext
 from ._modules_handler import _ModulesHandler
+from ._profiler import _Profiler, _report_profile
+from ._site_packages import _add_site_packages
+from ._telemetry import _elapsed_ms, _Telemetry
+from ._venv_cache import _VenvCache
 
 _EVENT_LISTENERS = {
     "command": cleo.events.console_events.COMMAND,
@@ -42,23 +52,17 @@ def _create_standard_io() -> IO:
     return IO(ArgvInput(), output, error_output)
 
 
-def _activate_project_venv(application: Application, io: IO) -> None:
-    env_prefix = os.environ.get("VIRTUAL_ENV", os.environ.get("CONDA_PREFIX"))
-    conda_env_name = os.environ.get("CONDA_DEFAULT_ENV")
-    if env_prefix is not None and conda_env_name != "base":
-        log_debug(io, f"Already in virtual environment <comment>{env_prefix}</comment>, skipping venv activation")
-        return
-
+def _resolve_project_venv(application: Application, io: IO) -> Optional[tuple[Path, Path]]:
     try:
         env = EnvManager(application.poetry).get()
         venv_path = env.path
     except Exception as e:
         log_debug(io, f"Could not resolve project environment: <comment>{e}</comment>, skipping venv activation")
-        return
+        return None
 
     if not venv_path.exists():
         log_debug(io, "Project environment does not exist, skipping venv activation")
-        return
+        return None
 
     if sys.platform == "win32":
         site_pkgs = venv_path / "Lib" / "site-packages"
@@ -68,9 +72,42 @@ def _activate_project_venv(application: Application, io: IO) -> None:
 
     if not site_pkgs.exists():
         log_debug(io, f"Site-packages not found at <comment>{site_pkgs}</comment>, skipping venv activation")
+        return None
+
+    return venv_path, site_pkgs
+
+
+def _get_envs_file(application: Application) -> Optional[Path]:
+    try:
+        return EnvManager(application.poetry).envs_file.path
+    except Exception:
+        return None
+
+
+def _activate_project_venv(application: Application, io: IO, cache: Optional[_VenvCache] = None) -> None:
+    env_prefix = os.environ.get("VIRTUAL_ENV", os.environ.get("CONDA_PREFIX"))
+    conda_env_name = os.environ.get("CONDA_DEFAULT_ENV")
+    if env_prefix is not None and conda_env_name != "base":
+        log_debug(io, f"Already in virtual environment <comment>{env_prefix}</comment>, skipping venv activation")
         return
 
-    site.addsitedir(str(site_pkgs))
+    pyproject_path = application.poetry.pyproject_path
+    envs_file = _get_envs_file(application) if cache is not None else None
+    resolved = cache.load(pyproject_path, envs_file) if cache is not None else None
+    if resolved is not None:
+        log_debug(io, f"Using cached project environment <comment>{resolved[0]}</comment>")
+    else:
+        resolved = _resolve_project_venv(application, io)
+        if resolved is None:
+            return
+        if cache is not None:
+            cache.store(pyproject_path, *resolved, envs_file=envs_file)
+    venv_path, site_pkgs = resolved
+
+    if cache is None:
+        site.addsitedir(str(site_pkgs))
+    elif _add_site_packages(site_pkgs) is not None:
+        log_debug(io, "Deferring <comment>.pth</comment> processing until an import needs it")
 
     bin_dir = venv_path / ("Scripts" if sys.platform == "win32" else "bin")
     if bin_dir.exists():
@@ -83,23 +120,66 @@ def _resolve_settings(environment: Environment) -> PluginSettings:
     return environment.host_project.plugin_settings
 
 
+def _resolve_host_settings(settings: PluginSettings, pyproject_path: Path) -> PluginSettings:
+    visited = {pyproject_path.resolve()}
+    while settings.host_project is not None:
+        host_project = parse_project(pyproject_path.parent / settings.host_project)
+        if host_project is None or host_project.path in visited:
+            break
+        visited.add(host_project.path)
+        settings, pyproject_path = host_project.plugin_settings, host_project.path
+    return settings
+
+
+def _load_environment(path: Path, io: IO, cache: Optional[_EnvironmentCache]) -> Environment:
+    if cache is not None:
+        environment = cache.load(path, io)
+        if environment is not None:
+            log_debug(io, f"<fg=dark_gray>Loaded environment from cache {cache.path(path)}</>")
+            return environment
+    environment = Environment(path)
+    if cache is not None and cache.store(path, environment):
+        log_debug(io, f"<fg=dark_gray>Stored environment in cache {cache.path(path)}</>")
+    return environment
+
+
+def _register_extension_templates(di: DI) -> None:
+    di.register(ExtensionTemplate).factory(lambda: BlankFunctionTemplate())
+    di.register(ExtensionTemplate).factory(lambda: BlankClassTemplate())
+    di.register(ExtensionTemplate).factory(lambda: CustomCommandTemplate())
+
+
 class Plugin(ApplicationPlugin):
     def __init__(self) -> None:
         super().__init__()
         self._di = DI()
+        self._profiler = _Profiler()
+        self._telemetry = _Telemetry.from_environment()
+        self._activation_start = time.perf_counter()
 
     def activate(self, application: Application) -> None:
+        io = self._ensure_io(application)
+        self._activation_start = time.perf_counter()
+        try:
+            with self._profiler.span("activate"):
+                self._activate(application, io)
+        finally:
+            _report_profile(self._profiler, io)
+
+    def _activate(self, application: Application, io: IO) -> None:
         assert application.event_dispatcher is not None
         event_dispatcher = application.event_dispatcher
+        profiler = self._profiler
 
-        io = self._ensure_io(application)
         project_toml = application.poetry.pyproject.data
 
         application.add(EnableCommand(application))
         application.add(DisableCommand(application))
+        application.add(ProfileStartupCommand(profiler))
 
         try:
-            settings: PluginSettings = parse_plugin_settings_from_document(project_toml)
+            with profiler.span("settings"):
+                settings: PluginSettings = parse_plugin_settings_from_document(project_toml)
             if not settings.enabled:
                 log_verbose(io, f"<fg=yellow>ps-plugin not enabled or disabled in configuration in {application.poetry.pyproject.file}</>")
                 return
@@ -109,26 +189,74 @@ class Plugin(ApplicationPlugin):
 
         log_verbose(io, "<info>Starting activation</info>")
 
-        _activate_project_venv(application, io)
+        with profiler.span("venv"):
+            _activate_project_venv(application, io, _VenvCache() if settings.venv_cache is not False else None)
+
+        environment_cache = _EnvironmentCache() if settings.environment_cache is not False else None
+
+        def _create_environment(path: Path) -> Environment:
+            with profiler.span("environment"):
+                return _load_environment(path, io, environment_cache)
 
         di = self._di
         di.register(IO).factory(lambda: io)
         di.register(Application).factory(lambda: application)
-        di.register(Environment).factory(lambda path: Environment(path), application.poetry.pyproject_path)
+        di.register(Environment).factory(_create_environment, application.poetry.pyproject_path)
         di.register(PluginSettings).factory(_resolve_settings)
         di.register(EventDispatcher).factory(lambda: event_dispatcher)
+        di.register(_DiscoveryCache).factory(_DiscoveryCache)
+        di.register(_Profiler).factory(lambda: profiler)
+        di.register(_Telemetry).factory(lambda: self._telemetry)
+
+        lazy = bool(settings.lazy_activation)
+        with profiler.span("modules"):
+            if lazy:
+                host_settings = _resolve_host_settings(settings, application.poetry.pyproject_path)
+                handler = di.spawn(_ModulesHandler, plugin_settings=host_settings)
+            else:
+                handler = di.spawn(_ModulesHandler)
+            handler.discover_and_instantiate()
+            claimed = handler.register()
+
+        if lazy and claimed is not None:
+            self._defer_activation(application, di, io, handler, claimed)
+            self.poetry = application.poetry
+            return
+
+        if lazy:
+            log_verbose(io, "<fg=yellow>Lazy activation requires every module to declare its commands in poetry_register; activating now</>")
 
-        handler = di.spawn(_ModulesHandler)
-        handler.discover_and_instantiate()
         handler.activate()
 
-        di.register(ExtensionTemplate).factory(lambda: BlankFunctionTemplate())
-        di.register(ExtensionTemplate).factory(lambda: BlankClassTemplate())
-        di.register(ExtensionTemplate).factory(lambda: CustomCommandTemplate())
+        _register_extension_templates(di)
 
-        application.add(di.spawn(SetupExtensionCommand))
+        with profiler.span("setup-extension"):
+            application.add(di.spawn(SetupExtensionCommand))
+
+        with profiler.span("listeners"):
+            self._register_listeners(event_dispatcher, di, io, handler, _EVENT_LISTENERS)
+
+        self.poetry = application.poetry
+        self._complete_activation(io, handler, deferred=False)
+
+    def _complete_activation(self, io: IO, handler: _ModulesHandler, deferred: bool) -> None:
+        self._telemetry.emit(
+            "activation_complete",
+            duration_ms=_elapsed_ms(self._activation_start),
+            modules=handler.get_module_names(),
+            deferred=deferred,
+        )
+        log_verbose(io, "<info>Activation complete</info>")
 
-        for event_type, event_constant in _EVENT_LISTENERS.items():
+    def _register_listeners(
+        self,
+        event_dispatcher: EventDispatcher,
+        di: DI,
+        io: IO,
+        handler: _ModulesHandler,
+        listeners: dict[str, str],
+    ) -> None:
+        for event_type, event_constant in listeners.items():
             fns = handler.get_event_handlers(event_type)
             if not fns:
                 log_debug(io, f"No handlers for <comment>{event_type}</comment>; skipping listener")
@@ -136,8 +264,54 @@ class Plugin(ApplicationPlugin):
             log_verbose(io, f"Registering <fg=yellow>{len(fns)}</> handler(s) for <comment>{event_type}</comment>")
             self._register_listener(event_dispatcher, di, io, event_type, event_constant, fns)
 
-        self.poetry = application.poetry
-        log_verbose(io, "<info>Activation complete</info>")
+    def _defer_activation(
+        self,
+        application: Application,
+        di: DI,
+        io: IO,
+        handler: _ModulesHandler,
+        claimed: set[str],
+    ) -> None:
+        assert application.event_dispatcher is not None
+        event_dispatcher = application.event_dispatcher
+        command_listeners: list[Callable[[Event, str, EventDispatcher], None]] = []
+
+        def _activate_once() -> None:
+            if command_listeners:
+                return
+            log_verbose(io, "<info>Activating deferred modules</info>")
+            try:
+                with self._profiler.span("deferred activate"):
+                    handler.activate()
+                    _register_extension_templates(di)
+                    fns = handler.get_event_handlers("command")
+                    log_verbose(io, f"Registering <fg=yellow>{len(fns)}</> handler(s) for <comment>command</comment>")
+                    command_listeners.append(self._create_listener(di, io, "command", fns))
+                    self._register_listeners(
+                        event_dispatcher, di, io, handler,
+                        {k: v for k, v in _EVENT_LISTENERS.items() if k != "command"},
+                    )
+            finally:
+                _report_profile(self._profiler, io)
+            self._complete_activation(io, handler, deferred=True)
+
+        def _listener(event: Event, event_name: str, dispatcher: EventDispatcher) -> None:
+            if not command_listeners:
+                command = event.command if isinstance(event, ConsoleCommandEvent) else None
+                if command is None or command.name not in claimed:
+                    log_debug(io, f"Command <comment>{command.name if command else event_name}</comment> is not handled by any module; activation skipped")
+                    return
+                _activate_once()
+            command_listeners[0](event, event_name, dispatcher)
+
+        def _setup_extension_factory() -> SetupExtensionCommand:
+            _activate_once()
+            return di.spawn(SetupExtensionCommand)
+
+        log_verbose(io, f"Deferring activation until one of <comment>{', '.join(sorted(claimed))}</comment> runs")
+        event_dispatcher.add_listener(_EVENT_LISTENERS["command"], _listener)
+        assert SetupExtensionCommand.name is not None
+        application.command_loader.register_factory(SetupExtensionCommand.name, _setup_extension_factory)
 
     def _register_listener(
         self,
@@ -148,17 +322,34 @@ class Plugin(ApplicationPlugin):
         event_constant: str,
         fns: list,
     ) -> None:
+        event_dispatcher.add_listener(event_constant, self._create_listener(di, io, event_type, fns))
+
+    def _create_listener(
+        self,
+        di: DI,
+        io: IO,
+        event_type: str,
+        fns: list,
+    ) -> Callable[[Event, str, EventDispatcher], None]:
+        handlers = _compile_dispatch_plan(event_type, fns)
+        telemetry = self._telemetry
+
         def _listener(event: Event, event_name: str, dispatcher: EventDispatcher) -> None:  # noqa: ARG001
-            with di.scope() as scope:
-                scope.register(type(event)).factory(lambda: event)
+            with _EventContext(di, event) as context:
                 log_debug(io, f"Processing <comment>{event_name}</comment> event")
-                for fn in fns:
-                    scope.satisfy(fn)()
+                for handler in handlers:
+                    if telemetry.enabled:
+                        start = time.perf_counter()
+                        handler(context)
+                        telemetry.emit("handler_completed", event_type=event_type, handler=handler.name, duration_ms=_elapsed_ms(start))
+                    else:
+                        handler(context)
                     if isinstance(event, ConsoleCommandEvent) and not event.command_should_run():
                         log_debug(io, f"Command execution stopped after <comment>{event_type}</comment> handler")
+                        telemetry.emit("handler_stopped", event_type=event_type, handler=handler.name)
                         break
 
-        event_dispatcher.add_listener(event_constant, _listener)
+        return _listener
 
     def _ensure_io(self, application: Application) -> IO:
         io = getattr(application, "_io", None)
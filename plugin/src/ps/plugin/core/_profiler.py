@@ -0,0 +1,104 @@
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from cleo.io.io import IO
+
+PROFILE_ENV_VAR = "PS_PLUGIN_PROFILE"
+_TABLE_VALUES = ("1", "true", "yes", "table")
+
+
+@dataclass
+class _Span:
+    name: str
+    depth: int
+    thread: int
+    start: float
+    end: Optional[float] = None
+
+    @property
+    def duration(self) -> float:
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+
+class _Profiler:
+    def __init__(self) -> None:
+        self._origin = time.perf_counter()
+        self._thread = threading.get_ident()
+        self._spans: list[_Span] = []
+        self._stack: contextvars.ContextVar[tuple[_Span, ...]] = contextvars.ContextVar("ps_plugin_profiler_stack", default=())
+        self._lock = threading.Lock()
+
+    @property
+    def spans(self) -> list[_Span]:
+        with self._lock:
+            return list(self._spans)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        stack = self._stack.get()
+        span = _Span(name=name, depth=len(stack), thread=threading.get_ident(), start=time.perf_counter())
+        with self._lock:
+            self._spans.append(span)
+        token = self._stack.set((*stack, span))
+        try:
+            yield
+        finally:
+            span.end = time.perf_counter()
+            self._stack.reset(token)
+
+    def format_table(self) -> list[str]:
+        spans = self.spans
+        # Root spans started on other threads overlap the main thread's spans, so only main-thread roots make up the total.
+        total = sum(s.duration for s in spans if s.depth == 0 and s.thread == self._thread) or 1.0
+        lines = [
+            "<fg=magenta>Startup profile:</>",
+            f"  <fg=dark_gray>{'ms':>9} {'%':>6}  phase</>",
+        ]
+        for span in spans:
+            share = span.duration / total * 100
+            indent = "  " * span.depth
+            lines.append(f"  <fg=yellow>{span.duration * 1000:>9.2f}</> {share:>6.1f}  {indent}<comment>{span.name}</comment>")
+        return lines
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        pid = os.getpid()
+        events = [
+            {
+                "name": span.name,
+                "ph": "X",
+                "ts": round((span.start - self._origin) * 1_000_000, 3),
+                "dur": round(span.duration * 1_000_000, 3),
+                "pid": pid,
+                "tid": span.thread,
+            }
+            for span in self.spans
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f, indent=2)
+
+
+def _report_profile(profiler: _Profiler, io: IO) -> None:
+    target = os.environ.get(PROFILE_ENV_VAR)
+    if not target:
+        return
+    if target.lower() in _TABLE_VALUES:
+        for line in profiler.format_table():
+            io.write_error_line(line)
+        return
+    try:
+        profiler.write_chrome_trace(Path(target))
+    except OSError as e:
+        io.write_error_line(f"<error>Could not write startup profile to {target}: {e}</error>")
+        return
+    io.write_error_line(f"<fg=dark_gray>Startup profile written to {target}</>")
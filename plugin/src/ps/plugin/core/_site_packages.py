@@ -0,0 +1,45 @@
+import contextlib
+import site
+import sys
+from importlib.abc import MetaPathFinder
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+from types import ModuleType
+from typing import Optional, Sequence
+
+
+class _DeferredPthFinder(MetaPathFinder):
+    def __init__(self, site_packages: str) -> None:
+        self.site_packages = site_packages
+
+    def process(self) -> None:
+        with contextlib.suppress(ValueError):
+            sys.meta_path.remove(self)
+        site.addsitedir(self.site_packages)
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]],
+        target: Optional[ModuleType] = None,
+    ) -> Optional[ModuleSpec]:
+        self.process()
+        for finder in list(sys.meta_path):
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                return spec
+        return None
+
+
+def _add_site_packages(site_packages: Path) -> Optional[_DeferredPthFinder]:
+    path = str(site_packages)
+    if path not in sys.path:
+        sys.path.append(path)
+    if not any(site_packages.glob("*.pth")):
+        return None
+    finder = _DeferredPthFinder(path)
+    sys.meta_path.append(finder)
+    return finder
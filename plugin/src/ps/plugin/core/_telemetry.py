@@ -0,0 +1,86 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, Protocol, TextIO
+
+TELEMETRY_ENV_VAR = "PS_PLUGIN_TELEMETRY"
+
+
+class _TelemetrySink(Protocol):
+    def emit(self, record: dict[str, Any]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class _JsonlSink:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file: Optional[TextIO] = None
+        self._lock = threading.Lock()
+
+    def emit(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record, default=str)
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("a", encoding="utf-8")
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class _MemorySink:
+    def __init__(self) -> None:
+        self.records: list[dict[str, Any]] = []
+
+    def emit(self, record: dict[str, Any]) -> None:
+        self.records.append(record)
+
+    def close(self) -> None:
+        pass
+
+    def events(self, name: str) -> list[dict[str, Any]]:
+        return [r for r in self.records if r["event"] == name]
+
+
+class _Telemetry:
+    def __init__(self, sinks: Optional[list[_TelemetrySink]] = None) -> None:
+        self._sinks = list(sinks or [])
+        self._pid = os.getpid()
+
+    @classmethod
+    def from_environment(cls) -> "_Telemetry":
+        target = os.environ.get(TELEMETRY_ENV_VAR)
+        return cls([_JsonlSink(Path(target))] if target else None)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._sinks)
+
+    def add_sink(self, sink: _TelemetrySink) -> None:
+        self._sinks.append(sink)
+
+    def emit(self, event: str, **fields: Any) -> None:
+        if not self._sinks:
+            return
+        record = {"event": event, "ts": time.time(), "pid": self._pid, **fields}
+        for sink in self._sinks:
+            try:
+                sink.emit(record)
+            except OSError:
+                continue
+
+    def close(self) -> None:
+        for sink in self._sinks:
+            sink.close()
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 3)
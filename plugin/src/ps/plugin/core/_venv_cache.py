@@ -0,0 +1,77 @@
+import contextlib
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+from ._discovery_cache import _default_cache_dir
+
+_CACHE_VERSION = 1
+
+
+def _stat_key(path: Path) -> Optional[list[int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _watched_paths(pyproject_path: Path, envs_file: Optional[Path]) -> list[Path]:
+    project_dir = pyproject_path.parent
+    paths = [pyproject_path, project_dir / "poetry.toml", project_dir / ".venv"]
+    if envs_file is not None:
+        paths.append(envs_file)
+    return paths
+
+
+class _VenvCache:
+    def __init__(self, directory: Optional[Path] = None) -> None:
+        self._directory = directory or _default_cache_dir("venv")
+
+    def path(self, pyproject_path: Path) -> Path:
+        key_source = f"{pyproject_path.resolve()}\0{sys.version_info[:2]}"
+        return self._directory / f"{hashlib.sha256(key_source.encode()).hexdigest()[:16]}.json"
+
+    def load(self, pyproject_path: Path, envs_file: Optional[Path] = None) -> Optional[tuple[Path, Path]]:
+        try:
+            with self.path(pyproject_path).open(encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+            return None
+        watched: dict[str, Any] = data.get("watched", {})
+        expected = {str(p): _stat_key(p) for p in _watched_paths(pyproject_path, envs_file)}
+        if watched != expected:
+            return None
+        venv_path, site_packages = Path(data["venv"]), Path(data["site_packages"])
+        if _stat_key(venv_path) != data.get("venv_stat") or not site_packages.is_dir():
+            return None
+        return venv_path, site_packages
+
+    def store(self, pyproject_path: Path, venv_path: Path, site_packages: Path, envs_file: Optional[Path] = None) -> bool:
+        data = {
+            "version": _CACHE_VERSION,
+            "venv": str(venv_path),
+            "venv_stat": _stat_key(venv_path),
+            "site_packages": str(site_packages),
+            "watched": {str(p): _stat_key(p) for p in _watched_paths(pyproject_path, envs_file)},
+        }
+        target = self.path(pyproject_path)
+        temp = target.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with temp.open("w", encoding="utf-8") as f:
+                json.dump(data, f)
+            temp.replace(target)
+        except OSError:
+            with contextlib.suppress(OSError):
+                temp.unlink()
+            return False
+        return True
+
+    def clear(self, pyproject_path: Path) -> None:
+        self.path(pyproject_path).unlink(missing_ok=True)
@@ -1,8 +1,10 @@
 from ._enable import DisableCommand, EnableCommand
+from ._profile_startup import ProfileStartupCommand
 from .create_extension._command import SetupExtensionCommand
 
 __all__ = [
     "DisableCommand",
     "EnableCommand",
+    "ProfileStartupCommand",
     "SetupExtensionCommand",
 ]
@@ -0,0 +1,34 @@
+from pathlib import Path
+
+from cleo.commands.command import Command
+from cleo.io.inputs.option import Option
+
+from .._profiler import PROFILE_ENV_VAR, _Profiler
+
+
+class ProfileStartupCommand(Command):
+    name = "ps profile-startup"
+    description = "Show where ps-plugin activation time was spent in the current invocation."
+    help = (
+        "Prints the hierarchical timings recorded while the plugin activated for this invocation. "
+        f"Set the <comment>{PROFILE_ENV_VAR}</comment> environment variable to <comment>1</comment> to print the same table "
+        "for any command, or to a file path to write a Chrome trace."
+    )
+    options = [
+        Option("--trace", flag=False, description="Write the profile as Chrome trace JSON to the given path."),
+    ]
+
+    def __init__(self, profiler: _Profiler) -> None:
+        super().__init__()
+        self._profiler = profiler
+
+    def handle(self) -> int:
+        for line in self._profiler.format_table():
+            self.line(line)
+
+        trace = self.option("trace")
+        if trace:
+            path = Path(trace)
+            self._profiler.write_chrome_trace(path)
+            self.line(f"<info>Chrome trace written to {path}</info>")
+        return 0
@@ -0,0 +1,144 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from ps.plugin.core._discovery_cache import _DiscoveryCache, _compute_fingerprint, _default_cache_dir
+
+
+@pytest.fixture
+def site_dir(tmp_path: Path) -> Path:
+    site = tmp_path / "site-packages"
+    site.mkdir()
+    (site / "pkg_a-1.0.dist-info").mkdir()
+    (site / "pkg_b-2.0.dist-info").mkdir()
+    return site
+
+
+def _cache(tmp_path: Path, site_dir: Path) -> _DiscoveryCache:
+    return _DiscoveryCache(tmp_path / "cache", search_paths=[str(site_dir)])
+
+
+def _record(path: str | None = None) -> dict:
+    return {"name": "mod", "handlers": {"activate": "pkg:Mod.poetry_activate"}, "distribution": "pkg", "path": path}
+
+
+# --- _default_cache_dir ---
+
+
+def test_default_cache_dir_honours_poetry_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("POETRY_CACHE_DIR", str(tmp_path))
+    assert _default_cache_dir() == tmp_path / "ps-plugin" / "discovery"
+
+
+# --- _compute_fingerprint ---
+
+
+def test_fingerprint_is_stable(site_dir):
+    assert _compute_fingerprint([str(site_dir)]) == _compute_fingerprint([str(site_dir)])
+
+
+def test_fingerprint_changes_when_distribution_added(site_dir):
+    before = _compute_fingerprint([str(site_dir)])
+    (site_dir / "pkg_c-1.0.dist-info").mkdir()
+    assert _compute_fingerprint([str(site_dir)]) != before
+
+
+def test_fingerprint_changes_when_distribution_touched(site_dir):
+    before = _compute_fingerprint([str(site_dir)])
+    dist_info = site_dir / "pkg_a-1.0.dist-info"
+    stat = dist_info.stat()
+    os.utime(dist_info, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert _compute_fingerprint([str(site_dir)]) != before
+
+
+def test_fingerprint_ignores_regular_packages(site_dir):
+    before = _compute_fingerprint([str(site_dir)])
+    (site_dir / "some_package").mkdir()
+    assert _compute_fingerprint([str(site_dir)]) == before
+
+
+def test_fingerprint_skips_missing_paths(tmp_path):
+    assert _compute_fingerprint([str(tmp_path / "missing")])
+
+
+# --- _DiscoveryCache ---
+
+
+def test_load_returns_none_without_file(tmp_path, site_dir):
+    assert _cache(tmp_path, site_dir).load() is None
+
+
+def test_store_and_load_roundtrip(tmp_path, site_dir):
+    cache = _cache(tmp_path, site_dir)
+    assert cache.store([_record()])
+
+    assert _cache(tmp_path, site_dir).load() == [_record()]
+
+
+def test_cache_file_keyed_by_search_paths(tmp_path, site_dir):
+    other = _DiscoveryCache(tmp_path / "cache", search_paths=[str(site_dir), "/other"])
+    assert _cache(tmp_path, site_dir).path != other.path
+
+
+def test_load_invalidated_by_new_distribution(tmp_path, site_dir):
+    _cache(tmp_path, site_dir).store([_record()])
+    (site_dir / "pkg_c-1.0.dist-info").mkdir()
+
+    assert _cache(tmp_path, site_dir).load() is None
+
+
+def test_load_invalidated_by_modified_source(tmp_path, site_dir):
+    source = tmp_path / "module.py"
+    source.write_text("")
+    _cache(tmp_path, site_dir).store([_record(str(source))])
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert _cache(tmp_path, site_dir).load() is None
+
+
+def test_load_ignores_corrupted_file(tmp_path, site_dir):
+    cache = _cache(tmp_path, site_dir)
+    cache.path.parent.mkdir(parents=True)
+    cache.path.write_text("{not json")
+
+    assert cache.load() is None
+
+
+def test_load_ignores_other_version(tmp_path, site_dir):
+    cache = _cache(tmp_path, site_dir)
+    cache.store([_record()])
+    data = json.loads(cache.path.read_text())
+    data["version"] = -1
+    cache.path.write_text(json.dumps(data))
+
+    assert cache.load() is None
+
+
+def test_store_returns_false_when_directory_not_writable(tmp_path, site_dir):
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    cache = _DiscoveryCache(blocker / "cache", search_paths=[str(site_dir)])
+
+    assert cache.store([_record()]) is False
+
+
+def test_selection_is_cached_apart_from_full_scan(tmp_path, site_dir):
+    cache = _cache(tmp_path, site_dir)
+    assert cache.store([_record()], ["Mod", "other"])
+
+    assert cache.load() is None
+    assert cache.load(["other", "mod"]) == [_record()]
+    assert cache.load(["mod"]) is None
+    assert cache.path_for(["mod", "other"]) != cache.path
+
+
+def test_clear_removes_cache_file(tmp_path, site_dir):
+    cache = _cache(tmp_path, site_dir)
+    cache.store([_record()])
+    cache.clear()
+
+    assert not cache.path.exists()
+    cache.clear()
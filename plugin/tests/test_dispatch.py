@@ -0,0 +1,196 @@
+import typing
+from typing import Any, Callable, Optional
+from unittest.mock import MagicMock, patch
+
+import pytest
+from cleo.events.console_command_event import ConsoleCommandEvent
+from cleo.events.console_terminate_event import ConsoleTerminateEvent
+from cleo.events.event import Event
+from cleo.io.io import IO
+
+from ps.di import DI, Lifetime
+from ps.plugin.core._dispatch import _compile_dispatch_plan, _compile_handler, _CompiledHandler, _EventContext
+
+
+class _Service:
+    pass
+
+
+def _terminate_event() -> ConsoleTerminateEvent:
+    return ConsoleTerminateEvent(MagicMock(), MagicMock(), 0)
+
+
+def _dispatch(di: DI, fn: Callable[..., Any], event: Event) -> tuple[_CompiledHandler, Any]:
+    handler = _compile_handler(fn, type(event))
+    with _EventContext(di, event) as context:
+        return handler, handler(context)
+
+
+# --- _compile_handler ---
+
+
+def test_event_parameter_receives_event():
+    event = _terminate_event()
+
+    def fn(event: ConsoleTerminateEvent) -> ConsoleTerminateEvent:
+        return event
+
+    handler, result = _dispatch(DI(), fn, event)
+    assert handler.compiled
+    assert result is event
+
+
+def test_event_base_class_parameter_receives_event():
+    event = _terminate_event()
+
+    def fn(event: Event) -> Event:
+        return event
+
+    assert _dispatch(DI(), fn, event)[1] is event
+
+
+def test_registered_dependency_is_resolved_per_call():
+    di = DI()
+    service = _Service()
+    di.register(_Service).factory(lambda: service)
+
+    def fn(service: _Service, event: ConsoleTerminateEvent) -> _Service:  # noqa: ARG001
+        return service
+
+    assert _dispatch(di, fn, _terminate_event())[1] is service
+
+
+def test_transient_dependency_is_created_per_dispatch():
+    di = DI()
+    di.register(_Service, lifetime=Lifetime.TRANSIENT).implementation(_Service)
+
+    def fn(service: _Service) -> _Service:
+        return service
+
+    handler = _compile_handler(fn, ConsoleTerminateEvent)
+    event = _terminate_event()
+    with _EventContext(di, event) as first, _EventContext(di, event) as second:
+        assert handler(first) is not handler(second)
+
+
+def test_scoped_dependency_is_shared_within_event_and_disposed():
+    di = DI()
+    closed: list[_Service] = []
+
+    class _Resource(_Service):
+        def close(self) -> None:
+            closed.append(self)
+
+    di.register(_Service, lifetime=Lifetime.SCOPED).implementation(_Resource)
+
+    def fn(first: _Service, second: Optional[_Service]) -> tuple[_Service, Optional[_Service]]:
+        return first, second
+
+    first, second = _dispatch(di, fn, _terminate_event())[1]
+    assert first is second
+    assert closed == [first]
+
+
+def test_optional_missing_dependency_is_none():
+    def fn(service: Optional[_Service]) -> Optional[_Service]:
+        return service
+
+    assert _dispatch(DI(), fn, _terminate_event())[1] is None
+
+
+def test_missing_dependency_uses_default():
+    sentinel = object()
+
+    def fn(service: _Service = sentinel) -> _Service:  # type: ignore[assignment]
+        return service
+
+    assert _dispatch(DI(), fn, _terminate_event())[1] is sentinel
+
+
+def test_missing_required_dependency_raises():
+    def fn(service: _Service) -> _Service:
+        return service
+
+    with pytest.raises(ValueError, match="Cannot resolve required dependency"):
+        _dispatch(DI(), fn, _terminate_event())
+
+
+def test_list_parameter_resolves_many():
+    di = DI()
+    di.register(_Service).factory(_Service)
+    di.register(_Service).factory(_Service)
+
+    def fn(services: list[_Service]) -> list[_Service]:
+        return services
+
+    assert len(_dispatch(di, fn, _terminate_event())[1]) == 2
+
+
+def test_di_parameter_receives_scope_with_event():
+    event = _terminate_event()
+
+    def fn(di: DI) -> Optional[ConsoleTerminateEvent]:
+        return di.resolve(ConsoleTerminateEvent)
+
+    assert _dispatch(DI(), fn, event)[1] is event
+
+
+def test_unannotated_parameter_falls_back_to_scope_satisfy():
+    di = DI()
+    io = MagicMock(spec=IO)
+    di.register(IO).factory(lambda: io)
+
+    def fn(io):
+        return io
+
+    handler, result = _dispatch(di, fn, _terminate_event())
+    assert not handler.compiled
+    assert result is io
+
+
+def test_bound_method_is_compiled():
+    class Module:
+        def poetry_terminate(self, event: ConsoleTerminateEvent) -> ConsoleTerminateEvent:
+            return event
+
+    event = _terminate_event()
+    handler, result = _dispatch(DI(), Module().poetry_terminate, event)
+    assert handler.compiled
+    assert result is event
+
+
+# --- _EventContext ---
+
+
+def test_context_creates_scope_only_when_requested():
+    di = DI()
+    di.scope = MagicMock(wraps=di.scope)  # type: ignore[method-assign]
+
+    def fn(event: ConsoleTerminateEvent) -> ConsoleTerminateEvent:
+        return event
+
+    _dispatch(di, fn, _terminate_event())
+    di.scope.assert_not_called()
+
+
+def test_context_closes_scope_on_exit():
+    with _EventContext(DI(), _terminate_event()) as context:
+        scope = context.scope
+        assert scope.resolve(ConsoleTerminateEvent) is context.event
+    assert scope.resolve(ConsoleTerminateEvent) is None
+
+
+# --- _compile_dispatch_plan ---
+
+
+def test_dispatch_plan_inspects_type_hints_once():
+    def fn(event: ConsoleCommandEvent) -> ConsoleCommandEvent:
+        return event
+
+    with patch("ps.plugin.core._dispatch.get_type_hints", wraps=typing.get_type_hints) as hints:
+        plan = _compile_dispatch_plan("command", [fn])
+        event = MagicMock(spec=ConsoleCommandEvent)
+        for _ in range(3):
+            with _EventContext(DI(), event) as context:
+                plan[0](context)
+    assert hints.call_count == 1
@@ -0,0 +1,126 @@
+import os
+import pickle
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from cleo.io.io import IO
+
+from ps.plugin.core import _environment_cache
+from ps.plugin.core._environment_cache import _EnvironmentCache
+from ps.plugin.sdk.project import Environment
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    root = tmp_path / "workspace"
+    lib = root / "lib"
+    lib.mkdir(parents=True)
+    (lib / "pyproject.toml").write_text('[project]\nname = "lib"\nversion = "1.0.0"\n')
+    (root / "pyproject.toml").write_text(
+        '[project]\nname = "app"\nversion = "0.1.0"\n\n'
+        '[tool.poetry.dependencies]\nlib = { path = "lib", develop = true }\n'
+    )
+    return root / "pyproject.toml"
+
+
+def _cache(tmp_path: Path) -> _EnvironmentCache:
+    return _EnvironmentCache(tmp_path / "cache")
+
+
+def _touch(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_load_returns_none_without_file(tmp_path, workspace):
+    assert _cache(tmp_path).load(workspace) is None
+
+
+def test_store_and_load_roundtrip(tmp_path, workspace):
+    environment = Environment(workspace)
+    assert _cache(tmp_path).store(workspace, environment)
+
+    loaded = _cache(tmp_path).load(workspace)
+    assert loaded is not None
+    assert {p.name.value for p in loaded.projects} == {"app", "lib"}
+    assert loaded.host_project.path == environment.host_project.path
+
+
+def test_loaded_environment_keeps_documents_writable(tmp_path, workspace):
+    _cache(tmp_path).store(workspace, Environment(workspace))
+
+    loaded = _cache(tmp_path).load(workspace)
+    assert loaded is not None
+    loaded.entry_project.version.set("2.0.0")
+    assert loaded.entry_project.document["project"]["version"] == "2.0.0"
+
+
+def test_load_invalidated_by_modified_project(tmp_path, workspace):
+    _cache(tmp_path).store(workspace, Environment(workspace))
+    _touch(workspace)
+
+    assert _cache(tmp_path).load(workspace) is None
+
+
+def test_load_invalidated_by_modified_dependency_project(tmp_path, workspace):
+    _cache(tmp_path).store(workspace, Environment(workspace))
+    _touch(workspace.parent / "lib" / "pyproject.toml")
+
+    assert _cache(tmp_path).load(workspace) is None
+
+
+def test_load_invalidated_by_removed_project(tmp_path, workspace):
+    _cache(tmp_path).store(workspace, Environment(workspace))
+    (workspace.parent / "lib" / "pyproject.toml").unlink()
+
+    assert _cache(tmp_path).load(workspace) is None
+
+
+def test_load_ignores_corrupted_file(tmp_path, workspace):
+    cache = _cache(tmp_path)
+    cache.path(workspace).parent.mkdir(parents=True)
+    cache.path(workspace).write_bytes(b"not a pickle")
+    io = MagicMock(spec=IO)
+    io.is_debug.return_value = True
+
+    assert cache.load(workspace, io) is None
+    assert "Ignoring unreadable environment cache" in io.write_line.call_args[0][0]
+
+
+def test_load_invalidated_by_upgraded_distribution(tmp_path, workspace, monkeypatch):
+    _cache(tmp_path).store(workspace, Environment(workspace))
+    original = _environment_cache._distribution_version
+    monkeypatch.setattr(_environment_cache, "_distribution_version", lambda name: "99.0" if name == "pydantic" else original(name))
+
+    assert _cache(tmp_path).load(workspace) is None
+
+
+def test_load_ignores_other_version(tmp_path, workspace):
+    cache = _cache(tmp_path)
+    cache.path(workspace).parent.mkdir(parents=True)
+    with cache.path(workspace).open("wb") as f:
+        pickle.dump({"version": -1, "sources": {}}, f)
+
+    assert cache.load(workspace) is None
+
+
+def test_cache_file_keyed_by_entry_project(tmp_path, workspace):
+    cache = _cache(tmp_path)
+    assert cache.path(workspace) != cache.path(workspace.parent / "lib" / "pyproject.toml")
+
+
+def test_store_returns_false_when_directory_not_writable(tmp_path, workspace):
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    cache = _EnvironmentCache(blocker / "cache")
+
+    assert cache.store(workspace, Environment(workspace)) is False
+
+
+def test_clear_removes_cache_file(tmp_path, workspace):
+    cache = _cache(tmp_path)
+    cache.store(workspace, Environment(workspace))
+    cache.clear(workspace)
+
+    assert not cache.path(workspace).exists()
@@ -1,36 +1,53 @@
+import threading
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+from cleo.io.buffered_io import BufferedIO
+from cleo.io.inputs.argument import Argument
+from cleo.io.inputs.argv_input import ArgvInput
+from cleo.io.inputs.definition import Definition
+from cleo.io.inputs.option import Option
 from cleo.io.io import IO
 
 from ps.di import DI
+from ps.plugin.core._discovery_cache import _DiscoveryCache
 from ps.plugin.core._modules_handler import (
     _ModuleInfo,
     _ModulesHandler,
     _detect_collisions,
     _event_to_method_name,
+    _from_record,
     _get_class_name,
     _get_defining_class,
     _get_distribution,
     _get_module_path,
+    _get_entry_point_hints,
+    _get_reference,
     _is_static_or_classmethod,
     _is_unbound_method,
+    _load_hinted_module_infos,
     _load_module_infos,
+    _order_modules,
+    _resolve_reference,
     _scan_class,
     _scan_function,
+    _to_record,
 )
 from ps.plugin.sdk.settings import PluginSettings
 
 _PATCH_TARGET = "ps.plugin.core._modules_handler._load_module_infos"
+_HINTED_PATCH_TARGET = "ps.plugin.core._modules_handler._load_hinted_module_infos"
 
 
-def _make_di(modules: list[str] | None) -> DI:
+def _make_di(modules: list[str] | None, *, io: IO | None = None, settings: dict[str, object] | None = None) -> DI:
     di = DI()
-    io = MagicMock(spec=IO)
-    io.is_verbose.return_value = False
-    io.is_debug.return_value = False
+    if io is None:
+        io = MagicMock(spec=IO)
+        io.is_verbose.return_value = False
+        io.is_debug.return_value = False
     di.register(IO).factory(lambda: io)
-    di.register(PluginSettings).factory(lambda: PluginSettings(modules=modules))
+    di.register(PluginSettings).factory(lambda: PluginSettings.model_validate({"modules": modules, **(settings or {})}))
     return di
 
 
@@ -552,6 +569,22 @@ def test_discover_verbose_logs_selected_and_unselected():
     assert any("mod-b" in c for c in write_calls)
 
 
+def test_discover_verbose_reports_unselected_list_unavailable_when_hinted():
+    di = _make_di(modules=["mod-a"])
+    io = di.resolve(IO)
+    assert io is not None
+    io.is_verbose.return_value = True  # type: ignore[attr-defined]
+    io.is_debug.return_value = False  # type: ignore[attr-defined]
+    handler = di.spawn(_ModulesHandler)
+
+    with patch("ps.plugin.core._modules_handler._load_hinted_module_infos", return_value=[_info("mod-a", ["command"])]):
+        handler.discover_and_instantiate()
+
+    write_calls = [str(c) for c in io.write_line.call_args_list]  # type: ignore[attr-defined]
+    assert any("Discovered but not selected" in c and "unavailable" in c for c in write_calls)
+    assert handler.get_module_names() == ["mod-a"]
+
+
 def test_discover_debug_logs_module_paths():
     di = _make_di(modules=["mod-a"])
     io = di.resolve(IO)
@@ -631,3 +664,473 @@ def test_discover_instantiates_class_based_module():
     assert handler.get_module_names() == ["inst"]
     handlers = handler.get_event_handlers("command")
     assert len(handlers) == 1
+
+
+# --- discovery cache ---
+
+
+def _make_cache(records: list | None, selection_records: list | None = None) -> MagicMock:
+    cache = MagicMock(spec=_DiscoveryCache)
+    cache.load.side_effect = lambda selection=None: records if selection is None else selection_records
+    cache.store.return_value = True
+    return cache
+
+
+def test_discover_stores_scanned_modules_in_cache():
+    di = _make_di(modules=["inst"])
+    cache = _make_cache(None)
+    di.register(_DiscoveryCache).factory(lambda: cache)
+    handler = di.spawn(_ModulesHandler)
+    modules = _scan_class(_InstantiableModule, "test-dist")
+
+    with patch(_PATCH_TARGET, return_value=modules):
+        handler.discover_and_instantiate()
+
+    records = cache.store.call_args[0][0]
+    assert records[0]["name"] == "inst"
+    assert records[0]["handlers"]["activate"] == f"{__name__}:_InstantiableModule.poetry_activate"
+
+
+def test_discover_skips_scan_on_cache_hit():
+    di = _make_di(modules=["inst"])
+    records = [_to_record(m) for m in _scan_class(_InstantiableModule, "test-dist")]
+    di.register(_DiscoveryCache).factory(lambda: _make_cache(records))
+    handler = di.spawn(_ModulesHandler)
+
+    with patch(_PATCH_TARGET) as load_mock:
+        handler.discover_and_instantiate()
+
+    load_mock.assert_not_called()
+    assert handler.get_module_names() == ["inst"]
+    assert len(handler.get_event_handlers("command")) == 1
+
+
+def test_discover_does_not_resolve_unselected_cached_modules():
+    di = _make_di(modules=["inst"])
+    records = [_to_record(m) for m in _scan_class(_InstantiableModule, "test-dist")]
+    records.append({"name": "other", "handlers": {"command": "missing_package_xyz:handler"}, "distribution": None, "path": None})
+    di.register(_DiscoveryCache).factory(lambda: _make_cache(records))
+    handler = di.spawn(_ModulesHandler)
+
+    with patch(_PATCH_TARGET) as load_mock:
+        handler.discover_and_instantiate()
+
+    load_mock.assert_not_called()
+    assert handler.get_module_names() == ["inst"]
+
+
+def test_discover_reuses_cached_hinted_load(tmp_path):
+    cache = _DiscoveryCache(tmp_path / "cache", search_paths=[str(tmp_path)])
+    modules = _scan_class(_InstantiableModule, "test-dist")
+
+    first = _make_di(modules=["inst"])
+    first.register(_DiscoveryCache).factory(lambda: cache)
+    with patch(_HINTED_PATCH_TARGET, return_value=modules), patch(_PATCH_TARGET) as scan_mock:
+        first.spawn(_ModulesHandler).discover_and_instantiate()
+    scan_mock.assert_not_called()
+
+    second = _make_di(modules=["inst"])
+    second.register(_DiscoveryCache).factory(lambda: cache)
+    handler = second.spawn(_ModulesHandler)
+    with patch(_HINTED_PATCH_TARGET) as hinted_mock, patch(_PATCH_TARGET) as scan_mock:
+        handler.discover_and_instantiate()
+
+    hinted_mock.assert_not_called()
+    scan_mock.assert_not_called()
+    assert cache.load() is None
+    assert handler._discovery_source == "hinted cache"
+    assert handler.get_module_names() == ["inst"]
+    assert len(handler.get_event_handlers("command")) == 1
+
+
+def test_discover_ignores_cached_hinted_load_for_other_selection(tmp_path):
+    cache = _DiscoveryCache(tmp_path / "cache", search_paths=[str(tmp_path)])
+    cache.store([_to_record(m) for m in _scan_class(_InstantiableModule, "test-dist")], ["inst"])
+    di = _make_di(modules=["inst", "other"])
+    di.register(_DiscoveryCache).factory(lambda: cache)
+    handler = di.spawn(_ModulesHandler)
+
+    with patch(_HINTED_PATCH_TARGET, return_value=None) as hinted_mock, patch(_PATCH_TARGET, return_value=[]):
+        handler.discover_and_instantiate()
+
+    hinted_mock.assert_called_once()
+    assert handler._discovery_source == "scan"
+
+
+def test_discover_rescans_when_cached_reference_is_stale():
+    di = _make_di(modules=["inst"])
+    cache = _make_cache([{"name": "inst", "handlers": {"command": "missing_package_xyz:handler"}, "distribution": None, "path": None}])
+    di.register(_DiscoveryCache).factory(lambda: cache)
+    handler = di.spawn(_ModulesHandler)
+    modules = _scan_class(_InstantiableModule, "test-dist")
+
+    with patch(_PATCH_TARGET, return_value=modules) as load_mock:
+        handler.discover_and_instantiate()
+
+    load_mock.assert_called_once()
+    cache.clear.assert_called_once_with(None)
+    assert handler.get_module_names() == ["inst"]
+
+
+def test_discover_ignores_cache_when_disabled_in_settings():
+    di = DI()
+    io = MagicMock(spec=IO)
+    io.is_verbose.return_value = False
+    io.is_debug.return_value = False
+    cache = _make_cache(None)
+    di.register(IO).factory(lambda: io)
+    di.register(PluginSettings).factory(lambda: PluginSettings.model_validate({"modules": ["mod-a"], "discovery-cache": False}))
+    di.register(_DiscoveryCache).factory(lambda: cache)
+    handler = di.spawn(_ModulesHandler)
+
+    with patch(_PATCH_TARGET, return_value=[_info("mod-a", ["command"])]):
+        handler.discover_and_instantiate()
+
+    cache.load.assert_not_called()
+    cache.store.assert_not_called()
+
+
+def test_discover_does_not_cache_unreferenceable_handlers():
+    di = _make_di(modules=["mod-a"])
+    cache = _make_cache(None)
+    di.register(_DiscoveryCache).factory(lambda: cache)
+    handler = di.spawn(_ModulesHandler)
+
+    with patch(_PATCH_TARGET, return_value=[_info("mod-a", ["command"])]):
+        handler.discover_and_instantiate()
+
+    cache.store.assert_not_called()
+
+
+# --- handler references ---
+
+
+def test_get_reference_for_function():
+    assert _get_reference(poetry_command_mymod) == f"{__name__}:poetry_command_mymod"
+
+
+def test_get_reference_rejects_local_function():
+    def local_fn():
+        pass
+
+    assert _get_reference(local_fn) is None
+
+
+def test_resolve_reference_roundtrip_for_static_method():
+    fn = _StaticMethodModule.poetry_command_extra
+    ref = _get_reference(fn)
+    assert ref is not None
+    assert _resolve_reference(ref) is fn
+
+
+def test_record_roundtrip_keeps_references():
+    info = _scan_class(_SampleModule, "test-dist")[0]
+    restored = _from_record(_to_record(info))
+
+    assert restored.name == info.name
+    assert restored.handlers == {}
+    assert restored.handler_refs == info.handler_refs
+
+
+# --- hinted discovery ---
+
+_ENTRY_POINTS_TARGET = "ps.plugin.core._modules_handler.metadata.entry_points"
+
+
+def _entry_point(name: str, value: str, loaded: object) -> MagicMock:
+    ep = MagicMock()
+    ep.group = "ps.module"
+    ep.name = name
+    ep.value = value
+    ep.load.return_value = loaded
+    ep.dist.name = "test-dist"
+    return ep
+
+
+def test_entry_point_hints_include_name_and_target():
+    ep = _entry_point("ps-check", "some.package:SampleModule", None)
+    assert _get_entry_point_hints(ep) == {"pscheck", "samplemodule"}
+
+
+def test_entry_point_hints_use_last_module_component():
+    ep = _entry_point("module_entry", "ps.plugin.module.check", None)
+    assert _get_entry_point_hints(ep) == {"moduleentry", "check"}
+
+
+def test_hinted_loads_only_matching_entry_points():
+    io = MagicMock(spec=IO)
+    io.is_verbose.return_value = False
+    io.is_debug.return_value = False
+    matching = _entry_point("sample", f"{__name__}:_SampleModule", _SampleModule)
+    other = _entry_point("other", "other.package", None)
+
+    with patch(_ENTRY_POINTS_TARGET, return_value=[matching, other]):
+        modules = _load_hinted_module_infos(io, ["sample"])
+
+    assert modules is not None
+    assert [m.name for m in modules] == ["sample"]
+    other.load.assert_not_called()
+
+
+def test_hinted_returns_none_when_name_not_found():
+    io = MagicMock(spec=IO)
+    io.is_verbose.return_value = False
+    io.is_debug.return_value = False
+    matching = _entry_point("sample", f"{__name__}:_SampleModule", _SampleModule)
+
+    with patch(_ENTRY_POINTS_TARGET, return_value=[matching]):
+        assert _load_hinted_module_infos(io, ["sample", "unknown"]) is None
+
+
+def test_hinted_loads_nothing_without_configured_modules():
+    io = MagicMock(spec=IO)
+    ep = _entry_point("sample", f"{__name__}:_SampleModule", _SampleModule)
+
+    with patch(_ENTRY_POINTS_TARGET, return_value=[ep]):
+        assert _load_hinted_module_infos(io, None) == []
+        assert _load_hinted_module_infos(io, []) == []
+
+    ep.load.assert_not_called()
+
+
+def test_discover_skips_full_scan_when_hints_match():
+    di = _make_di(modules=["sample"])
+    handler = di.spawn(_ModulesHandler)
+    matching = _entry_point("sample", f"{__name__}:_SampleModule", _SampleModule)
+    other = _entry_point("other", "other.package", None)
+
+    with patch(_ENTRY_POINTS_TARGET, return_value=[matching, other]), \
+            patch(_PATCH_TARGET) as load_mock:
+        handler.discover_and_instantiate()
+
+    load_mock.assert_not_called()
+    other.load.assert_not_called()
+    assert handler.get_module_names() == ["sample"]
+
+
+def test_discover_performs_full_scan_in_debug_mode():
+    di = _make_di(modules=["sample"])
+    io = di.resolve(IO)
+    assert io is not None
+    io.is_verbose.return_value = True  # type: ignore[attr-defined]
+    io.is_debug.return_value = True  # type: ignore[attr-defined]
+    handler = di.spawn(_ModulesHandler)
+    matching = _entry_point("sample", f"{__name__}:_SampleModule", _SampleModule)
+
+    with patch(_ENTRY_POINTS_TARGET, return_value=[matching]), \
+            patch(_PATCH_TARGET, return_value=_scan_class(_SampleModule, "test-dist")) as load_mock:
+        handler.discover_and_instantiate()
+
+    load_mock.assert_called_once()
+    matching.load.assert_not_called()
+
+
+# --- register ---
+
+
+def test_register_collects_claimed_commands():
+    di = _make_di(modules=["mod-a", "mod-b"])
+    handler = di.spawn(_ModulesHandler)
+    info_a = _ModuleInfo(name="mod-a", handlers={"register": lambda: ["build"]})
+    info_b = _ModuleInfo(name="mod-b", handlers={"register": lambda: ("check", "build")})
+
+    with patch(_PATCH_TARGET, return_value=[info_a, info_b]):
+        handler.discover_and_instantiate()
+
+    assert handler.register() == {"build", "check"}
+
+
+def test_register_claims_everything_when_module_returns_none():
+    di = _make_di(modules=["mod-a", "mod-b"])
+    handler = di.spawn(_ModulesHandler)
+    info_a = _ModuleInfo(name="mod-a", handlers={"register": lambda: ["build"]})
+    info_b = _ModuleInfo(name="mod-b", handlers={"register": lambda: None})
+
+    with patch(_PATCH_TARGET, return_value=[info_a, info_b]):
+        handler.discover_and_instantiate()
+
+    assert handler.register() is None
+
+
+def test_register_claims_everything_when_module_has_no_register_handler():
+    di = _make_di(modules=["mod-a", "mod-b"])
+    handler = di.spawn(_ModulesHandler)
+    info_a = _ModuleInfo(name="mod-a", handlers={"register": lambda: ["build"]})
+    info_b = _info("mod-b", ["activate"])
+
+    with patch(_PATCH_TARGET, return_value=[info_a, info_b]):
+        handler.discover_and_instantiate()
+
+    assert handler.register() is None
+
+
+def test_register_with_no_modules_claims_nothing():
+    di = _make_di(modules=None)
+    handler = di.spawn(_ModulesHandler)
+
+    with patch(_PATCH_TARGET, return_value=[]):
+        handler.discover_and_instantiate()
+
+    assert handler.register() == set()
+
+
+# --- activation order ---
+
+
+def _ordered_info(name: str, calls: list[str], **ordering: object) -> _ModuleInfo:
+    def _activate(io: IO) -> None:
+        calls.append(name)
+        io.write_line(f"activated {name}")
+
+    return _ModuleInfo(name=name, handlers={"activate": _activate}, instance=SimpleNamespace(**ordering))
+
+
+def test_order_modules_keeps_declared_order_without_constraints():
+    infos = [_info("mod-a", ["activate"]), _info("mod-b", ["activate"])]
+    ordered, dependencies = _order_modules(infos, MagicMock(spec=IO))
+    assert [m.name for m in ordered] == ["mod-a", "mod-b"]
+    assert dependencies == {"mod-a": set(), "mod-b": set()}
+
+
+def test_order_modules_honours_after_and_before():
+    calls: list[str] = []
+    infos = [
+        _ordered_info("mod-a", calls, after=["mod-b"]),
+        _ordered_info("mod-b", calls),
+        _ordered_info("mod-c", calls, before="mod-b"),
+    ]
+    ordered, dependencies = _order_modules(infos, MagicMock(spec=IO))
+    assert [m.name for m in ordered] == ["mod-c", "mod-b", "mod-a"]
+    assert dependencies == {"mod-a": {"mod-b"}, "mod-b": {"mod-c"}, "mod-c": set()}
+
+
+def test_order_modules_ignores_unknown_names():
+    infos = [_ordered_info("mod-a", [], after=["missing"])]
+    _, dependencies = _order_modules(infos, MagicMock(spec=IO))
+    assert dependencies == {"mod-a": set()}
+
+
+def test_order_modules_falls_back_on_cycle():
+    infos = [_ordered_info("mod-a", [], after=["mod-b"]), _ordered_info("mod-b", [], after=["mod-a"])]
+    ordered, dependencies = _order_modules(infos, MagicMock(spec=IO))
+    assert ordered == infos
+    assert dependencies is None
+
+
+def test_activate_serial_honours_ordering():
+    calls: list[str] = []
+    io = BufferedIO()
+    di = _make_di(modules=["mod-a", "mod-b"], io=io)
+    handler = di.spawn(_ModulesHandler)
+    infos = [_ordered_info("mod-a", calls, after=["mod-b"]), _ordered_info("mod-b", calls)]
+
+    with patch(_PATCH_TARGET, return_value=infos):
+        handler.discover_and_instantiate()
+        handler.activate()
+
+    assert calls == ["mod-b", "mod-a"]
+
+
+# --- parallel activation ---
+
+
+def test_parallel_activation_runs_independent_modules_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _activate_a() -> None:
+        barrier.wait()
+
+    def _activate_b() -> None:
+        barrier.wait()
+
+    di = _make_di(modules=["mod-a", "mod-b"], io=BufferedIO(), settings={"parallel-activation": True})
+    handler = di.spawn(_ModulesHandler)
+    infos = [_info("mod-a", ["activate"], activate_fn=_activate_a), _info("mod-b", ["activate"], activate_fn=_activate_b)]
+
+    with patch(_PATCH_TARGET, return_value=infos):
+        handler.discover_and_instantiate()
+        handler.activate()
+
+    assert handler.get_module_names() == ["mod-a", "mod-b"]
+
+
+def test_parallel_activation_waits_for_dependencies():
+    calls: list[str] = []
+    di = _make_di(modules=["mod-a", "mod-b", "mod-c"], io=BufferedIO(), settings={"parallel-activation": True})
+    handler = di.spawn(_ModulesHandler)
+    infos = [
+        _ordered_info("mod-a", calls, after=["mod-c"]),
+        _ordered_info("mod-b", calls, after=["mod-a"]),
+        _ordered_info("mod-c", calls),
+    ]
+
+    with patch(_PATCH_TARGET, return_value=infos):
+        handler.discover_and_instantiate()
+        handler.activate()
+
+    assert calls == ["mod-c", "mod-a", "mod-b"]
+
+
+def test_parallel_activation_writes_module_output_in_plan_order():
+    io = BufferedIO()
+    di = _make_di(modules=["mod-a", "mod-b", "mod-c"], io=io, settings={"parallel-activation": True})
+    handler = di.spawn(_ModulesHandler)
+    infos = [_ordered_info(name, []) for name in ("mod-a", "mod-b", "mod-c")]
+
+    with patch(_PATCH_TARGET, return_value=infos):
+        handler.discover_and_instantiate()
+        handler.activate()
+
+    assert io.fetch_output().splitlines() == ["activated mod-a", "activated mod-b", "activated mod-c"]
+
+
+def test_parallel_activation_disables_modules_returning_false():
+    di = _make_di(modules=["mod-a", "mod-b"], io=BufferedIO(), settings={"parallel-activation": True})
+    handler = di.spawn(_ModulesHandler)
+    infos = [_info("mod-a", ["activate"], activate_fn=_activate_false), _info("mod-b", ["activate"])]
+
+    with patch(_PATCH_TARGET, return_value=infos):
+        handler.discover_and_instantiate()
+        handler.activate()
+
+    assert handler.get_module_names() == ["mod-b"]
+
+
+def test_parallel_activation_raises_first_error_and_skips_dependents():
+    calls: list[str] = []
+
+    def failing_activate() -> None:
+        raise ValueError("boom")
+
+    io = BufferedIO()
+    di = _make_di(modules=["mod-a", "mod-b"], io=io, settings={"parallel-activation": True})
+    handler = di.spawn(_ModulesHandler)
+    infos = [_info("mod-a", ["activate"], activate_fn=failing_activate), _ordered_info("mod-b", calls, after=["mod-a"])]
+
+    with patch(_PATCH_TARGET, return_value=infos):
+        handler.discover_and_instantiate()
+        with pytest.raises(ValueError, match="boom"):
+            handler.activate()
+
+    assert calls == []
+    assert "Error during activation of module mod-a" in io.fetch_error()
+
+
+def test_parallel_activation_exposes_command_input_to_modules():
+    seen: list[object] = []
+
+    def _activate(io: IO) -> None:
+        seen.append((io.input.option("build-version"), io.is_interactive()))
+
+    command_input = ArgvInput(["poetry", "build", "--build-version", "1.2.3"])
+    command_input.bind(Definition([Argument("command"), Option("--build-version", flag=False)]))
+    command_input.interactive(False)
+    di = _make_di(modules=["mod-a", "mod-b"], io=BufferedIO(input=command_input), settings={"parallel-activation": True})
+    handler = di.spawn(_ModulesHandler)
+    infos = [_info("mod-a", ["activate"], activate_fn=_activate), _info("mod-b", ["activate"], activate_fn=_activate)]
+
+    with patch(_PATCH_TARGET, return_value=infos):
+        handler.discover_and_instantiate()
+        handler.activate()
+
+    assert seen == [("1.2.3", False), ("1.2.3", False)]
@@ -4,6 +4,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+import tomlkit
 from cleo.events.console_command_event import ConsoleCommandEvent
 from cleo.events.event_dispatcher import EventDispatcher
 from cleo.io.io import IO
@@ -11,10 +12,17 @@ from cleo.io.outputs.output import Verbosity
 from poetry.console.application import Application
 
 from ps.di import DI
+from ps.plugin.core._environment_cache import _EnvironmentCache
+from ps.plugin.core._modules_handler import _ModuleInfo
+from ps.plugin.core._site_packages import _DeferredPthFinder
+from ps.plugin.core._telemetry import _MemorySink, _Telemetry
+from ps.plugin.core._venv_cache import _VenvCache
 from ps.plugin.core._plugin import (
     Plugin,
     _activate_project_venv,
+    _load_environment,
     _create_standard_io,
+    _resolve_host_settings,
     _resolve_settings,
 )
 from ps.plugin.sdk.project import Environment
@@ -124,16 +132,91 @@ def test_activate_venv_adds_site_packages_and_bin(mock_app, mock_io, tmp_path, m
     mock_env.path = tmp_path
 
     original_path = os.environ.get("PATH", "")
-    with patch(f"{_PATCH_BASE}.EnvManager") as env_mgr_cls, \
-            patch(f"{_PATCH_BASE}.site") as mock_site:
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    with patch(f"{_PATCH_BASE}.EnvManager") as env_mgr_cls:
         env_mgr_cls.return_value.get.return_value = mock_env
         _activate_project_venv(mock_app, mock_io)
-        mock_site.addsitedir.assert_called_once_with(str(site_pkgs))
 
+    assert sys.path[-1] == str(site_pkgs)
     assert str(bin_dir) in os.environ.get("PATH", "")
     monkeypatch.setenv("PATH", original_path)
 
 
+def test_activate_venv_without_cache_processes_pth_files_immediately(mock_app, mock_io, tmp_path, monkeypatch):
+    monkeypatch.delenv("VIRTUAL_ENV", raising=False)
+    monkeypatch.delenv("CONDA_PREFIX", raising=False)
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    monkeypatch.setattr(sys, "meta_path", list(sys.meta_path))
+    original_path = os.environ.get("PATH", "")
+
+    if sys.platform == "win32":
+        site_pkgs = tmp_path / "Lib" / "site-packages"
+    else:
+        site_pkgs = tmp_path / "lib" / f"python{sys.version_info.major}.{sys.version_info.minor}" / "site-packages"
+    extra = tmp_path / "extra"
+    site_pkgs.mkdir(parents=True)
+    extra.mkdir()
+    (site_pkgs / "extra.pth").write_text(f"{extra}\n")
+    mock_env = MagicMock()
+    mock_env.path = tmp_path
+
+    with patch(f"{_PATCH_BASE}.EnvManager") as env_mgr_cls:
+        env_mgr_cls.return_value.get.return_value = mock_env
+        _activate_project_venv(mock_app, mock_io, None)
+
+    assert str(extra) in sys.path
+    assert not any(isinstance(finder, _DeferredPthFinder) for finder in sys.meta_path)
+    monkeypatch.setenv("PATH", original_path)
+
+
+def test_activate_venv_uses_cached_resolution(mock_app, mock_io, tmp_path, monkeypatch):
+    monkeypatch.delenv("VIRTUAL_ENV", raising=False)
+    monkeypatch.delenv("CONDA_PREFIX", raising=False)
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    original_path = os.environ.get("PATH", "")
+
+    venv = tmp_path / "venv"
+    site_pkgs = venv / "site-packages"
+    site_pkgs.mkdir(parents=True)
+    mock_app.poetry.pyproject_path = tmp_path / "pyproject.toml"
+    cache = _VenvCache(tmp_path / "cache")
+    cache.store(mock_app.poetry.pyproject_path, venv, site_pkgs, envs_file=tmp_path / "envs.toml")
+
+    with patch(f"{_PATCH_BASE}.EnvManager") as env_mgr_cls:
+        env_mgr_cls.return_value.envs_file.path = tmp_path / "envs.toml"
+        _activate_project_venv(mock_app, mock_io, cache)
+
+    env_mgr_cls.return_value.get.assert_not_called()
+    assert sys.path[-1] == str(site_pkgs)
+    monkeypatch.setenv("PATH", original_path)
+
+
+def test_activate_venv_stores_resolution_in_cache(mock_app, mock_io, tmp_path, monkeypatch):
+    monkeypatch.delenv("VIRTUAL_ENV", raising=False)
+    monkeypatch.delenv("CONDA_PREFIX", raising=False)
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    original_path = os.environ.get("PATH", "")
+
+    venv = tmp_path / "venv"
+    if sys.platform == "win32":
+        site_pkgs = venv / "Lib" / "site-packages"
+    else:
+        site_pkgs = venv / "lib" / f"python{sys.version_info.major}.{sys.version_info.minor}" / "site-packages"
+    site_pkgs.mkdir(parents=True)
+    mock_env = MagicMock()
+    mock_env.path = venv
+    mock_app.poetry.pyproject_path = tmp_path / "pyproject.toml"
+    cache = _VenvCache(tmp_path / "cache")
+
+    with patch(f"{_PATCH_BASE}.EnvManager") as env_mgr_cls:
+        env_mgr_cls.return_value.get.return_value = mock_env
+        env_mgr_cls.return_value.envs_file.path = tmp_path / "envs.toml"
+        _activate_project_venv(mock_app, mock_io, cache)
+
+    assert cache.load(mock_app.poetry.pyproject_path, tmp_path / "envs.toml") == (venv, site_pkgs)
+    monkeypatch.setenv("PATH", original_path)
+
+
 # --- _resolve_settings ---
 
 
@@ -145,6 +228,60 @@ def test_resolve_settings_returns_host_project_settings():
     assert result is settings
 
 
+# --- _resolve_host_settings ---
+
+
+def test_resolve_host_settings_without_host_project_returns_settings(tmp_path):
+    settings = PluginSettings(enabled=True, modules=["a"])
+    assert _resolve_host_settings(settings, tmp_path / "pyproject.toml") is settings
+
+
+def test_resolve_host_settings_follows_host_project(tmp_path):
+    host_dir = tmp_path / "host"
+    host_dir.mkdir()
+    (host_dir / "pyproject.toml").write_text('[tool.ps-plugin]\nmodules = ["host-mod"]\nlazy-activation = true\n')
+    settings = PluginSettings.model_validate({"enabled": True, "host-project": Path("../host")})
+
+    result = _resolve_host_settings(settings, tmp_path / "entry" / "pyproject.toml")
+
+    assert result.modules == ["host-mod"]
+
+
+def test_resolve_host_settings_stops_on_missing_host(tmp_path):
+    settings = PluginSettings.model_validate({"enabled": True, "host-project": Path("missing")})
+    assert _resolve_host_settings(settings, tmp_path / "pyproject.toml") is settings
+
+
+def test_resolve_host_settings_stops_on_cycle(tmp_path):
+    (tmp_path / "pyproject.toml").write_text('[tool.ps-plugin]\nhost-project = "."\n')
+    settings = PluginSettings.model_validate({"enabled": True, "host-project": Path()})
+    assert _resolve_host_settings(settings, tmp_path / "pyproject.toml") is settings
+
+
+# --- _load_environment ---
+
+
+def test_load_environment_without_cache_parses_project(tmp_path, mock_io):
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "app"\n')
+    environment = _load_environment(tmp_path / "pyproject.toml", mock_io, None)
+    assert environment.entry_project.name.value == "app"
+
+
+def test_load_environment_stores_then_reuses_cached_environment(tmp_path, mock_io):
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "app"\n')
+    cache = _EnvironmentCache(tmp_path / "cache")
+
+    first = _load_environment(tmp_path / "pyproject.toml", mock_io, cache)
+    assert cache.path(tmp_path / "pyproject.toml").exists()
+
+    with patch(f"{_PATCH_BASE}.Environment") as environment_cls:
+        second = _load_environment(tmp_path / "pyproject.toml", mock_io, cache)
+
+    environment_cls.assert_not_called()
+    assert second is not first
+    assert second.entry_project.name.value == "app"
+
+
 # --- Plugin.__init__ ---
 
 
@@ -232,6 +369,21 @@ def test_activate_successful_flow():
     mock_handler.activate.assert_called_once()
 
 
+@pytest.mark.parametrize(("venv_cache", "cached"), [(None, True), (False, False)])
+def test_activate_uses_venv_cache_unless_disabled(venv_cache, cached):
+    plugin = Plugin()
+    app = _make_application({})
+    settings = PluginSettings.model_validate({"enabled": True, "modules": [], "venv-cache": venv_cache})
+
+    with patch(f"{_PATCH_BASE}.parse_plugin_settings_from_document", return_value=settings), \
+            patch(f"{_PATCH_BASE}._activate_project_venv") as activate_venv, \
+            patch(f"{_PATCH_BASE}._resolve_settings", return_value=settings):
+        plugin._di.spawn = MagicMock()
+        plugin.activate(app)
+
+    assert isinstance(activate_venv.call_args[0][2], _VenvCache) is cached
+
+
 def test_activate_registers_event_listeners():
     plugin = Plugin()
     dispatcher = MagicMock(spec=EventDispatcher)
@@ -253,6 +405,50 @@ def test_activate_registers_event_listeners():
     assert dispatcher.add_listener.call_count == 1
 
 
+def test_activate_records_profile_and_reports_table(monkeypatch):
+    monkeypatch.setenv("PS_PLUGIN_PROFILE", "1")
+    plugin = Plugin()
+    app = _make_application({})
+    settings = PluginSettings(enabled=True, modules=[])
+
+    with patch(f"{_PATCH_BASE}.parse_plugin_settings_from_document", return_value=settings), \
+            patch(f"{_PATCH_BASE}._activate_project_venv"), \
+            patch(f"{_PATCH_BASE}._resolve_settings", return_value=settings):
+        mock_handler = MagicMock()
+        mock_handler.get_event_handlers.return_value = []
+        plugin._di.spawn = MagicMock(return_value=mock_handler)
+
+        plugin.activate(app)
+
+    names = [s.name for s in plugin._profiler.spans]
+    assert names[:3] == ["activate", "settings", "venv"]
+    assert "modules" in names
+    lines = [c[0][0] for c in app._io.write_error_line.call_args_list]
+    assert any("Startup profile" in line for line in lines)
+
+
+def test_activate_emits_activation_complete():
+    plugin = Plugin()
+    sink = _MemorySink()
+    plugin._telemetry = _Telemetry([sink])
+    app = _make_application({})
+    settings = PluginSettings(enabled=True, modules=[])
+
+    with patch(f"{_PATCH_BASE}.parse_plugin_settings_from_document", return_value=settings), \
+            patch(f"{_PATCH_BASE}._activate_project_venv"), \
+            patch(f"{_PATCH_BASE}._resolve_settings", return_value=settings):
+        mock_handler = MagicMock()
+        mock_handler.get_event_handlers.return_value = []
+        mock_handler.get_module_names.return_value = ["mod-a"]
+        plugin._di.spawn = MagicMock(return_value=mock_handler)
+
+        plugin.activate(app)
+
+    complete = sink.events("activation_complete")
+    assert complete[0]["modules"] == ["mod-a"]
+    assert complete[0]["deferred"] is False
+
+
 # --- Plugin._register_listener ---
 
 
@@ -309,3 +505,114 @@ def test_register_listener_stops_on_command_should_not_run():
     listener_fn(event, "console.command", dispatcher)
 
     assert call_order == ["h1"]
+
+
+# --- Plugin.activate: lazy activation ---
+
+
+def _activate_lazy(claimed, *, command_handlers=None):
+    plugin = Plugin()
+    dispatcher = MagicMock(spec=EventDispatcher)
+    app = _make_application({}, dispatcher=dispatcher)
+    settings = PluginSettings.model_validate({"enabled": True, "modules": [], "lazy-activation": True})
+
+    mock_handler = MagicMock()
+    mock_handler.register.return_value = claimed
+    mock_handler.get_event_handlers.side_effect = lambda et: (command_handlers or []) if et == "command" else []
+
+    with patch(f"{_PATCH_BASE}.parse_plugin_settings_from_document", return_value=settings), \
+            patch(f"{_PATCH_BASE}._activate_project_venv"), \
+            patch(f"{_PATCH_BASE}.Environment"), \
+            patch(f"{_PATCH_BASE}._resolve_settings", return_value=settings):
+        plugin._di.spawn = MagicMock(return_value=mock_handler)
+        plugin.activate(app)
+
+    return plugin, app, dispatcher, mock_handler
+
+
+def _command_event(name: str) -> MagicMock:
+    event = MagicMock(spec=ConsoleCommandEvent)
+    event.command.name = name
+    event.command_should_run.return_value = True
+    return event
+
+
+def test_lazy_activation_defers_module_activation():
+    _, app, dispatcher, handler = _activate_lazy({"build"})
+
+    handler.register.assert_called_once()
+    handler.activate.assert_not_called()
+    assert dispatcher.add_listener.call_count == 1
+    app.command_loader.register_factory.assert_called_once()
+
+
+def test_lazy_activation_skips_unclaimed_command():
+    _, _, dispatcher, handler = _activate_lazy({"build"})
+    _, listener_fn = dispatcher.add_listener.call_args[0]
+
+    listener_fn(_command_event("show"), "console.command", dispatcher)
+
+    handler.activate.assert_not_called()
+
+
+def test_lazy_activation_activates_on_claimed_command():
+    called = []
+    _, _, dispatcher, handler = _activate_lazy({"build"}, command_handlers=[lambda: called.append(True)])
+    _, listener_fn = dispatcher.add_listener.call_args[0]
+
+    listener_fn(_command_event("build"), "console.command", dispatcher)
+    listener_fn(_command_event("show"), "console.command", dispatcher)
+
+    handler.activate.assert_called_once()
+    assert called == [True, True]
+
+
+def test_lazy_activation_setup_extension_factory_activates():
+    plugin, app, _, handler = _activate_lazy({"build"})
+    _, factory = app.command_loader.register_factory.call_args[0]
+    plugin._di.spawn = MagicMock(return_value="command")
+
+    assert factory() == "command"
+    handler.activate.assert_called_once()
+
+
+def test_lazy_activation_falls_back_when_commands_not_declared():
+    _, app, _, handler = _activate_lazy(None)
+
+    handler.activate.assert_called_once()
+    app.command_loader.register_factory.assert_not_called()
+
+
+def test_lazy_activation_constructs_environment_only_for_handled_command(tmp_path):
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text(
+        '[project]\nname = "app"\n\n'
+        '[tool.ps-plugin]\nenabled = true\nmodules = ["mod-a"]\n'
+        'lazy-activation = true\ndiscovery-cache = false\nenvironment-cache = false\n'
+    )
+    received: list[Environment] = []
+
+    def _register() -> list[str]:
+        return ["build"]
+
+    def _activate(environment: Environment) -> None:
+        received.append(environment)
+
+    infos = [_ModuleInfo(name="mod-a", handlers={"register": _register, "activate": _activate}, distribution="test-dist")]
+    plugin = Plugin()
+    dispatcher = MagicMock(spec=EventDispatcher)
+    app = _make_application(tomlkit.parse(pyproject.read_text()), pyproject_path=pyproject, dispatcher=dispatcher)
+
+    with patch(f"{_PATCH_BASE}._activate_project_venv"), \
+            patch("ps.plugin.core._modules_handler._load_module_infos", return_value=infos), \
+            patch.object(Environment, "__init__", autospec=True, side_effect=Environment.__init__) as init:
+        plugin.activate(app)
+        _, listener_fn = dispatcher.add_listener.call_args[0]
+        listener_fn(_command_event("show"), "console.command", dispatcher)
+
+        init.assert_not_called()
+
+        listener_fn(_command_event("build"), "console.command", dispatcher)
+
+    init.assert_called_once()
+    assert received[0].entry_project.name.value == "app"
@@ -0,0 +1,182 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from ps.di import ContextExecutor
+from ps.plugin.core._profiler import PROFILE_ENV_VAR, _Profiler, _report_profile
+from ps.plugin.core.commands._profile_startup import ProfileStartupCommand
+
+
+def _profiled() -> _Profiler:
+    profiler = _Profiler()
+    with profiler.span("activate"):
+        with profiler.span("settings"):
+            pass
+        with profiler.span("modules"), profiler.span("activate check"):
+            pass
+    return profiler
+
+
+# --- _Profiler ---
+
+
+def test_span_records_name_and_depth():
+    profiler = _profiled()
+    assert [(s.name, s.depth) for s in profiler.spans] == [
+        ("activate", 0),
+        ("settings", 1),
+        ("modules", 1),
+        ("activate check", 2),
+    ]
+
+
+def test_span_closes_on_exception():
+    profiler = _Profiler()
+    with pytest.raises(RuntimeError), profiler.span("failing"):
+        raise RuntimeError("boom")
+    with profiler.span("next"):
+        pass
+
+    spans = profiler.spans
+    assert spans[0].end is not None
+    assert spans[1].depth == 0
+
+
+def test_span_depth_is_tracked_per_thread():
+    profiler = _Profiler()
+
+    def worker():
+        with profiler.span("worker"):
+            pass
+
+    with profiler.span("main"):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+    assert {s.name: s.depth for s in profiler.spans} == {"main": 0, "worker": 0}
+
+
+def test_span_submitted_with_context_nests_under_parent():
+    profiler = _Profiler()
+
+    def worker():
+        with profiler.span("worker"):
+            pass
+
+    with profiler.span("activate"), ContextExecutor(ThreadPoolExecutor(max_workers=1)) as executor:
+        executor.submit(worker).result()
+
+    assert {s.name: s.depth for s in profiler.spans} == {"activate": 0, "worker": 1}
+
+
+def test_format_table_total_ignores_root_spans_of_other_threads():
+    profiler = _Profiler()
+
+    def worker():
+        with profiler.span("worker"):
+            time.sleep(0.02)
+
+    with profiler.span("main"):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+    main, worker_span = profiler.spans
+    worker_span.end = worker_span.start + main.duration * 4
+    assert "100.0" in profiler.format_table()[2]
+
+
+def test_parent_span_covers_children():
+    profiler = _profiled()
+    parent, *children = profiler.spans
+    assert all(parent.duration >= child.duration for child in children)
+
+
+def test_format_table_lists_every_span_indented():
+    lines = _profiled().format_table()
+    assert len(lines) == 2 + 4
+    assert lines[-1].endswith("    <comment>activate check</comment>")
+    assert "100.0" in lines[2]
+
+
+def test_format_table_without_spans():
+    assert len(_Profiler().format_table()) == 2
+
+
+def test_chrome_trace_contains_complete_events():
+    trace = _profiled().to_chrome_trace()
+    events = trace["traceEvents"]
+    assert [e["name"] for e in events] == ["activate", "settings", "modules", "activate check"]
+    assert all(e["ph"] == "X" and e["dur"] >= 0 and e["ts"] >= 0 for e in events)
+
+
+def test_write_chrome_trace_creates_parent_directories(tmp_path):
+    target = tmp_path / "nested" / "trace.json"
+    _profiled().write_chrome_trace(target)
+    assert len(json.loads(target.read_text())["traceEvents"]) == 4
+
+
+# --- _report_profile ---
+
+
+def test_report_profile_silent_without_env_var(monkeypatch):
+    monkeypatch.delenv(PROFILE_ENV_VAR, raising=False)
+    io = MagicMock()
+    _report_profile(_profiled(), io)
+    io.write_error_line.assert_not_called()
+
+
+@pytest.mark.parametrize("value", ["1", "true", "TABLE"])
+def test_report_profile_prints_table(monkeypatch, value):
+    monkeypatch.setenv(PROFILE_ENV_VAR, value)
+    io = MagicMock()
+    _report_profile(_profiled(), io)
+    assert io.write_error_line.call_count == 6
+
+
+def test_report_profile_writes_trace_to_path(monkeypatch, tmp_path):
+    target = tmp_path / "trace.json"
+    monkeypatch.setenv(PROFILE_ENV_VAR, str(target))
+    io = MagicMock()
+    _report_profile(_profiled(), io)
+    assert target.exists()
+    assert "written" in io.write_error_line.call_args[0][0]
+
+
+def test_report_profile_reports_write_error(monkeypatch, tmp_path):
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    monkeypatch.setenv(PROFILE_ENV_VAR, str(blocker / "trace.json"))
+    io = MagicMock()
+    _report_profile(_profiled(), io)
+    assert "<error>" in io.write_error_line.call_args[0][0]
+
+
+# --- ProfileStartupCommand ---
+
+
+def _command(profiler: _Profiler, trace: str | None = None) -> ProfileStartupCommand:
+    cmd = ProfileStartupCommand(profiler)
+    cmd.line = MagicMock()
+    cmd.option = MagicMock(return_value=trace)
+    return cmd
+
+
+def test_profile_startup_prints_table():
+    cmd = _command(_profiled())
+    line = cmd.line = MagicMock()
+    assert cmd.handle() == 0
+    assert line.call_count == 6
+
+
+def test_profile_startup_writes_trace(tmp_path):
+    target = tmp_path / "trace.json"
+    cmd = _command(_profiled(), str(target))
+    cmd.handle()
+    assert json.loads(Path(target).read_text())["traceEvents"]
@@ -0,0 +1,70 @@
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+from ps.plugin.core._site_packages import _add_site_packages, _DeferredPthFinder
+
+
+@pytest.fixture(autouse=True)
+def isolated_import_state(monkeypatch):
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    monkeypatch.setattr(sys, "meta_path", list(sys.meta_path))
+    modules = set(sys.modules)
+    yield
+    for name in set(sys.modules) - modules:
+        del sys.modules[name]
+
+
+@pytest.fixture
+def site_packages(tmp_path: Path) -> Path:
+    site_dir = tmp_path / "site-packages"
+    site_dir.mkdir()
+    return site_dir
+
+
+def test_add_site_packages_appends_path_without_finder(site_packages):
+    assert _add_site_packages(site_packages) is None
+    assert sys.path[-1] == str(site_packages)
+
+
+def test_add_site_packages_does_not_duplicate_path(site_packages):
+    _add_site_packages(site_packages)
+    _add_site_packages(site_packages)
+    assert sys.path.count(str(site_packages)) == 1
+
+
+def test_pth_entries_are_not_processed_eagerly(site_packages, tmp_path):
+    extra = tmp_path / "extra"
+    extra.mkdir()
+    (site_packages / "extra.pth").write_text(f"{extra}\n")
+
+    finder = _add_site_packages(site_packages)
+
+    assert isinstance(finder, _DeferredPthFinder)
+    assert finder in sys.meta_path
+    assert str(extra) not in sys.path
+
+
+def test_pth_entries_are_processed_on_failed_import(site_packages, tmp_path):
+    extra = tmp_path / "extra"
+    extra.mkdir()
+    (extra / "ps_deferred_pth_probe.py").write_text("VALUE = 42\n")
+    (site_packages / "extra.pth").write_text(f"{extra}\n")
+    finder = _add_site_packages(site_packages)
+    importlib.invalidate_caches()
+
+    module = importlib.import_module("ps_deferred_pth_probe")
+
+    assert module.VALUE == 42
+    assert str(extra) in sys.path
+    assert finder not in sys.meta_path
+
+
+def test_failed_import_still_raises_after_processing(site_packages):
+    (site_packages / "empty.pth").write_text("")
+    _add_site_packages(site_packages)
+
+    with pytest.raises(ModuleNotFoundError):
+        importlib.import_module("ps_missing_module_for_pth_test")
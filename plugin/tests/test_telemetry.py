@@ -0,0 +1,163 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from cleo.events.console_command_event import ConsoleCommandEvent
+from cleo.events.event_dispatcher import EventDispatcher
+from cleo.io.io import IO
+
+from ps.di import DI
+from ps.plugin.core._modules_handler import _ModuleInfo, _ModulesHandler
+from ps.plugin.core._plugin import Plugin
+from ps.plugin.core._telemetry import TELEMETRY_ENV_VAR, _JsonlSink, _MemorySink, _Telemetry
+from ps.plugin.sdk.settings import PluginSettings
+
+
+def _telemetry() -> tuple[_Telemetry, _MemorySink]:
+    sink = _MemorySink()
+    return _Telemetry([sink]), sink
+
+
+# --- _Telemetry ---
+
+
+def test_telemetry_without_sinks_is_disabled():
+    telemetry = _Telemetry()
+    assert not telemetry.enabled
+    telemetry.emit("anything", value=1)
+
+
+def test_emit_adds_event_timestamp_and_pid():
+    telemetry, sink = _telemetry()
+    telemetry.emit("module_loaded", module="mod-a")
+
+    record = sink.records[0]
+    assert record["event"] == "module_loaded"
+    assert record["module"] == "mod-a"
+    assert {"ts", "pid"} <= record.keys()
+
+
+def test_emit_continues_after_sink_error():
+    failing = MagicMock()
+    failing.emit.side_effect = OSError("disk full")
+    sink = _MemorySink()
+    _Telemetry([failing, sink]).emit("module_loaded")
+
+    assert len(sink.records) == 1
+
+
+def test_from_environment_without_variable_is_disabled(monkeypatch):
+    monkeypatch.delenv(TELEMETRY_ENV_VAR, raising=False)
+    assert not _Telemetry.from_environment().enabled
+
+
+def test_from_environment_writes_jsonl(monkeypatch, tmp_path):
+    target = tmp_path / "telemetry.jsonl"
+    monkeypatch.setenv(TELEMETRY_ENV_VAR, str(target))
+    telemetry = _Telemetry.from_environment()
+    telemetry.emit("first")
+    telemetry.emit("second", value=2)
+    telemetry.close()
+
+    lines = [json.loads(line) for line in target.read_text().splitlines()]
+    assert [r["event"] for r in lines] == ["first", "second"]
+    assert lines[1]["value"] == 2
+
+
+# --- _JsonlSink ---
+
+
+def test_jsonl_sink_appends_to_existing_file(tmp_path):
+    target = tmp_path / "nested" / "telemetry.jsonl"
+    for value in (1, 2):
+        sink = _JsonlSink(target)
+        sink.emit({"event": "run", "value": value})
+        sink.close()
+
+    assert len(target.read_text().splitlines()) == 2
+
+
+def test_jsonl_sink_serializes_unknown_types(tmp_path):
+    target = tmp_path / "telemetry.jsonl"
+    sink = _JsonlSink(target)
+    sink.emit({"event": "run", "path": tmp_path})
+    sink.close()
+
+    assert json.loads(target.read_text())["path"] == str(tmp_path)
+
+
+# --- _ModulesHandler ---
+
+
+def _handler(telemetry: _Telemetry, infos: list[_ModuleInfo], modules: list[str]) -> _ModulesHandler:
+    di = DI()
+    io = MagicMock(spec=IO)
+    io.is_verbose.return_value = False
+    io.is_debug.return_value = False
+    di.register(IO).factory(lambda: io)
+    di.register(PluginSettings).factory(lambda: PluginSettings(modules=modules))
+    di.register(_Telemetry).factory(lambda: telemetry)
+    handler = di.spawn(_ModulesHandler)
+    with patch("ps.plugin.core._modules_handler._load_module_infos", return_value=infos):
+        handler.discover_and_instantiate()
+    return handler
+
+
+def test_handler_emits_discovered_modules():
+    telemetry, sink = _telemetry()
+    infos = [_ModuleInfo(name="mod-a", handlers={"activate": lambda: None}), _ModuleInfo(name="mod-b", handlers={})]
+    _handler(telemetry, infos, ["mod-a"])
+
+    discovered = {r["module"]: r for r in sink.events("module_discovered")}
+    assert discovered["mod-a"]["selected"] is True
+    assert discovered["mod-b"]["selected"] is False
+    assert discovered["mod-a"]["source"] == "scan"
+
+
+def test_handler_emits_activation_duration_and_result():
+    telemetry, sink = _telemetry()
+    infos = [
+        _ModuleInfo(name="mod-a", handlers={"activate": lambda: None}),
+        _ModuleInfo(name="mod-b", handlers={"activate": lambda: False}),
+    ]
+    _handler(telemetry, infos, ["mod-a", "mod-b"]).activate()
+
+    activated = {r["module"]: r for r in sink.events("module_activated")}
+    assert activated["mod-a"]["disabled"] is False
+    assert activated["mod-b"]["disabled"] is True
+    assert activated["mod-a"]["duration_ms"] >= 0
+
+
+def test_handler_emits_activation_error():
+    def failing() -> None:
+        raise ValueError("boom")
+
+    telemetry, sink = _telemetry()
+    handler = _handler(telemetry, [_ModuleInfo(name="mod-a", handlers={"activate": failing})], ["mod-a"])
+    with pytest.raises(ValueError, match="boom"):
+        handler.activate()
+
+    assert sink.events("module_activated")[0]["error"] == "boom"
+
+
+# --- Plugin listeners ---
+
+
+def test_listener_emits_handler_duration_and_stop():
+    plugin = Plugin()
+    plugin._telemetry, sink = _telemetry()
+    io = MagicMock(spec=IO)
+    dispatcher = MagicMock(spec=EventDispatcher)
+
+    def poetry_command_stop(event: ConsoleCommandEvent) -> None:
+        event.disable_command()
+
+    plugin._register_listener(dispatcher, DI(), io, "command", "console.command", [poetry_command_stop])
+    _, listener_fn = dispatcher.add_listener.call_args[0]
+    listener_fn(ConsoleCommandEvent(MagicMock(), io), "console.command", dispatcher)
+
+    completed = sink.events("handler_completed")
+    assert completed[0]["handler"].endswith("poetry_command_stop")
+    assert completed[0]["event_type"] == "command"
+    assert sink.events("handler_stopped")[0]["handler"] == completed[0]["handler"]
+
@@ -0,0 +1,102 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from ps.plugin.core._venv_cache import _VenvCache
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    pyproject = project_dir / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "app"\n')
+    return pyproject
+
+
+@pytest.fixture
+def venv(tmp_path: Path) -> tuple[Path, Path]:
+    venv_path = tmp_path / "venv"
+    site_packages = venv_path / "site-packages"
+    site_packages.mkdir(parents=True)
+    return venv_path, site_packages
+
+
+def _cache(tmp_path: Path) -> _VenvCache:
+    return _VenvCache(tmp_path / "cache")
+
+
+def _touch(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_load_returns_none_without_file(tmp_path, project):
+    assert _cache(tmp_path).load(project) is None
+
+
+def test_store_and_load_roundtrip(tmp_path, project, venv):
+    assert _cache(tmp_path).store(project, *venv)
+    assert _cache(tmp_path).load(project) == venv
+
+
+def test_load_invalidated_by_venv_mtime(tmp_path, project, venv):
+    _cache(tmp_path).store(project, *venv)
+    _touch(venv[0])
+
+    assert _cache(tmp_path).load(project) is None
+
+
+def test_load_invalidated_by_removed_venv(tmp_path, project, venv):
+    _cache(tmp_path).store(project, *venv)
+    venv[1].rmdir()
+    venv[0].rmdir()
+
+    assert _cache(tmp_path).load(project) is None
+
+
+def test_load_invalidated_by_modified_pyproject(tmp_path, project, venv):
+    _cache(tmp_path).store(project, *venv)
+    _touch(project)
+
+    assert _cache(tmp_path).load(project) is None
+
+
+def test_load_invalidated_by_new_in_project_venv(tmp_path, project, venv):
+    _cache(tmp_path).store(project, *venv)
+    (project.parent / ".venv").mkdir()
+
+    assert _cache(tmp_path).load(project) is None
+
+
+def test_load_invalidated_by_modified_envs_file(tmp_path, project, venv):
+    envs_file = tmp_path / "envs.toml"
+    envs_file.write_text("")
+    _cache(tmp_path).store(project, *venv, envs_file=envs_file)
+    envs_file.write_text('[app]\nminor = "3.12"\n')
+
+    assert _cache(tmp_path).load(project, envs_file) is None
+
+
+def test_load_ignores_corrupted_file(tmp_path, project):
+    cache = _cache(tmp_path)
+    cache.path(project).parent.mkdir(parents=True)
+    cache.path(project).write_text("{not json")
+
+    assert cache.load(project) is None
+
+
+def test_store_returns_false_when_directory_not_writable(tmp_path, project, venv):
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+
+    assert _VenvCache(blocker / "cache").store(project, *venv) is False
+
+
+def test_clear_removes_cache_file(tmp_path, project, venv):
+    cache = _cache(tmp_path)
+    cache.store(project, *venv)
+    cache.clear(project)
+
+    assert not cache.path(project).exists()
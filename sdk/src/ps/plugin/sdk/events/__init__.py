@@ -3,6 +3,7 @@ from ._protocols import (
     PoetryActivateProtocol,
     PoetryCommandProtocol,
     PoetryErrorProtocol,
+    PoetryRegisterProtocol,
     PoetrySignalProtocol,
     PoetryTerminateProtocol,
 )
@@ -11,6 +12,7 @@ __all__ = [
     "PoetryActivateProtocol",
     "PoetryCommandProtocol",
     "PoetryErrorProtocol",
+    "PoetryRegisterProtocol",
     "PoetrySignalProtocol",
     "PoetryTerminateProtocol",
     "ensure_argument",
@@ -1,3 +1,5 @@
+from typing import Iterable, Optional
+
 from cleo.events.console_command_event import ConsoleCommandEvent
 from cleo.events.console_error_event import ConsoleErrorEvent
 from cleo.events.console_signal_event import ConsoleSignalEvent
@@ -7,6 +9,11 @@ from poetry.console.application import Application
 from typing_extensions import Protocol, runtime_checkable
 
 
+@runtime_checkable
+class PoetryRegisterProtocol(Protocol):
+    def poetry_register(self, application: Application) -> Optional[Iterable[str]]: ...
+
+
 @runtime_checkable
 class PoetryActivateProtocol(Protocol):
     def poetry_activate(self, application: Application) -> bool: ...
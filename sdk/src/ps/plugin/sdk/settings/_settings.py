@@ -9,6 +9,11 @@ class PluginSettings(BaseModel):
     enabled: Optional[bool] = Field(default=None, exclude=True)
     host_project: Optional[Path] = Field(default=None, alias="host-project")
     modules: Optional[list[str]] = Field(default=None, alias="modules")
+    discovery_cache: Optional[bool] = Field(default=None, alias="discovery-cache")
+    environment_cache: Optional[bool] = Field(default=None, alias="environment-cache")
+    venv_cache: Optional[bool] = Field(default=None, alias="venv-cache")
+    lazy_activation: Optional[bool] = Field(default=None, alias="lazy-activation")
+    parallel_activation: Optional[bool] = Field(default=None, alias="parallel-activation")
 
     model_config = ConfigDict(
         extra="allow",
@@ -78,3 +78,47 @@ line-length = 120
     settings = parse_plugin_settings_from_document(document)
 
     assert settings.enabled is True
+
+
+def test_discovery_cache_alias():
+    content = """
+[tool.ps-plugin]
+discovery-cache = false
+"""
+    document = parse(content)
+    settings = parse_plugin_settings_from_document(document)
+
+    assert settings.discovery_cache is False
+
+
+def test_parallel_activation_alias():
+    content = """
+[tool.ps-plugin]
+parallel-activation = true
+"""
+    document = parse(content)
+    settings = parse_plugin_settings_from_document(document)
+
+    assert settings.parallel_activation is True
+
+
+def test_environment_cache_alias():
+    content = """
+[tool.ps-plugin]
+environment-cache = false
+"""
+    document = parse(content)
+    settings = parse_plugin_settings_from_document(document)
+
+    assert settings.environment_cache is False
+
+
+def test_venv_cache_alias():
+    content = """
+[tool.ps-plugin]
+venv-cache = false
+"""
+    document = parse(content)
+    settings = parse_plugin_settings_from_document(document)
+
+    assert settings.venv_cache is False